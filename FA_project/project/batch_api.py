@@ -0,0 +1,358 @@
+"""
+Batch API - Submit many LLM requests as one offline bulk job
+
+Instead of sending 500+ prompts one at a time, collect every request for a
+run, submit them as a single message batch, poll until the provider has
+processed it, then read back all results at once.
+
+The submitted batch id is written to a state file before polling, so a run
+that is interrupted resumes the same batch instead of paying for it twice.
+Completed results can be written through to the ResponseCache.
+
+Supports:
+- Anthropic Message Batches API (or any server speaking its shape, e.g. the
+  local stand-in in local_llm_server.py via base_url)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchRequest:
+    """A single request within a bulk job"""
+    custom_id: str
+    prompt: str
+    temperature: Optional[float] = None
+    max_tokens: int = 1024
+    system: Optional[str] = None  # Static prefix shared across requests (prompt-cached)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single request within a bulk job"""
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    usage: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.text is not None
+
+
+@dataclass
+class BatchJob:
+    """Provider-side status of a submitted bulk job"""
+    batch_id: str
+    status: str  # "in_progress", "ended", ...
+    request_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        return self.status == "ended"
+
+
+class BatchAPIClient(ABC):
+    """Abstract base class for provider batch APIs"""
+
+    model: str = ""
+
+    def cache_model(self) -> str:
+        """Model label used in ResponseCache keys for this client's requests"""
+        return f"{type(self).__name__}/{self.model}"
+
+    @abstractmethod
+    async def submit(self, requests: List[BatchRequest]) -> BatchJob:
+        """
+        Submit all requests as one bulk job
+
+        Args:
+            requests: Requests to process
+
+        Returns:
+            Initial job status
+        """
+        pass
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> BatchJob:
+        """Get current job status"""
+        pass
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> Dict[str, BatchResult]:
+        """Fetch results of an ended job, keyed by custom_id"""
+        pass
+
+    async def run(self,
+                  requests: List[BatchRequest],
+                  poll_interval: float = 30.0,
+                  timeout: float = 24 * 3600,
+                  state_path: Optional[str] = None,
+                  cache=None) -> Dict[str, BatchResult]:
+        """
+        Submit, wait for completion and collect results
+
+        Args:
+            requests: Requests to process
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds
+            state_path: JSON file recording the submitted batch id and its
+                custom_ids before polling; a later run with the same requests
+                resumes that batch instead of submitting a new one. Removed
+                once the results are read back.
+            cache: Optional ResponseCache; cached requests are not submitted
+                and completed results are stored in it
+
+        Returns:
+            Results keyed by custom_id
+        """
+        results: Dict[str, BatchResult] = {}
+        cache_keys: Dict[str, str] = {}
+        if cache is not None:
+            claimed: List[str] = []
+            try:
+                for request in requests:
+                    key = cache.make_key(
+                        model=self.cache_model(),
+                        prompt=request.prompt,
+                        system=request.system,
+                        temperature=request.temperature,
+                        max_tokens=request.max_tokens
+                    )
+                    if key is None:
+                        continue
+                    claimed.append(key)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        results[request.custom_id] = BatchResult(request.custom_id, text=cached)
+                    else:
+                        cache_keys[request.custom_id] = key
+            except Exception:
+                # A replay miss aborts the run; hand back every occurrence it claimed so a retry gets the same keys
+                for key in claimed:
+                    cache.release(key)
+                raise
+            if results:
+                logger.info(f"✓ {len(results)}/{len(requests)} requests served from the response cache")
+            requests = [request for request in requests if request.custom_id not in results]
+        if not requests:
+            return results
+
+        try:
+            results.update(await self._run_batch(requests, poll_interval, timeout, state_path))
+        finally:
+            if cache is not None:
+                for custom_id, key in cache_keys.items():
+                    result = results.get(custom_id)
+                    if result is not None and result.succeeded:
+                        cache.put(key, result.text)
+                    else:
+                        cache.release(key)
+        return results
+
+    async def _run_batch(self,
+                         requests: List[BatchRequest],
+                         poll_interval: float,
+                         timeout: float,
+                         state_path: Optional[str]) -> Dict[str, BatchResult]:
+        """Submit (or resume) one batch, poll it until it ends and read back its results"""
+        custom_ids = [request.custom_id for request in requests]
+        job = await self._resume(state_path, custom_ids)
+        if job is None:
+            job = await self.submit(requests)
+            logger.info(f"Submitted batch {job.batch_id} ({len(requests)} requests)")
+            if state_path:
+                self._save_state(state_path, job.batch_id, custom_ids)
+
+        started = time.monotonic()
+        while not job.done:
+            if time.monotonic() - started > timeout:
+                raise TimeoutError(f"Batch {job.batch_id} not finished after {timeout:.0f}s")
+            await asyncio.sleep(poll_interval)
+            job = await self.poll(job.batch_id)
+            logger.info(f"  Batch {job.batch_id}: {job.status} {job.request_counts}")
+
+        results = await self.results(job.batch_id)
+        succeeded = sum(1 for r in results.values() if r.succeeded)
+        logger.info(f"✓ Batch {job.batch_id} complete: {succeeded}/{len(requests)} succeeded "
+                    f"in {time.monotonic() - started:.1f}s")
+        if state_path and os.path.exists(state_path):
+            os.remove(state_path)
+        return results
+
+    async def _resume(self, state_path: Optional[str], custom_ids: List[str]) -> Optional[BatchJob]:
+        """Job recorded in `state_path` for exactly these custom_ids, or None to submit afresh"""
+        if not state_path or not os.path.exists(state_path):
+            return None
+
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable batch state {state_path}: {e}")
+            return None
+
+        if sorted(state.get("custom_ids", [])) != sorted(custom_ids):
+            logger.warning(f"Batch state {state_path} is for different requests, submitting a new batch")
+            return None
+
+        try:
+            job = await self.poll(state["batch_id"])
+        except Exception as e:
+            logger.warning(f"Cannot resume batch {state.get('batch_id')}: {e}; submitting a new batch")
+            return None
+        logger.info(f"Resuming batch {job.batch_id} ({len(custom_ids)} requests): {job.status}")
+        return job
+
+    @staticmethod
+    def _save_state(state_path: str, batch_id: str, custom_ids: List[str]):
+        """Record a submitted batch so an interrupted run can resume it"""
+        state: Dict[str, Any] = {
+            "batch_id": batch_id,
+            "submitted_at": datetime.now().isoformat(),
+            "custom_ids": custom_ids
+        }
+        directory = os.path.dirname(state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, state_path)
+
+
+class AnthropicBatchClient(BatchAPIClient):
+    """
+    Anthropic Message Batches client
+
+    Requires:
+        - ANTHROPIC_API_KEY environment variable (any value for a local stand-in)
+        - anthropic library: pip install anthropic
+    """
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: str = "claude-3-5-sonnet-20241022",
+                 base_url: Optional[str] = None):
+        """
+        Initialize batch client
+
+        Args:
+            api_key: Anthropic API key (falls back to ANTHROPIC_API_KEY env var)
+            model: Claude model to use for every request
+            base_url: Override API endpoint (e.g. http://127.0.0.1:8765 for the local stand-in)
+        """
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError:
+            raise ImportError("Please install anthropic: pip install anthropic")
+
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            if base_url:
+                api_key = "local"
+            else:
+                raise ValueError(
+                    "ANTHROPIC_API_KEY not provided. Either pass api_key parameter "
+                    "or set ANTHROPIC_API_KEY environment variable"
+                )
+
+        self.client = AsyncAnthropic(api_key=api_key, base_url=base_url)
+        self.model = model
+
+    def _to_params(self, request: BatchRequest) -> Dict:
+        params = {
+            "model": self.model,
+            "max_tokens": request.max_tokens,
+            "messages": [{"role": "user", "content": request.prompt}]
+        }
+        if request.temperature is not None:
+            params["temperature"] = request.temperature
+        if request.system:
+            params["system"] = [{
+                "type": "text",
+                "text": request.system,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return params
+
+    @staticmethod
+    def _to_job(batch) -> BatchJob:
+        counts = batch.request_counts
+        return BatchJob(
+            batch_id=batch.id,
+            status=batch.processing_status,
+            request_counts={
+                "processing": counts.processing,
+                "succeeded": counts.succeeded,
+                "errored": counts.errored
+            }
+        )
+
+    async def submit(self, requests: List[BatchRequest]) -> BatchJob:
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {"custom_id": request.custom_id, "params": self._to_params(request)}
+                for request in requests
+            ]
+        )
+        return self._to_job(batch)
+
+    async def poll(self, batch_id: str) -> BatchJob:
+        batch = await self.client.messages.batches.retrieve(batch_id)
+        return self._to_job(batch)
+
+    async def results(self, batch_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        async for entry in await self.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id,
+                    text=message.content[0].text,
+                    usage={
+                        field_name: getattr(message.usage, field_name, 0) or 0
+                        for field_name in ("input_tokens", "cache_creation_input_tokens",
+                                           "cache_read_input_tokens", "output_tokens")
+                    }
+                )
+            else:
+                error = getattr(entry.result, "error", None)
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id, error=str(error) if error else entry.result.type
+                )
+        return results
+
+
+def create_batch_client(provider: str = "anthropic", **kwargs) -> BatchAPIClient:
+    """
+    Factory function to create batch API clients
+
+    Args:
+        provider: "anthropic"
+        **kwargs: Provider-specific arguments
+
+    Returns:
+        BatchAPIClient instance
+
+    Examples:
+        # Real Anthropic Message Batches API
+        client = create_batch_client("anthropic")
+
+        # Local stand-in server (python local_llm_server.py)
+        client = create_batch_client("anthropic", base_url="http://127.0.0.1:8765")
+    """
+    if provider == "anthropic":
+        return AnthropicBatchClient(**kwargs)
+    raise ValueError(f"Unknown batch provider: {provider}")
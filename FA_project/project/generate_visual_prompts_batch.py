@@ -18,7 +18,9 @@ from typing import Dict, List, Any, Optional
 import sys
 
 from music_to_image_paper_pipeline import MusicToImagePaperPipeline
-from llm_client import get_recommended_client
+from music_analyzer import AudioAnalysis
+from llm_client import CachedLLMClient, get_recommended_client, summarize_usage
+from batch_api import BatchAPIClient, BatchRequest
 
 
 # Configure logging
@@ -41,7 +43,11 @@ class BatchPromptGenerator:
         dataset_path: str,
         output_dir: str = "generated_prompts",
         use_mel_spectrogram: bool = False,
-        batch_size: int = 5
+        batch_size: int = 5,
+        cache_path: Optional[str] = None,
+        cache_mode: str = "read_write",
+        cache_sampled: bool = False,
+        multi_candidate: bool = False
     ):
         """
         Initialize batch generator.
@@ -51,12 +57,19 @@ class BatchPromptGenerator:
             output_dir: Directory to save results
             use_mel_spectrogram: Whether to use mel-spectrogram enhancement
             batch_size: Number of prompts per audio sample
+            cache_path: SQLite response cache (default: <output_dir>/llm_cache.sqlite, "" disables)
+            cache_mode: "read_write", "read_only" or "replay"
+            cache_sampled: Also cache sampled responses so a crashed run resumes
+                without regenerating them (replay mode always serves them)
+            multi_candidate: Request each mode's prompts as N candidates in one
+                LLM call (2 calls per sample) instead of one call per prompt
         """
         self.dataset_path = dataset_path
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.use_mel_spectrogram = use_mel_spectrogram
         self.batch_size = batch_size
+        self.multi_candidate = multi_candidate
 
         # Load dataset
         logger.info(f"Loading dataset from {dataset_path}")
@@ -73,9 +86,15 @@ class BatchPromptGenerator:
             use_mel_spectrogram=use_mel_spectrogram
         )
 
-        # Get LLM client
-        self.llm_client = get_recommended_client()
-        logger.info(f"Using LLM: {type(self.llm_client).__name__}")
+        # Get LLM client (responses cached on disk so reruns replay for free)
+        if cache_path is None:
+            cache_path = str(self.output_dir / "llm_cache.sqlite")
+        self.llm_client = get_recommended_client(
+            cache_path=cache_path or None, cache_mode=cache_mode, cache_sampled=cache_sampled
+        )
+        provider_client = (self.llm_client.client if isinstance(self.llm_client, CachedLLMClient)
+                           else self.llm_client)
+        logger.info(f"Using LLM: {type(provider_client).__name__}")
 
         # Results storage
         self.results = {
@@ -85,7 +104,8 @@ class BatchPromptGenerator:
                 "total_samples": len(self.data),
                 "prompts_per_sample": batch_size,
                 "mel_spectrogram": use_mel_spectrogram,
-                "llm_provider": type(self.llm_client).__name__,
+                "multi_candidate": multi_candidate,
+                "llm_provider": type(provider_client).__name__,
                 "sample_rate": 16000
             },
             "samples": []
@@ -111,52 +131,38 @@ class BatchPromptGenerator:
         try:
             logger.info(f"Processing sample {sample_idx + 1}/{len(self.data)}")
 
-            # Extract features once (same for all prompts)
-            features_result = await self.pipeline_convergent.process_audio(
-                audio, metadata, self.llm_client
+            # Analyze the audio once; every prompt below reuses it (no LLM call here)
+            analysis = self.pipeline_convergent.analyze(audio)
+            features_result = await self.pipeline_convergent.generate_from_features(
+                analysis.features, analysis.abc_notation,
+                mel_spectrogram_text=analysis.mel_spectrogram_text,
+                metadata=metadata
             )
 
-            sample_data = {
-                "sample_idx": sample_idx,
-                "metadata": metadata,
-                "musical_features": {
-                    "key": features_result["features"]["key"],
-                    "tonality": features_result["features"]["tonality"],
-                    "tempo": float(features_result["features"]["tempo"]),
-                    "time_signature": features_result["features"]["time_signature"],
-                    "mood": features_result["features"]["overall_mood"],
-                    "melody_contour": features_result["features"]["melody_contour"],
-                    "harmonic_progression": features_result["features"]["harmonic_progression"],
-                    "dynamic_intensity": features_result["features"]["dynamic_intensity"]
-                },
-                "abc_notation": features_result["abc_notation"],
-                "prompts": []
-            }
+            sample_data = self._new_sample_record(sample_idx, metadata, features_result)
 
             # Generate 3 convergent prompts (consistent, reproducible)
             logger.info(f"  Generating 3 convergent prompts...")
-            for i in range(3):
-                result = await self.pipeline_convergent.process_audio(
-                    audio, metadata, self.llm_client
-                )
+            for visual_prompt in await self._generate_prompts(
+                self.pipeline_convergent, analysis, metadata, count=3
+            ):
                 sample_data["prompts"].append({
                     "prompt_id": len(sample_data["prompts"]),
                     "mode": "convergent",
                     "temperature": 0.4,
-                    "visual_prompt": result["visual_prompt"]
+                    "visual_prompt": visual_prompt
                 })
 
             # Generate 2 divergent prompts (creative, exploratory)
             logger.info(f"  Generating 2 divergent prompts...")
-            for i in range(2):
-                result = await self.pipeline_divergent.process_audio(
-                    audio, metadata, self.llm_client
-                )
+            for visual_prompt in await self._generate_prompts(
+                self.pipeline_divergent, analysis, metadata, count=2
+            ):
                 sample_data["prompts"].append({
                     "prompt_id": len(sample_data["prompts"]),
                     "mode": "divergent",
                     "temperature": 0.8,
-                    "visual_prompt": result["visual_prompt"]
+                    "visual_prompt": visual_prompt
                 })
 
             logger.info(f"  ✓ Sample {sample_idx} complete: 5 prompts generated")
@@ -170,6 +176,206 @@ class BatchPromptGenerator:
                 "prompts": []
             }
 
+    async def _generate_prompts(
+        self,
+        pipeline: MusicToImagePaperPipeline,
+        analysis: AudioAnalysis,
+        metadata: Dict[str, Any],
+        count: int
+    ) -> List[str]:
+        """Generate `count` visual prompts with `pipeline` from a precomputed analysis."""
+        if self.multi_candidate:
+            result = await pipeline.generate_from_features(
+                analysis.features,
+                analysis.abc_notation,
+                mel_spectrogram_text=analysis.mel_spectrogram_text,
+                metadata=metadata,
+                llm_client=self.llm_client,
+                num_candidates=count
+            )
+            return result.get("visual_prompts", [result["visual_prompt"]] * count)
+
+        prompts = []
+        for _ in range(count):
+            result = await pipeline.generate_from_features(
+                analysis.features,
+                analysis.abc_notation,
+                mel_spectrogram_text=analysis.mel_spectrogram_text,
+                metadata=metadata,
+                llm_client=self.llm_client
+            )
+            prompts.append(result["visual_prompt"])
+        return prompts
+
+    def _new_sample_record(
+        self,
+        sample_idx: int,
+        metadata: Dict[str, Any],
+        features_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the per-sample record (features + empty prompt list)."""
+        return {
+            "sample_idx": sample_idx,
+            "metadata": metadata,
+            "musical_features": {
+                "key": features_result["features"]["key"],
+                "tonality": features_result["features"]["tonality"],
+                "tempo": float(features_result["features"]["tempo"]),
+                "time_signature": features_result["features"]["time_signature"],
+                "mood": features_result["features"]["overall_mood"],
+                "melody_contour": features_result["features"]["melody_contour"],
+                "harmonic_progression": features_result["features"]["harmonic_progression"],
+                "dynamic_intensity": features_result["features"]["dynamic_intensity"]
+            },
+            "abc_notation": features_result["abc_notation"],
+            "prompts": []
+        }
+
+    async def generate_all_prompts_batch(
+        self,
+        batch_client: BatchAPIClient,
+        sample_indices: Optional[List[int]] = None,
+        poll_interval: float = 30.0
+    ) -> Dict[str, Any]:
+        """
+        Generate prompts for all samples as a single offline bulk job.
+
+        Features and LLM prompts are computed locally for every sample first,
+        then all 5 requests per sample (2 with multi_candidate) are submitted
+        together through the provider batch API. Results land in the same
+        schema as generate_all_prompts().
+
+        The batch id is kept in <output_dir>/batch_state.json while the job
+        runs, so re-running after an interruption resumes it. With the
+        response cache enabled, cached requests are not resubmitted and
+        completed results are stored (sampled ones only with cache_sampled).
+
+        Args:
+            batch_client: Provider batch API client (see batch_api.py)
+            sample_indices: List of sample indices to process (None = all)
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Results dictionary with all prompts
+        """
+        if sample_indices is None:
+            sample_indices = list(range(len(self.data)))
+
+        logger.info(f"Preparing batch job for {len(sample_indices)} samples")
+
+        modes = (
+            [("convergent", self.pipeline_convergent.prompt_builder.get_temperature())] * 3 +
+            [("divergent", self.pipeline_divergent.prompt_builder.get_temperature())] * 2
+        )
+        # Multi-candidate mode: one request per (mode, count) group
+        candidate_groups = [
+            ("convergent", self.pipeline_convergent, 3),
+            ("divergent", self.pipeline_divergent, 2)
+        ]
+
+        # Step 1: Analyze every sample locally and collect its requests
+        pending = []
+        requests = []
+        for idx in sample_indices:
+            try:
+                audio = self.data[idx]["audio"]
+                metadata = self.data[idx].get("audio_meta", {})
+
+                # No LLM client: features, ABC notation and prompt only
+                analysis = self.pipeline_convergent.analyze(audio)
+                features_result = await self.pipeline_convergent.generate_from_features(
+                    analysis.features, analysis.abc_notation,
+                    mel_spectrogram_text=analysis.mel_spectrogram_text,
+                    metadata=metadata
+                )
+                sample_data = self._new_sample_record(idx, metadata, features_result)
+                pending.append((sample_data, features_result["visual_prompt"]))
+
+                if self.multi_candidate:
+                    for mode, pipeline, count in candidate_groups:
+                        requests.append(BatchRequest(
+                            custom_id=f"sample-{idx}-{mode}",
+                            prompt=pipeline.prompt_builder.build_prompt_suffix(
+                                analysis.features,
+                                analysis.abc_notation,
+                                mel_spectrogram_text=analysis.mel_spectrogram_text,
+                                use_mel_spectrogram=self.use_mel_spectrogram,
+                                num_candidates=count
+                            ),
+                            temperature=pipeline.prompt_builder.get_temperature(),
+                            max_tokens=pipeline.CANDIDATE_MAX_TOKENS * count,
+                            system=features_result["prompt_prefix"]
+                        ))
+                    continue
+
+                for prompt_id, (mode, temperature) in enumerate(modes):
+                    requests.append(BatchRequest(
+                        custom_id=f"sample-{idx}-prompt-{prompt_id}",
+                        prompt=features_result["prompt_suffix"],
+                        temperature=temperature,
+                        system=features_result["prompt_prefix"]
+                    ))
+
+            except Exception as e:
+                logger.error(f"Error preparing sample {idx}: {e}")
+                self.results["samples"].append({"sample_idx": idx, "error": str(e), "prompts": []})
+
+        if not requests:
+            return self.results
+
+        # Step 2: One bulk submission, polled until the provider is done
+        cache = self.llm_client.cache if isinstance(self.llm_client, CachedLLMClient) else None
+        batch_results = await batch_client.run(
+            requests,
+            poll_interval=poll_interval,
+            state_path=str(self.output_dir / "batch_state.json"),
+            cache=cache
+        )
+        self.results["metadata"]["batch_mode"] = True
+
+        usage_totals: Dict[str, int] = {}
+        for result in batch_results.values():
+            for field_name, count in result.usage.items():
+                usage_totals[field_name] = usage_totals.get(field_name, 0) + count
+        self.results["metadata"]["llm_usage"] = summarize_usage(usage_totals)
+
+        # Step 3: Write results back in the interactive schema
+        for sample_data, fallback_prompt in pending:
+            idx = sample_data["sample_idx"]
+            if self.multi_candidate:
+                visual_prompts = []
+                for mode, pipeline, count in candidate_groups:
+                    result = batch_results.get(f"sample-{idx}-{mode}")
+                    candidates = []
+                    if result and result.succeeded:
+                        candidates = pipeline.prompt_builder.extract_visual_prompts_from_response(
+                            result.text, count
+                        )
+                    if len(candidates) < count:
+                        logger.warning(f"  Sample {idx} {mode}: {len(candidates)}/{count} candidates, "
+                                       f"using fallback for the rest: "
+                                       f"{result.error if result else 'missing'}")
+                    visual_prompts += candidates + [fallback_prompt] * (count - len(candidates))
+            else:
+                visual_prompts = []
+                for prompt_id in range(len(modes)):
+                    result = batch_results.get(f"sample-{idx}-prompt-{prompt_id}")
+                    if result is None or not result.succeeded:
+                        logger.warning(f"  Sample {idx} prompt {prompt_id} failed, "
+                                       f"using fallback: {result.error if result else 'missing'}")
+                    visual_prompts.append(result.text if result and result.succeeded else fallback_prompt)
+
+            for prompt_id, (mode, temperature) in enumerate(modes):
+                sample_data["prompts"].append({
+                    "prompt_id": prompt_id,
+                    "mode": mode,
+                    "temperature": temperature,
+                    "visual_prompt": visual_prompts[prompt_id]
+                })
+            self.results["samples"].append(sample_data)
+
+        return self.results
+
     async def generate_all_prompts(
         self,
         sample_indices: Optional[List[int]] = None
@@ -229,6 +435,13 @@ class BatchPromptGenerator:
         else:
             filename = f"visual_prompts_complete.json"
 
+        if hasattr(self.llm_client, "get_cache_stats"):
+            self.results["metadata"]["llm_cache"] = self.llm_client.get_cache_stats()
+        if not self.results["metadata"].get("batch_mode"):
+            usage = self.llm_client.get_usage_stats()
+            if usage:
+                self.results["metadata"]["llm_usage"] = usage
+
         filepath = self.output_dir / filename
         with open(filepath, 'w') as f:
             json.dump(self.results, f, indent=2)
@@ -324,6 +537,15 @@ class BatchPromptGenerator:
         print(f"Total prompts generated: {total_prompts}")
         print(f"  - Convergent (T=0.4): {successful_samples * 3}")
         print(f"  - Divergent (T=0.8): {successful_samples * 2}")
+        if hasattr(self.llm_client, "get_cache_stats"):
+            cache_stats = self.llm_client.get_cache_stats()
+            print(f"LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                  f"({cache_stats['mode']})")
+        usage = self.results["metadata"].get("llm_usage") or self.llm_client.get_usage_stats()
+        if usage:
+            print(f"Input tokens: {usage['cached_input_tokens']} cached / "
+                  f"{usage['uncached_input_tokens']} uncached "
+                  f"({usage['cached_input_ratio']:.0%} from prompt cache)")
         print(f"\nOutput directory: {self.output_dir.absolute()}")
         print(f"Files created:")
         print(f"  - visual_prompts_complete.json (all data)")
@@ -372,6 +594,48 @@ async def main():
         default=5,
         help="Number of prompts per sample"
     )
+    parser.add_argument(
+        "--cache-path",
+        default=None,
+        help="LLM response cache file (default: <output-dir>/llm_cache.sqlite)"
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=["read_write", "read_only", "replay"],
+        default="read_write",
+        help="LLM response cache mode (replay = cached responses only, no API calls)"
+    )
+    parser.add_argument(
+        "--cache-sampled",
+        action="store_true",
+        help="Also cache sampled (temperature > 0) responses, so a crashed run can be resumed or replayed"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the LLM response cache"
+    )
+    parser.add_argument(
+        "--multi-candidate",
+        action="store_true",
+        help="Request each mode's prompts as candidates of one LLM call (2 calls per sample instead of 5)"
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit all requests as one offline bulk job (provider batch API)"
+    )
+    parser.add_argument(
+        "--batch-base-url",
+        default=None,
+        help="Batch API endpoint override (e.g. http://127.0.0.1:8765 for local_llm_server.py)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between batch status checks"
+    )
 
     args = parser.parse_args()
 
@@ -393,11 +657,22 @@ async def main():
         dataset_path=args.dataset,
         output_dir=args.output_dir,
         use_mel_spectrogram=args.mel_spectrogram,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        cache_path="" if args.no_cache else args.cache_path,
+        cache_mode=args.cache_mode,
+        cache_sampled=args.cache_sampled,
+        multi_candidate=args.multi_candidate
     )
 
     try:
-        await generator.generate_all_prompts(sample_indices)
+        if args.batch_api:
+            from batch_api import create_batch_client
+            batch_client = create_batch_client("anthropic", base_url=args.batch_base_url)
+            await generator.generate_all_prompts_batch(
+                batch_client, sample_indices, poll_interval=args.poll_interval
+            )
+        else:
+            await generator.generate_all_prompts(sample_indices)
         generator.save_results()
         generator.save_summary_stats()
         generator.export_for_image_generation()
@@ -406,6 +681,8 @@ async def main():
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        await generator.llm_client.aclose()
 
 
 if __name__ == "__main__":
@@ -7,25 +7,54 @@ Supports:
 - Other LLM providers
 """
 
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Shortest prefix Anthropic will prompt-cache, in tokens; shorter ones are billed as plain input
+MIN_CACHEABLE_TOKENS = {"haiku": 2048}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """
+    Minimum prompt prefix length Anthropic caches for a model
+
+    Args:
+        model: Model identifier, e.g. "claude-3-haiku-20240307"
+
+    Returns:
+        Token count a cache_control breakpoint needs before it takes effect
+    """
+    for family, minimum in MIN_CACHEABLE_TOKENS.items():
+        if family in model.lower():
+            return minimum
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients"""
 
     @abstractmethod
-    async def analyze(self, prompt: str) -> str:
+    async def analyze(self,
+                      prompt: str,
+                      temperature: Optional[float] = None,
+                      max_tokens: Optional[int] = None,
+                      system: Optional[str] = None) -> str:
         """
         Send a prompt to the LLM and get response
 
         Args:
             prompt: The prompt to send
+            temperature: Sampling temperature (None = client default)
+            max_tokens: Output token cap (None = client default)
+            system: Optional static instruction prefix, shared across requests
+                    so providers with prompt caching can reuse it
 
         Returns:
             Response text from the LLM
@@ -37,6 +66,14 @@ class LLMClient(ABC):
         """Get the name of the model being used"""
         pass
 
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """Get token usage counters (empty for clients that don't report usage)"""
+        return {}
+
+    async def aclose(self):
+        """Release pooled connections (no-op for clients without a pool)"""
+        pass
+
 
 class ClaudeClient(LLMClient):
     """
@@ -45,12 +82,22 @@ class ClaudeClient(LLMClient):
     Uses Anthropic's Claude API - RECOMMENDED for this project
     since you don't have OpenAI subscription
 
+    Natively async: every call shares one pooled HTTP connection pool, so
+    hundreds of concurrent generations don't each hold a thread.
+
     Requires:
         - ANTHROPIC_API_KEY environment variable
         - anthropic library: pip install anthropic
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: str = "claude-3-5-sonnet-20241022",
+                 max_in_flight: int = 32,
+                 timeout: float = 120.0,
+                 connect_timeout: float = 10.0,
+                 max_retries: int = 2,
+                 base_url: Optional[str] = None):
         """
         Initialize Claude client
 
@@ -60,9 +107,15 @@ class ClaudeClient(LLMClient):
                   - "claude-3-opus-20250219" (most capable)
                   - "claude-3-5-sonnet-20241022" (good balance, recommended)
                   - "claude-3-haiku-20240307" (faster, cheaper)
+            max_in_flight: Maximum concurrent requests (also sizes the connection pool)
+            timeout: Per-request timeout in seconds
+            connect_timeout: Connection establishment timeout in seconds
+            max_retries: SDK-level retries for transient errors
+            base_url: Override API endpoint (e.g. a local stand-in server)
         """
         try:
-            from anthropic import Anthropic
+            import httpx
+            from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
         except ImportError:
             raise ImportError("Please install anthropic: pip install anthropic")
 
@@ -73,16 +126,52 @@ class ClaudeClient(LLMClient):
                 "or set ANTHROPIC_API_KEY environment variable"
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # One shared keep-alive pool per client instance
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max_in_flight,
+                    max_keepalive_connections=max_in_flight
+                )
+            )
+        )
         self.model = model
+        self.max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._short_prefix_logged = False
+        self.usage = {
+            "requests": 0,
+            "input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "output_tokens": 0
+        }
         self.logger = logging.getLogger(__name__)
 
-    async def analyze(self, prompt: str) -> str:
+    async def analyze(self,
+                      prompt: str,
+                      temperature: Optional[float] = None,
+                      max_tokens: Optional[int] = None,
+                      system: Optional[str] = None) -> str:
         """
         Send prompt to Claude and get analysis
 
+        The system prefix is marked with a cache_control breakpoint, so after
+        the first request it is read from Anthropic's prompt cache instead of
+        being reprocessed. Prefixes shorter than the model's minimum cacheable
+        length (min_cacheable_tokens: 1024 tokens for Sonnet, 2048 for Haiku)
+        are processed in full on every request; the current prompt builders'
+        prefixes are, so caching is inert until they grow.
+
         Args:
             prompt: The prompt to analyze
+            temperature: Sampling temperature (None = API default)
+            max_tokens: Output token cap (default 1024)
+            system: Optional static instruction prefix (prompt-cached)
 
         Returns:
             Claude's response
@@ -90,22 +179,36 @@ class ClaudeClient(LLMClient):
         try:
             self.logger.info(f"Sending prompt to Claude ({self.model})...")
 
-            # Run synchronous API call in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1024,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                )
-            )
-
+            request = {
+                "model": self.model,
+                "max_tokens": max_tokens or 1024,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            }
+            if temperature is not None:
+                request["temperature"] = temperature
+            if system:
+                request["system"] = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+                minimum = min_cacheable_tokens(self.model)
+                if len(system) // 4 < minimum and not self._short_prefix_logged:
+                    self._short_prefix_logged = True
+                    self.logger.info(
+                        f"System prefix (~{len(system) // 4} tokens) is below the {minimum}-token "
+                        f"prompt-cache minimum for {self.model}; it will not be cached"
+                    )
+
+            async with self._in_flight:
+                response = await self.client.messages.create(**request)
+
+            self._record_usage(response.usage)
             result = response.content[0].text
             self.logger.info(f"✓ Received response ({len(result)} chars)")
             return result
@@ -114,10 +217,31 @@ class ClaudeClient(LLMClient):
             self.logger.error(f"Claude API error: {e}")
             raise
 
+    def _record_usage(self, usage):
+        """Accumulate token counters from a response's usage block"""
+        self.usage["requests"] += 1
+        for field in ("input_tokens", "cache_creation_input_tokens",
+                      "cache_read_input_tokens", "output_tokens"):
+            self.usage[field] += getattr(usage, field, 0) or 0
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """
+        Get token usage for this client, split into cached and uncached input
+
+        Returns:
+            Raw counters plus cached_input_tokens (served from the prompt
+            cache) and uncached_input_tokens (processed at full price)
+        """
+        return summarize_usage(self.usage)
+
     def get_model_name(self) -> str:
         """Get model name"""
         return self.model
 
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        await self.client.close()
+
 
 class OllamaClient(LLMClient):
     """
@@ -129,64 +253,150 @@ class OllamaClient(LLMClient):
         - Ollama installed: https://ollama.ai
         - Model pulled: ollama pull llama2 (or other model)
         - Ollama server running: ollama serve
+        - httpx library: pip install httpx
+
+    Non-blocking: requests stream over a persistent connection pool, and up
+    to num_parallel generations run concurrently.
     """
 
-    def __init__(self, model: str = "llama2", base_url: str = "http://localhost:11434"):
+    def __init__(self,
+                 model: str = "llama2",
+                 base_url: str = "http://localhost:11434",
+                 num_parallel: int = 4,
+                 timeout: float = 120.0,
+                 connect_timeout: float = 5.0,
+                 keep_alive: str = "5m"):
         """
         Initialize Ollama client
 
+        The connection is verified lazily on the first request, so creating
+        a client never blocks.
+
         Args:
             model: Model name (e.g., "llama2", "mistral", "neural-chat")
             base_url: Ollama server URL
+            num_parallel: Concurrent generations; match the server's OLLAMA_NUM_PARALLEL slots
+            timeout: Read timeout between streamed chunks, in seconds
+            connect_timeout: Connection establishment timeout in seconds
+            keep_alive: How long the server keeps the model loaded after a request
         """
         try:
-            import requests
+            import httpx
         except ImportError:
-            raise ImportError("Please install requests: pip install requests")
+            raise ImportError("Please install httpx: pip install httpx")
 
         self.model = model
         self.base_url = base_url
+        self.num_parallel = num_parallel
+        self.keep_alive = keep_alive
         self.logger = logging.getLogger(__name__)
 
-        # Verify connection
-        try:
-            response = requests.get(f"{base_url}/api/tags", timeout=5)
+        # Persistent keep-alive pool sized to the server's parallel slots
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=num_parallel,
+                max_keepalive_connections=num_parallel
+            )
+        )
+        self._slots = asyncio.Semaphore(num_parallel)
+        self._verified = False
+        self._verify_lock = asyncio.Lock()
+
+    async def _ensure_connected(self):
+        """Verify the server once, on first use"""
+        if self._verified:
+            return
+
+        async with self._verify_lock:
+            if self._verified:
+                return
+            try:
+                response = await self.client.get("/api/tags")
+            except Exception as e:
+                raise ConnectionError(f"Cannot connect to Ollama at {self.base_url}: {e}")
             if response.status_code != 200:
                 raise ConnectionError(f"Ollama server not responding: {response.status_code}")
-            self.logger.info(f"✓ Connected to Ollama at {base_url}")
-        except Exception as e:
-            raise ConnectionError(f"Cannot connect to Ollama at {base_url}: {e}")
+            self._verified = True
+            self.logger.info(f"✓ Connected to Ollama at {self.base_url}")
+
+    async def stream(self,
+                     prompt: str,
+                     temperature: Optional[float] = None,
+                     max_tokens: Optional[int] = None,
+                     system: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream response tokens from the Ollama model as they are generated
 
-    async def analyze(self, prompt: str) -> str:
+        Args:
+            prompt: The prompt to analyze
+            temperature: Sampling temperature (default 0.7)
+            max_tokens: Output token cap (None = model default)
+            system: Optional system prompt
+
+        Yields:
+            Text fragments in generation order
+        """
+        await self._ensure_connected()
+
+        options = {"temperature": 0.7 if temperature is None else temperature}
+        if max_tokens:
+            options["num_predict"] = max_tokens
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": options
+        }
+        if system:
+            payload["system"] = system
+
+        async with self._slots:
+            async with self.client.stream("POST", "/api/generate", json=payload) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise Exception(f"Ollama error: {response.status_code} {response.text[:200]}")
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise Exception(f"Ollama error: {chunk['error']}")
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+
+    async def analyze(self,
+                      prompt: str,
+                      temperature: Optional[float] = None,
+                      max_tokens: Optional[int] = None,
+                      system: Optional[str] = None) -> str:
         """
         Send prompt to Ollama model
 
         Args:
             prompt: The prompt to analyze
+            temperature: Sampling temperature (default 0.7)
+            max_tokens: Output token cap (None = model default)
+            system: Optional system prompt
 
         Returns:
             Model's response
         """
-        import requests
-
         try:
             self.logger.info(f"Sending prompt to Ollama ({self.model})...")
 
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "temperature": 0.7
-                },
-                timeout=120
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"Ollama error: {response.status_code}")
+            fragments = []
+            async for fragment in self.stream(prompt, temperature=temperature,
+                                              max_tokens=max_tokens, system=system):
+                fragments.append(fragment)
 
-            result = response.json().get("response", "")
+            result = "".join(fragments)
             self.logger.info(f"✓ Received response ({len(result)} chars)")
             return result
 
@@ -194,6 +404,10 @@ class OllamaClient(LLMClient):
             self.logger.error(f"Ollama error: {e}")
             raise
 
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        await self.client.aclose()
+
     def get_model_name(self) -> str:
         """Get model name"""
         return self.model
@@ -211,12 +425,19 @@ class MockLLMClient(LLMClient):
         self.model = model
         self.logger = logging.getLogger(__name__)
 
-    async def analyze(self, prompt: str) -> str:
+    async def analyze(self,
+                      prompt: str,
+                      temperature: Optional[float] = None,
+                      max_tokens: Optional[int] = None,
+                      system: Optional[str] = None) -> str:
         """
         Return mock response based on prompt content
 
         Args:
             prompt: The prompt
+            temperature: Ignored
+            max_tokens: Ignored
+            system: Ignored
 
         Returns:
             Mock response
@@ -252,12 +473,127 @@ with a sense of journey or progression. The atmosphere feels both celebratory an
         return self.model
 
 
-def create_llm_client(provider: str = "claude", **kwargs) -> LLMClient:
+class CachedLLMClient(LLMClient):
+    """
+    Wraps any LLMClient with the persistent ResponseCache
+
+    Identical requests (same model, prompt, temperature, max_tokens) are
+    served from disk, so re-running a batch after a crash costs nothing
+    for the part that already completed. Requests the cache declines to
+    key (sampled ones, unless cache_sampled) always go to the model.
+    """
+
+    def __init__(self, client: LLMClient, cache):
+        """
+        Initialize cached client
+
+        Args:
+            client: Underlying LLM client
+            cache: ResponseCache instance
+        """
+        self.client = client
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+
+    async def analyze(self,
+                      prompt: str,
+                      temperature: Optional[float] = None,
+                      max_tokens: Optional[int] = None,
+                      system: Optional[str] = None) -> str:
+        """
+        Return cached response if available, otherwise call the wrapped client
+
+        Args:
+            prompt: The prompt to analyze
+            temperature: Sampling temperature
+            max_tokens: Output token cap
+            system: Optional static instruction prefix
+
+        Returns:
+            Response text
+        """
+        key = self.cache.make_key(
+            model=f"{type(self.client).__name__}/{self.client.get_model_name()}",
+            prompt=prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        if key is None:
+            return await self.client.analyze(
+                prompt, temperature=temperature, max_tokens=max_tokens, system=system
+            )
+
+        try:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.logger.info(f"✓ Cache hit ({len(cached)} chars)")
+                return cached
+
+            result = await self.client.analyze(
+                prompt, temperature=temperature, max_tokens=max_tokens, system=system
+            )
+        except BaseException:
+            # Nothing stored: a retry of this request gets the same occurrence
+            self.cache.release(key)
+            raise
+        self.cache.put(key, result)
+        return result
+
+    def get_model_name(self) -> str:
+        """Get model name of the wrapped client"""
+        return self.client.get_model_name()
+
+    async def aclose(self):
+        """Close the wrapped client"""
+        await self.client.aclose()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters"""
+        return self.cache.get_stats()
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """Get token usage of the wrapped client (cache hits use no tokens)"""
+        return self.client.get_usage_stats()
+
+
+def summarize_usage(usage: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Add cached/uncached input totals to raw Anthropic-style usage counters
+
+    Args:
+        usage: Counters with input_tokens, cache_creation_input_tokens,
+               cache_read_input_tokens and output_tokens
+
+    Returns:
+        Copy of the counters plus cached_input_tokens, uncached_input_tokens
+        and cached_input_ratio
+    """
+    cached = usage.get("cache_read_input_tokens", 0)
+    uncached = usage.get("input_tokens", 0) + usage.get("cache_creation_input_tokens", 0)
+    total = cached + uncached
+    summary = dict(usage)
+    summary.update({
+        "cached_input_tokens": cached,
+        "uncached_input_tokens": uncached,
+        "cached_input_ratio": round(cached / total, 4) if total else 0.0
+    })
+    return summary
+
+
+def create_llm_client(provider: str = "claude",
+                      cache_path: Optional[str] = None,
+                      cache_mode: str = "read_write",
+                      cache_sampled: bool = False,
+                      **kwargs) -> LLMClient:
     """
     Factory function to create LLM clients
 
     Args:
         provider: "claude", "ollama", or "mock"
+        cache_path: Optional SQLite path; wraps the client in a persistent response cache
+        cache_mode: "read_write", "read_only" or "replay" (see ResponseCache)
+        cache_sampled: Also cache sampled (temperature > 0) responses, e.g. to resume a crashed run
         **kwargs: Provider-specific arguments
 
     Returns:
@@ -272,32 +608,56 @@ def create_llm_client(provider: str = "claude", **kwargs) -> LLMClient:
 
         # Use mock for testing
         client = create_llm_client("mock")
+
+        # Replay a previous run from its cache without any API calls
+        client = create_llm_client("claude", cache_path="llm_cache.sqlite", cache_mode="replay")
+
+        # Record sampled responses too, so a crashed run can resume from the cache
+        client = create_llm_client("claude", cache_path="llm_cache.sqlite", cache_sampled=True)
     """
     logger.info(f"Creating LLM client: {provider}")
 
     if provider == "claude":
-        return ClaudeClient(**kwargs)
+        client = ClaudeClient(**kwargs)
     elif provider == "ollama":
-        return OllamaClient(**kwargs)
+        client = OllamaClient(**kwargs)
     elif provider == "mock":
-        return MockLLMClient(**kwargs)
+        client = MockLLMClient(**kwargs)
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
 
+    if cache_path:
+        from response_cache import ResponseCache
+        client = CachedLLMClient(
+            client, ResponseCache(cache_path, mode=cache_mode, cache_sampled=cache_sampled)
+        )
+        logger.info(f"✓ Response cache enabled: {cache_path} ({cache_mode})")
+
+    return client
+
 
 # Configuration helper
-def get_recommended_client() -> LLMClient:
+def get_recommended_client(cache_path: Optional[str] = None,
+                           cache_mode: str = "read_write",
+                           cache_sampled: bool = False) -> LLMClient:
     """
     Get recommended client based on available resources
 
+    Args:
+        cache_path: Optional SQLite path for the persistent response cache
+        cache_mode: Cache mode (see ResponseCache)
+        cache_sampled: Also cache sampled responses (see ResponseCache)
+
     Returns:
         LLMClient instance (Claude if API key available, else Mock)
     """
     if os.getenv("ANTHROPIC_API_KEY"):
         logger.info("✓ Using Claude (ANTHROPIC_API_KEY found)")
-        return create_llm_client("claude")
+        return create_llm_client("claude", cache_path=cache_path, cache_mode=cache_mode,
+                                 cache_sampled=cache_sampled)
     else:
         logger.warning("⚠ ANTHROPIC_API_KEY not found, using Ollama client for testing")
         logger.info("   To use Claude: export ANTHROPIC_API_KEY=your_api_key")
         logger.info("   To use local Ollama: ollama pull mistral && ollama serve")
-        return create_llm_client("ollama")
+        return create_llm_client("ollama", cache_path=cache_path, cache_mode=cache_mode,
+                                 cache_sampled=cache_sampled)
@@ -0,0 +1,612 @@
+"""
+Local LLM Stand-in Server - Offline replacement for the Anthropic API
+
+Speaks the Messages and Message Batches API shapes, so interactive and
+batch runs (ClaudeClient, the MAS LLMProviderMCP) can be exercised and
+load-tested end to end without network access or API cost:
+
+    POST /v1/messages                         create a message (JSON or SSE stream)
+    GET  /v1/models                           model list (health checks)
+    POST /v1/messages/batches                 create a batch
+    GET  /v1/messages/batches/{id}            batch status
+    GET  /v1/messages/batches/{id}/results    JSONL results
+    GET  /stats                               request, error and concurrency counters
+
+Responses are deterministic templates derived from the request: A/B
+ranking verdicts, hypothesis/critique JSON, JSON arrays of visual prompt
+candidates, or a single visual prompt. Latency follows a configurable
+distribution with an optional slow tail, and 429/529 errors can be
+injected at a given rate.
+
+Usage:
+    python local_llm_server.py --port 8765 --latency median=0.8,sigma=0.6,tail=0.02 --rate-limit-rate 0.05
+
+    # then point a client at it
+    export ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stand-in
+    create_batch_client("anthropic", base_url="http://127.0.0.1:8765")
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from llm_client import min_cacheable_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _prompt_text(params: Dict[str, Any]) -> str:
+    """Concatenated text of all request messages"""
+    prompt = ""
+    for message in params.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        prompt += content
+    return prompt
+
+
+def _requested_count(prompt: str, default: int = 3) -> int:
+    """N from "Generate N ..." / "JSON array of N ..." (capped at 20)"""
+    match = re.search(r"(?:Generate|array of)\s+(\d+)", prompt)
+    return min(int(match.group(1)), 20) if match else default
+
+
+def _pick(options: List[str], digest: str, offset: int) -> str:
+    return options[int(digest[offset:offset + 2], 16) % len(options)]
+
+
+def _visual_prompt(digest: str) -> str:
+    palettes = ["amber and gold", "indigo and silver", "crimson and ochre", "teal and ivory"]
+    forms = ["spiraling ribbons", "layered geometric planes", "drifting mist", "radiant fractures"]
+    return (f"A luminous abstract scene of {_pick(forms, digest, 2)} rendered in {_pick(palettes, digest, 0)}, "
+            f"echoing the rhythm and contour of the music. [stand-in {digest[:8]}]")
+
+
+def _hypothesis(digest: str, index: int) -> Dict[str, Any]:
+    mechanisms = ["shared latent tempo codes", "cross-modal contrastive alignment",
+                  "linguistic mediator tokens", "disentangled timbre and mood factors"]
+    outcomes = ["improves retrieval recall", "increases human-rated coherence",
+                "reduces mode collapse", "transfers to unseen genres"]
+    offset = (index * 4) % 56
+    return {
+        "statement": (f"Conditioning generation on {_pick(mechanisms, digest, offset)} "
+                      f"{_pick(outcomes, digest, offset + 2)} [stand-in {digest[:6]}-{index}]"),
+        "rationale": "Derived from the stand-in template; structurally valid for offline runs",
+        "testability": "Ablate the mechanism and compare against the baseline on a held-out set",
+        "novelty_score": 4 + int(digest[offset:offset + 2], 16) % 6,
+        "expected_impact": "Moderate"
+    }
+
+
+def render_response(params: Dict[str, Any], variant: str = "") -> str:
+    """
+    Build a deterministic response for a messages request
+
+    The template is chosen from the prompt: pairwise A/B judgments get a
+    single letter (batched judgments a JSON object of letters), hypothesis generation/evolution a JSON array of
+    hypothesis objects, critiques and meta-reviews a JSON object, and
+    multi-candidate visual prompt requests a JSON array of strings.
+    Anything else gets a single visual prompt.
+
+    Args:
+        params: Messages API request body
+        variant: Extra discriminator (e.g. a batch custom_id) so repeated
+                 identical requests can still receive distinct answers
+
+    Returns:
+        Response text (same request → same text)
+    """
+    prompt = _prompt_text(params)
+    digest = hashlib.sha256(
+        json.dumps([prompt, params.get("temperature"), variant], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+    if "Judge these pairwise comparisons" in prompt:
+        numbers = re.findall(r"^(\d+)\. H\d+ vs H\d+", prompt, flags=re.MULTILINE)
+        return json.dumps({
+            number: "AB"[int(digest[(int(number) * 2) % 62:(int(number) * 2) % 62 + 2], 16) % 2]
+            for number in numbers
+        })
+
+    if "Hypothesis A:" in prompt and "Hypothesis B:" in prompt:
+        return "A" if int(digest[:2], 16) % 2 == 0 else "B"
+
+    if "Critically evaluate this research hypothesis" in prompt:
+        rigor, novelty, testability = (3 + int(digest[i:i + 2], 16) % 7 for i in (0, 2, 4))
+        return json.dumps({
+            "scientific_rigor": rigor,
+            "novelty": novelty,
+            "testability": testability,
+            "weaknesses": ["Evaluation protocol is underspecified"],
+            "suggestions": ["Add an ablation against a unimodal baseline"],
+            "critique": f"Stand-in critique {digest[:8]}",
+            "scores": {"overall": round((rigor + novelty + testability) / 3, 1)}
+        }, indent=2)
+
+    if "hypotheses" in prompt and "JSON array" in prompt:
+        count = _requested_count(prompt)
+        return json.dumps([_hypothesis(digest, i) for i in range(count)], indent=2)
+
+    if "structured JSON" in prompt:
+        return json.dumps({
+            "common_weaknesses": ["Small evaluation sets", "Missing baselines"],
+            "methodological_issues": ["No statistical significance testing"],
+            "systematic_improvements": ["Pre-register metrics before experiments"],
+            "quality_trend": f"stable [stand-in {digest[:8]}]"
+        }, indent=2)
+
+    if "JSON array of" in prompt and "strings" in prompt:
+        count = _requested_count(prompt)
+        return json.dumps([
+            _visual_prompt(hashlib.sha256(f"{digest}-{i}".encode("utf-8")).hexdigest())
+            for i in range(count)
+        ])
+
+    return _visual_prompt(digest)
+
+
+def _message(params: Dict[str, Any], text: str, usage: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    if usage is None:
+        prompt_chars = sum(len(json.dumps(m.get("content", ""))) for m in params.get("messages", []))
+        usage = {"input_tokens": max(1, prompt_chars // 4), "output_tokens": max(1, len(text) // 4)}
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", "stand-in"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": usage
+    }
+
+
+class LatencyProfile:
+    """
+    Simulated per-request latency
+
+    Time to first token is drawn from a distribution ("fixed", "uniform" or
+    "lognormal" around `median`); with probability `tail_probability` it is
+    multiplied by `tail_multiplier` to model slow outliers. Output is then
+    paced at `tokens_per_second` (0 = instant).
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+    def __init__(self,
+                 distribution: str = "fixed",
+                 median: float = 0.0,
+                 sigma: float = 0.5,
+                 tail_probability: float = 0.0,
+                 tail_multiplier: float = 10.0,
+                 tokens_per_second: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize latency profile
+
+        Args:
+            distribution: "fixed", "uniform" (median ± sigma·median) or "lognormal"
+            median: Median time to first token in seconds
+            sigma: Spread (relative for uniform, log-space std for lognormal)
+            tail_probability: Chance a request is a slow outlier
+            tail_multiplier: Latency multiplier for outliers
+            tokens_per_second: Output pacing after the first token (0 = instant)
+            seed: RNG seed for reproducible load tests
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.median = median
+        self.sigma = sigma
+        self.tail_probability = tail_probability
+        self.tail_multiplier = tail_multiplier
+        self.tokens_per_second = tokens_per_second
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: str, seed: Optional[int] = None) -> "LatencyProfile":
+        """
+        Build from a CLI spec such as "lognormal,median=0.8,sigma=0.6,tail=0.02,tps=80"
+
+        Args:
+            spec: Optional distribution name followed by key=value pairs
+                  (median, sigma, tail, tail_x, tps)
+            seed: RNG seed
+
+        Returns:
+            LatencyProfile
+        """
+        names = {"median": "median", "sigma": "sigma", "tail": "tail_probability",
+                 "tail_x": "tail_multiplier", "tps": "tokens_per_second"}
+        kwargs: Dict[str, Any] = {"distribution": "lognormal"}
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            if "=" not in part:
+                kwargs["distribution"] = part
+                continue
+            key, value = part.split("=", 1)
+            if key not in names:
+                raise ValueError(f"Unknown latency option: {key}")
+            kwargs[names[key]] = float(value)
+        return cls(seed=seed, **kwargs)
+
+    def first_token_delay(self) -> float:
+        """Seconds before the first token"""
+        with self._lock:
+            if self.distribution == "uniform":
+                delay = self._rng.uniform(self.median * (1 - self.sigma), self.median * (1 + self.sigma))
+            elif self.distribution == "lognormal":
+                delay = self.median * self._rng.lognormvariate(0.0, self.sigma)
+            else:
+                delay = self.median
+            if self._rng.random() < self.tail_probability:
+                delay *= self.tail_multiplier
+        return max(0.0, delay)
+
+    def generation_time(self, output_tokens: int) -> float:
+        """Seconds to emit `output_tokens` after the first token"""
+        return output_tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+
+class LocalLLMServer:
+    """In-process stand-in for the Anthropic API"""
+
+    MODELS = ["claude-sonnet-4-5-20250929", "claude-haiku-4-5-20251001", "claude-opus-4-1-20250805"]
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 8765,
+                 batch_latency: float = 1.0,
+                 latency: Optional[LatencyProfile] = None,
+                 rate_limit_rate: float = 0.0,
+                 overload_rate: float = 0.0,
+                 retry_after: float = 1.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize stand-in server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            batch_latency: Seconds before a submitted batch reports "ended"
+            latency: Latency profile for /v1/messages (default: instant)
+            rate_limit_rate: Fraction of /v1/messages requests answered with 429
+            overload_rate: Fraction of /v1/messages requests answered with 529
+            retry_after: retry-after header (seconds) sent with injected errors
+            seed: RNG seed for error injection
+        """
+        self.batch_latency = batch_latency
+        self.latency = latency or LatencyProfile()
+        self.rate_limit_rate = rate_limit_rate
+        self.overload_rate = overload_rate
+        self.retry_after = retry_after
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"requests": 0, "succeeded": 0, "rate_limited": 0, "overloaded": 0,
+                      "in_flight": 0, "max_in_flight": 0}
+        self._rng = random.Random(seed)
+        self._cached_prefixes = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalLLMServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"✓ Local LLM stand-in listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def usage_for(self, params: Dict[str, Any], text: str) -> Dict[str, int]:
+        """
+        Token usage for a request, simulating prompt caching
+
+        System blocks carrying cache_control are billed as cache writes the
+        first time they are seen and as cache reads afterwards, but only
+        once the prefix up to the breakpoint reaches the model's minimum
+        cacheable length (see llm_client.min_cacheable_tokens); shorter
+        prefixes are billed as plain input, as the API does.
+        """
+        system = params.get("system") or []
+        if isinstance(system, str):
+            system = [{"type": "text", "text": system}]
+
+        usage = {"input_tokens": 0, "cache_creation_input_tokens": 0,
+                 "cache_read_input_tokens": 0, "output_tokens": max(1, len(text) // 4)}
+        minimum = min_cacheable_tokens(params.get("model", ""))
+        prefix_tokens = 0
+        for block in system:
+            tokens = max(1, len(block.get("text", "")) // 4)
+            prefix_tokens += tokens
+            if not block.get("cache_control") or prefix_tokens < minimum:
+                usage["input_tokens"] += tokens
+                continue
+            digest = hashlib.sha256(block.get("text", "").encode("utf-8")).hexdigest()
+            with self._lock:
+                seen = digest in self._cached_prefixes
+                self._cached_prefixes.add(digest)
+            usage["cache_read_input_tokens" if seen else "cache_creation_input_tokens"] += tokens
+
+        prompt_chars = sum(len(json.dumps(m.get("content", ""))) for m in params.get("messages", []))
+        usage["input_tokens"] += max(1, prompt_chars // 4)
+        return usage
+
+    # ------------------------------------------------------------------
+    # Messages
+    # ------------------------------------------------------------------
+
+    def admit(self) -> Optional[Tuple[int, str, str]]:
+        """
+        Count an incoming request and decide whether to inject an error
+
+        Returns:
+            (status, error_type, message) for an injected error, else None
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self._rng.random()
+            if roll < self.rate_limit_rate:
+                self.stats["rate_limited"] += 1
+                return 429, "rate_limit_error", "Stand-in rate limit exceeded"
+            if roll < self.rate_limit_rate + self.overload_rate:
+                self.stats["overloaded"] += 1
+                return 529, "overloaded_error", "Stand-in overloaded"
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        return None
+
+    def release(self, succeeded: bool = True):
+        """Mark an admitted request as finished"""
+        with self._lock:
+            self.stats["in_flight"] -= 1
+            if succeeded:
+                self.stats["succeeded"] += 1
+
+    def create_message(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Complete a (non-streaming) messages request, sleeping out the simulated latency"""
+        text = render_response(params)
+        usage = self.usage_for(params, text)
+        time.sleep(self.latency.first_token_delay() + self.latency.generation_time(usage["output_tokens"]))
+        return _message(params, text, usage)
+
+    def stream_events(self, params: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Server-sent events of a streamed messages request, paced by the latency profile
+
+        Yields:
+            (event name, event data) pairs in Messages streaming order
+        """
+        text = render_response(params)
+        usage = self.usage_for(params, text)
+        message = _message(params, "", {**usage, "output_tokens": 1})
+        message["stop_reason"] = None
+
+        time.sleep(self.latency.first_token_delay())
+        yield "message_start", {"type": "message_start", "message": message}
+        yield "content_block_start", {"type": "content_block_start", "index": 0,
+                                      "content_block": {"type": "text", "text": ""}}
+        pieces = re.findall(r"\S+\s*", text) or [text]
+        per_piece = self.latency.generation_time(usage["output_tokens"]) / len(pieces)
+        for piece in pieces:
+            if per_piece:
+                time.sleep(per_piece)
+            yield "content_block_delta", {"type": "content_block_delta", "index": 0,
+                                          "delta": {"type": "text_delta", "text": piece}}
+        yield "content_block_stop", {"type": "content_block_stop", "index": 0}
+        yield "message_delta", {"type": "message_delta",
+                                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                "usage": {"output_tokens": usage["output_tokens"]}}
+        yield "message_stop", {"type": "message_stop"}
+
+    def models_page(self) -> Dict[str, Any]:
+        """GET /v1/models response"""
+        data = [{"type": "model", "id": model, "display_name": model, "created_at": _iso(0)}
+                for model in self.MODELS]
+        return {"data": data, "has_more": False, "first_id": data[0]["id"], "last_id": data[-1]["id"]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request, injected-error and concurrency counters"""
+        with self._lock:
+            return dict(self.stats)
+
+    # ------------------------------------------------------------------
+    # Message batches
+    # ------------------------------------------------------------------
+
+    def create_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        with self._lock:
+            self.batches[batch_id] = {"created": time.time(), "requests": requests}
+        return self.batch_object(batch_id)
+
+    def batch_object(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        created = batch["created"]
+        ended = time.time() - created >= self.batch_latency
+        count = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0
+            },
+            "created_at": _iso(created),
+            "expires_at": _iso(created + 86400),
+            "ended_at": _iso(created + self.batch_latency) if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+    def batch_results(self, batch_id: str) -> str:
+        lines = []
+        for request in self.batches[batch_id]["requests"]:
+            params = request.get("params", {})
+            custom_id = request.get("custom_id", "")
+            text = render_response(params, custom_id)
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "result": {"type": "succeeded", "message": _message(params, text, self.usage_for(params, text))}
+            }))
+        return "\n".join(lines) + "\n"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send(self, status: int, body: str, content_type: str = "application/json"):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _error(self, status: int, error_type: str, message: str,
+                       headers: Optional[Dict[str, str]] = None):
+                payload = json.dumps({
+                    "type": "error", "error": {"type": error_type, "message": message}
+                }).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _messages(self, params: Dict[str, Any]):
+                injected = server.admit()
+                if injected:
+                    status, error_type, message = injected
+                    self._error(status, error_type, message, {"retry-after": f"{server.retry_after:g}"})
+                    return
+
+                succeeded = False
+                try:
+                    if not params.get("stream"):
+                        self._send(200, json.dumps(server.create_message(params)))
+                    else:
+                        self.send_response(200)
+                        self.send_header("Content-Type", "text/event-stream")
+                        self.send_header("Cache-Control", "no-cache")
+                        self.end_headers()
+                        for event, data in server.stream_events(params):
+                            self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+                            self.wfile.flush()
+                    succeeded = True
+                except (BrokenPipeError, ConnectionResetError):
+                    logger.debug("Client disconnected mid-response")
+                finally:
+                    server.release(succeeded)
+
+            def _path_parts(self) -> List[str]:
+                return [p for p in self.path.split("?")[0].split("/") if p]
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if self._path_parts() == ["v1", "messages"]:
+                    self._messages(body)
+                elif self._path_parts() == ["v1", "messages", "batches"]:
+                    self._send(200, json.dumps(server.create_batch(body.get("requests", []))))
+                else:
+                    self._error(404, "not_found_error", f"Unknown endpoint: {self.path}")
+
+            def do_GET(self):
+                parts = self._path_parts()
+                if parts == ["v1", "models"]:
+                    self._send(200, json.dumps(server.models_page()))
+                elif parts == ["stats"]:
+                    self._send(200, json.dumps(server.get_stats()))
+                elif len(parts) >= 4 and parts[:3] == ["v1", "messages", "batches"]:
+                    batch_id = parts[3]
+                    if batch_id not in server.batches:
+                        self._error(404, "not_found_error", f"Unknown batch: {batch_id}")
+                    elif len(parts) == 4:
+                        self._send(200, json.dumps(server.batch_object(batch_id)))
+                    elif parts[4:] == ["results"]:
+                        if server.batch_object(batch_id)["processing_status"] != "ended":
+                            self._error(400, "invalid_request_error", "Batch still processing")
+                        else:
+                            self._send(200, server.batch_results(batch_id), "application/x-jsonl")
+                    else:
+                        self._error(404, "not_found_error", f"Unknown endpoint: {self.path}")
+                else:
+                    self._error(404, "not_found_error", f"Unknown endpoint: {self.path}")
+
+        return Handler
+
+
+def main():
+    """Run the stand-in server in the foreground"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local Anthropic API stand-in for offline runs")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--batch-latency", type=float, default=1.0,
+                        help="Seconds before a submitted batch reports ended")
+    parser.add_argument("--latency", default="fixed,median=0",
+                        help="Messages latency: [fixed|uniform|lognormal],median=S,sigma=X,"
+                             "tail=P,tail_x=M,tps=T (e.g. lognormal,median=0.8,sigma=0.6,tail=0.02,tps=80)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of messages requests answered with 429")
+    parser.add_argument("--overload-rate", type=float, default=0.0,
+                        help="Fraction of messages requests answered with 529")
+    parser.add_argument("--retry-after", type=float, default=1.0,
+                        help="retry-after seconds sent with injected errors")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for latency and errors")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = LocalLLMServer(
+        args.host, args.port,
+        batch_latency=args.batch_latency,
+        latency=LatencyProfile.parse(args.latency, seed=args.seed),
+        rate_limit_rate=args.rate_limit_rate,
+        overload_rate=args.overload_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    logger.info(f"Local LLM stand-in listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -357,7 +357,7 @@ ENERGY ENVELOPE:
 def create_mel_spectrogram_text_for_llm(
     audio_data: np.ndarray,
     config: Optional[MelSpectrogramConfig] = None,
-    use_mel_spectro gram: bool = True
+    use_mel_spectrogram: bool = True
 ) -> Tuple[str, Optional[np.ndarray]]:
     """
     Convenience function to create mel-spectrogram text representation for LLM
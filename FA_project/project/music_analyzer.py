@@ -8,7 +8,7 @@ Adapted for direct audio analysis without MIDI (using librosa)
 import numpy as np
 import librosa
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -75,6 +75,14 @@ K:{self._format_key()}{" " if self.tonality == "major" else "m"}
         return contour_map.get(self.melody_contour, 'C2 D2 E2') + ' |'
 
 
+@dataclass
+class AudioAnalysis:
+    """Everything derived from a clip's audio, computed once and reused for every prompt"""
+    features: MusicalFeatures
+    abc_notation: str
+    mel_spectrogram_text: Optional[str] = None
+
+
 class MusicAnalyzer:
     """Analyzes audio files and extracts musical features for prompt generation"""
 
@@ -18,7 +18,7 @@ import json
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from music_analyzer import MusicAnalyzer, MusicalFeatures
+from music_analyzer import MusicAnalyzer, MusicalFeatures, AudioAnalysis
 from prompt_builder_paper import PromptBuilderPaper
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,9 @@ class MusicToImagePaperPipeline:
     Audio → Features → ABC Notation → LLM Prompt → Visual Prompt
     """
 
+    # Output token budget per candidate in multi-candidate requests (150-300 word prompts)
+    CANDIDATE_MAX_TOKENS = 600
+
     def __init__(self,
                  sample_rate: int = 16000,
                  generation_mode: str = "convergent",
@@ -88,6 +91,35 @@ class MusicToImagePaperPipeline:
         self.logger.info("🎵 Music-to-Image Pipeline (Paper Implementation)")
         self.logger.info("=" * 60)
 
+        analysis = self.analyze(audio_data)
+        results = await self.generate_from_features(
+            analysis.features,
+            analysis.abc_notation,
+            mel_spectrogram_text=analysis.mel_spectrogram_text,
+            metadata=metadata,
+            llm_client=llm_client
+        )
+
+        self.logger.info("\n" + "=" * 60)
+        self.logger.info("✅ Pipeline complete - Ready for image generation")
+        self.logger.info("=" * 60)
+
+        return results
+
+    def analyze(self, audio_data: np.ndarray) -> AudioAnalysis:
+        """
+        Run the audio-dependent steps: features, ABC notation and optional mel-spectrogram
+
+        This is the expensive part of the pipeline (librosa tempo, beat, chroma,
+        MFCC and RMS extraction). Run it once per clip and pass the result to
+        generate_from_features() for every prompt generated from that clip.
+
+        Args:
+            audio_data: Audio waveform
+
+        Returns:
+            AudioAnalysis for the clip
+        """
         # Step 1: Feature extraction
         self.logger.info("\n1️⃣  Extracting musical features...")
         features = self.music_analyzer.analyze_audio(audio_data)
@@ -106,20 +138,50 @@ class MusicToImagePaperPipeline:
             mel_spec = self.mel_converter.audio_to_mel_spectrogram(audio_data)
             mel_spectrogram_text = self.mel_converter.mel_spectrogram_to_text_representation(mel_spec)
             self.logger.info(f"   ✓ Mel-spectrogram: {mel_spec.shape[0]}×{mel_spec.shape[1]}")
-            step_offset = 1
-        else:
-            step_offset = 0
 
-        # Step 4: Build prompt for LLM
+        return AudioAnalysis(features, abc_notation, mel_spectrogram_text)
+
+    async def generate_from_features(self,
+                                     features: MusicalFeatures,
+                                     abc_notation: str,
+                                     mel_spectrogram_text: Optional[str] = None,
+                                     metadata: Dict[str, Any] = None,
+                                     llm_client=None,
+                                     num_candidates: int = 1) -> Dict[str, Any]:
+        """
+        Prompt-only path: build the LLM prompt from precomputed analysis and query the LLM
+
+        With num_candidates > 1, all candidates are requested in a single LLM
+        call (one shared input prompt) and returned under "visual_prompts";
+        "visual_prompt" is always the first one.
+
+        Args:
+            features: Musical features (see analyze())
+            abc_notation: ABC notation for the features
+            mel_spectrogram_text: Mel-spectrogram text representation, if enabled
+            metadata: Audio metadata
+            llm_client: LLM client for prompt generation
+            num_candidates: Number of distinct visual prompts to generate
+
+        Returns:
+            Results with visual prompt ready for image generation
+        """
+        # Step 3/4: Build prompt for LLM (numbered after the optional mel-spectrogram step)
+        step_offset = 1 if mel_spectrogram_text else 0
         step_num = 3 + step_offset
         self.logger.info(f"\n{step_num}️⃣  Building LLM prompt...")
-        gpt_prompt = self.prompt_builder.build_gpt_prompt(
+        # Static prefix is sent as a prompt-cached system prompt; only the suffix varies
+        prompt_prefix = self.prompt_builder.build_prompt_prefix()
+        prompt_suffix = self.prompt_builder.build_prompt_suffix(
             features,
             abc_notation,
             mel_spectrogram_text=mel_spectrogram_text,
-            use_mel_spectrogram=self.use_mel_spectrogram
+            use_mel_spectrogram=self.use_mel_spectrogram,
+            num_candidates=num_candidates
         )
-        self.logger.info(f"   ✓ Prompt prepared ({len(gpt_prompt)} chars)")
+        gpt_prompt = prompt_prefix + "\n\n" + prompt_suffix
+        self.logger.info(f"   ✓ Prompt prepared ({len(gpt_prompt)} chars, "
+                         f"{len(prompt_suffix)} sample-specific)")
 
         # Prepare results
         results = {
@@ -136,33 +198,85 @@ class MusicToImagePaperPipeline:
             },
             "abc_notation": abc_notation,
             "gpt_prompt": gpt_prompt,
+            "prompt_prefix": prompt_prefix,
+            "prompt_suffix": prompt_suffix,
             "temperature": self.prompt_builder.get_temperature(),
             "generation_mode": self.generation_mode
         }
 
-        # Step 5: LLM analysis if client provided
+        # Step 4/5: LLM analysis if client provided
         if llm_client:
             step_num = 4 + step_offset
             self.logger.info(f"\n{step_num}️⃣  Sending to LLM for visual prompt generation...")
 
             try:
-                visual_prompt = await llm_client.analyze(gpt_prompt)
-                results["visual_prompt"] = visual_prompt
+                if num_candidates > 1:
+                    visual_prompts = await self._generate_candidates(
+                        llm_client, prompt_prefix, prompt_suffix, features, abc_notation,
+                        mel_spectrogram_text, num_candidates
+                    )
+                else:
+                    visual_prompts = [await llm_client.analyze(
+                        prompt_suffix,
+                        temperature=self.prompt_builder.get_temperature(),
+                        system=prompt_prefix
+                    )]
                 self.logger.info("   ✓ LLM analysis complete")
 
             except Exception as e:
                 self.logger.error(f"   ✗ LLM analysis failed: {e}")
-                results["visual_prompt"] = self._create_fallback_prompt(features)
+                visual_prompts = [self._create_fallback_prompt(features)] * num_candidates
         else:
             self.logger.info(f"\n{4 + step_offset}️⃣  No LLM client provided")
-            results["visual_prompt"] = self._create_fallback_prompt(features)
+            visual_prompts = [self._create_fallback_prompt(features)] * num_candidates
 
-        self.logger.info("\n" + "=" * 60)
-        self.logger.info("✅ Pipeline complete - Ready for image generation")
-        self.logger.info("=" * 60)
+        results["visual_prompt"] = visual_prompts[0]
+        if num_candidates > 1:
+            results["visual_prompts"] = visual_prompts
 
         return results
 
+    async def _generate_candidates(self,
+                                   llm_client,
+                                   prompt_prefix: str,
+                                   prompt_suffix: str,
+                                   features: MusicalFeatures,
+                                   abc_notation: str,
+                                   mel_spectrogram_text: Optional[str],
+                                   num_candidates: int) -> List[str]:
+        """
+        Request num_candidates prompts in one call, topping up with single calls
+        if the response held fewer than requested
+
+        Returns:
+            Exactly num_candidates visual prompts
+        """
+        temperature = self.prompt_builder.get_temperature()
+        response = await llm_client.analyze(
+            prompt_suffix,
+            temperature=temperature,
+            max_tokens=self.CANDIDATE_MAX_TOKENS * num_candidates,
+            system=prompt_prefix
+        )
+        candidates = self.prompt_builder.extract_visual_prompts_from_response(response, num_candidates)
+        self.logger.info(f"   ✓ {len(candidates)}/{num_candidates} candidates in one response")
+
+        if len(candidates) < num_candidates:
+            self.logger.warning(f"   Topping up {num_candidates - len(candidates)} candidates with single calls")
+            single_suffix = self.prompt_builder.build_prompt_suffix(
+                features,
+                abc_notation,
+                mel_spectrogram_text=mel_spectrogram_text,
+                use_mel_spectrogram=self.use_mel_spectrogram
+            )
+            while len(candidates) < num_candidates:
+                candidates.append(await llm_client.analyze(
+                    single_suffix,
+                    temperature=temperature,
+                    system=prompt_prefix
+                ))
+        return candidates
+
     def _create_fallback_prompt(self, features: MusicalFeatures) -> str:
         """Create fallback visual prompt from features only"""
         # Map features to visual concepts (paper's approach)
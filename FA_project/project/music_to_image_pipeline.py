@@ -10,7 +10,7 @@ import logging
 import json
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-from music_analyzer import MusicAnalyzer, MusicalFeatures
+from music_analyzer import MusicAnalyzer, MusicalFeatures, AudioAnalysis
 from prompt_builder import PromptBuilder
 from mel_spectrogram_converter import MelSpectrogramConverter, MelSpectrogramConfig
 
@@ -91,6 +91,34 @@ class MusicToImagePipeline:
         self.logger.info("🎵 Starting Music-to-Image Pipeline")
         self.logger.info("=" * 60)
 
+        analysis = self.analyze(audio_data, metadata)
+        results = await self.generate_from_features(
+            analysis.features,
+            analysis.abc_notation,
+            mel_spectrogram_text=analysis.mel_spectrogram_text,
+            metadata=metadata,
+            llm_client=llm_client
+        )
+
+        self.logger.info("\n" + "=" * 60)
+        self.logger.info("✅ Pipeline completed successfully")
+        self.logger.info("=" * 60)
+
+        return results
+
+    def analyze(self, audio_data: np.ndarray, metadata: Dict[str, Any] = None) -> AudioAnalysis:
+        """
+        Run the audio-dependent steps once: mel-spectrogram, features and ABC notation
+
+        Args:
+            audio_data: Audio waveform as numpy array (or mel-spectrogram if already converted)
+            metadata: Optional metadata (may carry "audio_waveform" for mel-spectrogram input)
+
+        Returns:
+            AudioAnalysis to pass to generate_from_features()
+        """
+        metadata = metadata or {}
+
         # Determine input type and convert if necessary
         mel_spectrogram_text = None
         audio_for_analysis = audio_data
@@ -125,15 +153,39 @@ class MusicToImagePipeline:
         abc_notation = features.to_abc_notation()
         self.logger.info(f"   ✓ ABC notation generated ({len(abc_notation)} chars)")
 
+        return AudioAnalysis(features, abc_notation, mel_spectrogram_text)
+
+    async def generate_from_features(self,
+                                     features: MusicalFeatures,
+                                     abc_notation: str,
+                                     mel_spectrogram_text: Optional[str] = None,
+                                     metadata: Dict[str, Any] = None,
+                                     llm_client=None) -> Dict[str, Any]:
+        """
+        Prompt-only path: build prompts from precomputed analysis and query the LLM
+
+        Args:
+            features: Musical features (see analyze())
+            abc_notation: ABC notation for the features
+            mel_spectrogram_text: Mel-spectrogram text representation, if enabled
+            metadata: Optional metadata about the audio
+            llm_client: LLM client for prompt analysis
+
+        Returns:
+            Dictionary with analysis results and generated prompts
+        """
         # Step 3: Build GPT prompt (with optional mel-spectrogram)
         self.logger.info("\n3️⃣  Building GPT analysis prompt...")
-        gpt_prompt = self.prompt_builder.build_gpt_prompt(
+        # Static prefix is sent as a prompt-cached system prompt; only the suffix varies
+        prompt_prefix = self.prompt_builder.build_prompt_prefix()
+        prompt_suffix = self.prompt_builder.build_prompt_suffix(
             features,
             abc_notation,
             style_guidance=metadata.get("style_guidance") if metadata else None,
             mel_spectrogram_text=mel_spectrogram_text,
             use_mel_spectrogram=self.use_mel_spectrogram
         )
+        gpt_prompt = prompt_prefix + "\n\n" + prompt_suffix
         self.logger.info(f"   ✓ Prompt built ({len(gpt_prompt)} chars)")
 
         # Step 4: Get LLM analysis
@@ -150,7 +202,9 @@ class MusicToImagePipeline:
                 "overall_mood": features.overall_mood,
             },
             "abc_notation": abc_notation,
-            "gpt_prompt": gpt_prompt
+            "gpt_prompt": gpt_prompt,
+            "prompt_prefix": prompt_prefix,
+            "prompt_suffix": prompt_suffix
         }
 
         # Include mel-spectrogram info if processed
@@ -163,7 +217,11 @@ class MusicToImagePipeline:
         if llm_client:
             self.logger.info("\n4️⃣  Sending to LLM for visual prompt generation...")
             try:
-                gpt_response = await llm_client.analyze(gpt_prompt)
+                gpt_response = await llm_client.analyze(
+                    prompt_suffix,
+                    temperature=self.prompt_builder.get_temperature(),
+                    system=prompt_prefix
+                )
                 visual_elements = self.prompt_builder.extract_visual_elements_from_gpt_response(gpt_response)
                 results["visual_analysis"] = visual_elements
                 self.logger.info("   ✓ LLM analysis completed")
@@ -206,10 +264,6 @@ class MusicToImagePipeline:
                     use_consensus=False
                 )
 
-        self.logger.info("\n" + "=" * 60)
-        self.logger.info("✅ Pipeline completed successfully")
-        self.logger.info("=" * 60)
-
         return results
 
     async def _get_designer_variations(self,
@@ -31,6 +31,9 @@ class PromptBuilder:
         """
         Build a comprehensive prompt for GPT-4 to analyze music and generate visual descriptors
 
+        The full prompt is the static prefix (build_prompt_prefix) followed by
+        the per-sample suffix (build_prompt_suffix).
+
         Args:
             features: MusicalFeatures object from music analyzer
             abc_notation: ABC notation representation of the music
@@ -41,41 +44,26 @@ class PromptBuilder:
         Returns:
             A well-structured prompt for GPT-4
         """
+        return self.build_prompt_prefix() + "\n\n" + self.build_prompt_suffix(
+            features, abc_notation, style_guidance, mel_spectrogram_text, use_mel_spectrogram
+        )
 
-        # Build input section based on whether mel-spectrogram is included
-        input_section = ""
-        if use_mel_spectrogram and mel_spectrogram_text:
-            input_section = f"""MEL-SPECTROGRAM ANALYSIS:
----
-{mel_spectrogram_text}
----
-
-ADDITIONALLY, HERE IS THE ABC NOTATION REPRESENTATION:
----
-{abc_notation}
----"""
-        else:
-            input_section = f"""ABC NOTATION ANALYSIS:
----
-{abc_notation}
----"""
-
-        prompt = f"""You are an expert music-to-visual translator who understands the deep connections between musical and visual elements.
-
-Analyze the following music representation and create a detailed visual prompt for image generation.
+    def build_prompt_prefix(self) -> str:
+        """
+        Build the static instructions shared by every request
 
-{input_section}
+        Independent of the sample and generation mode, so it can be sent as a
+        prompt-cached system prompt and processed once per run. At roughly
+        400-500 tokens it is below the minimum cacheable length
+        (llm_client.min_cacheable_tokens), so caching stays inert until it
+        grows past that.
 
-EXTRACTED MUSICAL FEATURES:
-- Key Signature: {features.key_signature} {features.tonality}
-- Tempo: {features.tempo:.0f} BPM
-- Time Signature: {features.time_signature}
-- Melody Contour: {features.melody_contour}
-- Harmonic Progression: {features.harmonic_progression}
-- Dynamic Intensity: {features.dynamic_intensity}
-- Overall Mood: {features.overall_mood}
+        Returns:
+            Static instruction text
+        """
+        return """You are an expert music-to-visual translator who understands the deep connections between musical and visual elements.
 
-{"STYLE GUIDANCE:" + chr(10) + style_guidance if style_guidance else ""}
+You will be given a music representation (ABC notation, optionally with a mel-spectrogram analysis) and its extracted musical features. Analyze them and create a detailed visual prompt for image generation.
 
 YOUR TASK:
 1. Analyze the musical characteristics and their emotional implications
@@ -104,7 +92,51 @@ Mood & Atmosphere:
 [The emotional and atmospheric quality of the envisioned image]
 """
 
-        return prompt
+    def build_prompt_suffix(self, features: MusicalFeatures, abc_notation: str, style_guidance: str = None, mel_spectrogram_text: str = None, use_mel_spectrogram: bool = False) -> str:
+        """
+        Build the per-sample part of the prompt (music representation and features)
+
+        Args:
+            features: MusicalFeatures object from music analyzer
+            abc_notation: ABC notation representation of the music
+            style_guidance: Optional specific style guidance
+            mel_spectrogram_text: Optional mel-spectrogram text representation
+            use_mel_spectrogram: Whether to include mel-spectrogram in analysis
+
+        Returns:
+            Sample-specific prompt text
+        """
+
+        # Build input section based on whether mel-spectrogram is included
+        input_section = ""
+        if use_mel_spectrogram and mel_spectrogram_text:
+            input_section = f"""MEL-SPECTROGRAM ANALYSIS:
+---
+{mel_spectrogram_text}
+---
+
+ADDITIONALLY, HERE IS THE ABC NOTATION REPRESENTATION:
+---
+{abc_notation}
+---"""
+        else:
+            input_section = f"""ABC NOTATION ANALYSIS:
+---
+{abc_notation}
+---"""
+
+        return f"""{input_section}
+
+EXTRACTED MUSICAL FEATURES:
+- Key Signature: {features.key_signature} {features.tonality}
+- Tempo: {features.tempo:.0f} BPM
+- Time Signature: {features.time_signature}
+- Melody Contour: {features.melody_contour}
+- Harmonic Progression: {features.harmonic_progression}
+- Dynamic Intensity: {features.dynamic_intensity}
+- Overall Mood: {features.overall_mood}
+
+{"STYLE GUIDANCE:" + chr(10) + style_guidance if style_guidance else ""}""".rstrip()
 
     def build_design_agent_prompt(self, features: MusicalFeatures, designer_role: str) -> str:
         """
@@ -5,8 +5,10 @@ Strictly follows "Exploring Real-Time Music-to-Image Systems" (Yang et al., 2407
 Implementation focused on replicating paper's framework without multi-agent extensions.
 """
 
+import re
+import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from music_analyzer import MusicalFeatures
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,9 @@ class PromptBuilderPaper:
         3. Sends to GPT-4 with task to map music features to visual concepts
         4. GPT-4 generates visual prompt for SDXL
 
+        The full prompt is the static prefix (build_prompt_prefix) followed by
+        the per-sample suffix (build_prompt_suffix).
+
         Args:
             features: MusicalFeatures object
             abc_notation: ABC notation representation
@@ -51,40 +56,29 @@ class PromptBuilderPaper:
         Returns:
             Prompt for LLM analysis
         """
+        return self.build_prompt_prefix() + "\n\n" + self.build_prompt_suffix(
+            features,
+            abc_notation,
+            style_guidance=style_guidance,
+            mel_spectrogram_text=mel_spectrogram_text,
+            use_mel_spectrogram=use_mel_spectrogram
+        )
+
+    def build_prompt_prefix(self) -> str:
+        """
+        Build the static instruction preamble shared by every request.
 
-        # Build input section with optional mel-spectrogram
-        input_section = ""
-        if use_mel_spectrogram and mel_spectrogram_text:
-            input_section = f"""MEL-SPECTROGRAM ANALYSIS:
----
-{mel_spectrogram_text}
----
-
-ADDITIONALLY, HERE IS THE ABC NOTATION REPRESENTATION:
----
-{abc_notation}
----"""
-        else:
-            input_section = f"""ABC NOTATION ANALYSIS:
----
-{abc_notation}
----"""
+        It does not depend on the sample or the generation mode, so it can be
+        sent as a prompt-cached system prompt and processed once per run.
+        Note that the preamble is only about 450 tokens, which is under the
+        API's cache minimum (llm_client.min_cacheable_tokens), so it is not
+        actually cached yet.
 
+        Returns:
+            Static instruction text
+        """
         # Paper's prompt structure: music features → visual mapping
-        prompt = f"""You are an expert music-to-visual translator. Your task is to analyze the provided music representation and generate a detailed visual prompt for image generation (SDXL).
-
-{input_section}
-
-EXTRACTED MUSICAL FEATURES:
-- Key Signature: {features.key_signature} {features.tonality}
-- Tempo: {features.tempo:.0f} BPM
-- Time Signature: {features.time_signature}
-- Melody Contour: {features.melody_contour}
-- Harmonic Progression: {features.harmonic_progression}
-- Dynamic Intensity: {features.dynamic_intensity}
-- Overall Mood: {features.overall_mood}
-
-{("STYLE GUIDANCE:" + chr(10) + style_guidance) if style_guidance else ""}
+        return """You are an expert music-to-visual translator. Your task is to analyze the provided music representation and generate a detailed visual prompt for image generation (SDXL).
 
 MAPPING MUSIC TO VISUAL ELEMENTS:
 1. Tempo maps to visual motion and pacing:
@@ -119,7 +113,81 @@ Generate a detailed, vivid image prompt suitable for SDXL image generation. The
 
 Output ONLY the visual prompt text, nothing else."""
 
-        return prompt
+    def build_prompt_suffix(self,
+                            features: MusicalFeatures,
+                            abc_notation: str,
+                            style_guidance: str = None,
+                            mel_spectrogram_text: str = None,
+                            use_mel_spectrogram: bool = False,
+                            num_candidates: int = 1) -> str:
+        """
+        Build the per-sample part of the prompt (music representation and features).
+
+        Args:
+            features: MusicalFeatures object
+            abc_notation: ABC notation representation
+            style_guidance: Optional style guidance
+            mel_spectrogram_text: Optional mel-spectrogram analysis
+            use_mel_spectrogram: Whether to include mel-spectrogram
+            num_candidates: Number of distinct visual prompts to request in one
+                response (>1 asks for a JSON array, see extract_visual_prompts_from_response)
+
+        Returns:
+            Sample-specific prompt text
+        """
+
+        # Build input section with optional mel-spectrogram
+        input_section = ""
+        if use_mel_spectrogram and mel_spectrogram_text:
+            input_section = f"""MEL-SPECTROGRAM ANALYSIS:
+---
+{mel_spectrogram_text}
+---
+
+ADDITIONALLY, HERE IS THE ABC NOTATION REPRESENTATION:
+---
+{abc_notation}
+---"""
+        else:
+            input_section = f"""ABC NOTATION ANALYSIS:
+---
+{abc_notation}
+---"""
+
+        suffix = f"""{input_section}
+
+EXTRACTED MUSICAL FEATURES:
+- Key Signature: {features.key_signature} {features.tonality}
+- Tempo: {features.tempo:.0f} BPM
+- Time Signature: {features.time_signature}
+- Melody Contour: {features.melody_contour}
+- Harmonic Progression: {features.harmonic_progression}
+- Dynamic Intensity: {features.dynamic_intensity}
+- Overall Mood: {features.overall_mood}
+
+{("STYLE GUIDANCE:" + chr(10) + style_guidance) if style_guidance else ""}""".rstrip()
+
+        if num_candidates > 1:
+            suffix += "\n\n" + self.build_candidates_instruction(num_candidates)
+        return suffix
+
+    def build_candidates_instruction(self, num_candidates: int) -> str:
+        """
+        Build the instruction asking for several distinct prompts in one response.
+
+        It is appended to the per-sample suffix so the cached prefix stays
+        identical between single- and multi-candidate requests.
+
+        Args:
+            num_candidates: Number of visual prompts to request
+
+        Returns:
+            Output-format instruction text
+        """
+        return f"""OUTPUT FORMAT (overrides the instruction above):
+Generate {num_candidates} DISTINCT visual prompts for this music. Each must follow the task above on its own,
+and they should differ from one another in composition, subject or perspective while staying faithful to the music.
+Output ONLY a JSON array of {num_candidates} strings, one visual prompt per string, nothing else."""
 
     def extract_visual_prompt_from_response(self, response: str) -> str:
         """
@@ -136,6 +204,40 @@ Output ONLY the visual prompt text, nothing else."""
         # The response IS the prompt (paper's simple approach)
         return response.strip()
 
+    def extract_visual_prompts_from_response(self, response: str, num_candidates: int) -> List[str]:
+        """
+        Extract the candidate prompts from a multi-candidate LLM response.
+
+        Expects a JSON array of strings (optionally inside a code fence). If the
+        model ignored the format, falls back to numbered items and then to the
+        whole response as a single prompt.
+
+        Args:
+            response: LLM response text
+            num_candidates: Number of prompts requested
+
+        Returns:
+            Up to num_candidates cleaned visual prompts (may be fewer)
+        """
+        start, end = response.find("["), response.rfind("]")
+        if start != -1 and end > start:
+            try:
+                parsed = json.loads(response[start:end + 1])
+                candidates = [item.strip() for item in parsed if isinstance(item, str) and item.strip()]
+                if candidates:
+                    return candidates[:num_candidates]
+            except json.JSONDecodeError:
+                self.logger.warning("Multi-candidate response is not valid JSON, trying numbered items")
+
+        # "1. ...", "2) ...", "Prompt 3: ..." at the start of a line
+        items = re.split(r"(?m)^\s*(?:prompt\s*)?\d+[.):]\s+", response, flags=re.IGNORECASE)
+        # items[0] is whatever preceded the first numbered item
+        candidates = [item.strip() for item in items[1:] if item.strip()]
+        if candidates:
+            return candidates[:num_candidates]
+
+        return [self.extract_visual_prompt_from_response(response)] if response.strip() else []
+
     def get_temperature(self) -> float:
         """Get the temperature setting for the generation mode"""
         return self.temperature
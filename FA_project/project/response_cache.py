@@ -0,0 +1,220 @@
+"""
+Response Cache - Persistent, content-addressed cache for LLM responses
+
+Re-running batch prompt generation after a crash (or on the same corpus)
+replays identical requests from disk instead of paying for them again.
+
+Backed by a single SQLite file with size-based LRU eviction.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("read_write", "read_only", "replay")
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a request was never cached"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache
+
+    Modes:
+        - "read_write": serve hits and store new responses (default)
+        - "read_only": serve hits, never write
+        - "replay": serve hits, never write, raise CacheMissError on a miss
+
+    Sampled requests are only cached with cache_sampled=True (or in replay
+    mode); by default each sampled call goes to the model.
+    """
+
+    def __init__(self,
+                 path: str = "llm_cache.sqlite",
+                 max_size_mb: float = 256,
+                 mode: str = "read_write",
+                 cache_sampled: bool = False):
+        """
+        Initialize response cache
+
+        Args:
+            path: SQLite file location
+            max_size_mb: Size budget; least recently used entries are evicted beyond it
+            mode: "read_write", "read_only" or "replay"
+            cache_sampled: Also cache requests at temperature > 0 without a seed
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+
+        self.path = path
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.mode = mode
+        self.cache_sampled = cache_sampled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._occurrences: Dict[str, int] = {}
+        self._released: Dict[str, List[int]] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT, size INTEGER, last_access REAL)"
+        )
+        self.conn.commit()
+
+    def make_key(self,
+                 model: str,
+                 prompt: str,
+                 system: Optional[str] = None,
+                 temperature: Optional[float] = None,
+                 max_tokens: Optional[int] = None,
+                 seed: Optional[Any] = None) -> Optional[str]:
+        """
+        Build the cache key for a request
+
+        Requests at temperature 0 (or with an explicit seed) are deterministic
+        and share a single entry. Sampled requests are only cached with
+        cache_sampled (or in replay mode) and are then keyed by occurrence, so
+        the 3 identical convergent calls for a sample replay 3 distinct answers.
+        A call that fails must hand its key back with release().
+
+        Args:
+            model: Model identifier
+            prompt: User prompt
+            system: Optional system prompt
+            temperature: Sampling temperature (None = provider default, treated as sampled)
+            max_tokens: Output token cap
+            seed: Optional explicit seed
+
+        Returns:
+            Hex digest key, or None if the request should not be cached
+        """
+        payload = json.dumps({
+            "model": model,
+            "system": system or "",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "seed": seed
+        }, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+        # Same rule as mcps/llm_cache.py entry_key() in the agent system; keep them in step
+        if seed is not None or temperature == 0:
+            return digest
+        if not (self.cache_sampled or self.mode == "replay"):
+            return None
+
+        released = self._released.get(digest)
+        if released:
+            occurrence = heapq.heappop(released)
+        else:
+            occurrence = self._occurrences.get(digest, 0)
+            self._occurrences[digest] = occurrence + 1
+        return f"{digest}:{occurrence}"
+
+    def release(self, key: str):
+        """
+        Hand back the occurrence of a call that stored no response
+
+        Args:
+            key: Key from make_key(); its retry will get the same key
+        """
+        digest, separator, occurrence = key.rpartition(":")
+        if separator:
+            heapq.heappush(self._released.setdefault(digest, []), int(occurrence))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        row = self.conn.execute(
+            "SELECT response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            if self.mode == "replay":
+                raise CacheMissError(f"Request {key[:12]} not found in replay cache {self.path}")
+            return None
+
+        self.hits += 1
+        if self.mode == "read_write":
+            self.conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self.conn.commit()
+        return row[0]
+
+    def put(self, key: str, response: str):
+        """
+        Store a response (ignored unless mode is "read_write")
+
+        Args:
+            key: Key from make_key()
+            response: Response text
+        """
+        if self.mode != "read_write":
+            return
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, size, last_access) VALUES (?, ?, ?, ?)",
+            (key, response, len(response.encode("utf-8")), time.time())
+        )
+        self.conn.commit()
+        self._evict_if_needed()
+
+    def _evict_if_needed(self):
+        """Evict least recently used entries until under the size budget"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        stale = []
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_size_bytes:
+                break
+            stale.append((key,))
+            total -= size
+
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+        self.conn.commit()
+        self.evictions += len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and cache footprint"""
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size
+        }
@@ -0,0 +1,110 @@
+"""
+Tests for batch submission, resume and response-cache write-through (batch_api.py)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from batch_api import BatchAPIClient, BatchJob, BatchRequest, BatchResult
+from response_cache import CacheMissError, ResponseCache
+
+
+class FakeBatchClient(BatchAPIClient):
+    """In-memory batch API; batches end on the first poll and echo their prompts"""
+
+    model = "fake-model"
+
+    def __init__(self, fail_results: bool = False):
+        self.batches = {}
+        self.submitted = []
+        self.fail_results = fail_results
+
+    async def submit(self, requests):
+        batch_id = f"batch-{len(self.batches)}"
+        self.batches[batch_id] = requests
+        self.submitted.append([request.custom_id for request in requests])
+        return BatchJob(batch_id, "in_progress")
+
+    async def poll(self, batch_id):
+        if batch_id not in self.batches:
+            raise KeyError(batch_id)
+        return BatchJob(batch_id, "ended")
+
+    async def results(self, batch_id):
+        if self.fail_results:
+            raise ConnectionError("connection dropped")
+        return {
+            request.custom_id: BatchResult(request.custom_id, text=f"answer to {request.prompt}")
+            for request in self.batches[batch_id]
+        }
+
+
+def make_requests(temperature=0):
+    return [BatchRequest(custom_id=f"sample-{idx}-prompt-0", prompt=f"p{idx}", temperature=temperature)
+            for idx in range(3)]
+
+
+def test_state_file_lets_an_interrupted_run_resume_its_batch(tmp_path):
+    state_path = tmp_path / "batch_state.json"
+    client = FakeBatchClient(fail_results=True)
+    with pytest.raises(ConnectionError):
+        asyncio.run(client.run(make_requests(), poll_interval=0, state_path=str(state_path)))
+
+    state = json.loads(state_path.read_text())
+    assert state["batch_id"] == "batch-0"
+    assert state["custom_ids"] == [request.custom_id for request in make_requests()]
+
+    client.fail_results = False
+    results = asyncio.run(client.run(make_requests(), poll_interval=0, state_path=str(state_path)))
+    assert len(client.submitted) == 1
+    assert results["sample-1-prompt-0"].text == "answer to p1"
+    assert not state_path.exists()
+
+
+def test_state_for_other_requests_is_not_resumed(tmp_path):
+    state_path = tmp_path / "batch_state.json"
+    state_path.write_text(json.dumps({"batch_id": "batch-0", "custom_ids": ["sample-9-prompt-0"]}))
+    client = FakeBatchClient()
+    client.batches["batch-0"] = []
+    asyncio.run(client.run(make_requests(), poll_interval=0, state_path=str(state_path)))
+    assert len(client.submitted) == 1
+
+
+def test_completed_results_are_written_to_the_response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    first = FakeBatchClient()
+    asyncio.run(first.run(make_requests(), poll_interval=0, cache=cache))
+    assert cache.get_stats()["entries"] == 3
+
+    second = FakeBatchClient()
+    results = asyncio.run(second.run(make_requests(), poll_interval=0, cache=cache))
+    assert second.submitted == []
+    assert results["sample-2-prompt-0"].text == "answer to p2"
+
+
+def test_sampled_results_are_cached_only_when_opted_in(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    asyncio.run(FakeBatchClient().run(make_requests(temperature=0.4), poll_interval=0, cache=cache))
+    assert cache.get_stats()["entries"] == 0
+
+    sampled_cache = ResponseCache(str(tmp_path / "sampled.sqlite"), cache_sampled=True)
+    asyncio.run(FakeBatchClient().run(make_requests(temperature=0.4), poll_interval=0, cache=sampled_cache))
+    assert sampled_cache.get_stats()["entries"] == 3
+
+
+def test_replay_miss_releases_claimed_occurrences(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    recorded = ResponseCache(path, cache_sampled=True)
+    asyncio.run(FakeBatchClient().run(make_requests(temperature=0.4)[:2], poll_interval=0, cache=recorded))
+
+    replay = ResponseCache(path, mode="replay")
+    with pytest.raises(CacheMissError):
+        asyncio.run(FakeBatchClient().run(make_requests(temperature=0.4), poll_interval=0, cache=replay))
+
+    # The retry claims the same first occurrences and replays them
+    client = FakeBatchClient()
+    results = asyncio.run(client.run(make_requests(temperature=0.4)[:2], poll_interval=0, cache=replay))
+    assert client.submitted == []
+    assert results["sample-1-prompt-0"].text == "answer to p1"
@@ -103,7 +103,7 @@ class BaseAgent(ABC):
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
-        return {
+        status = {
             "name": self.name,
             "agent_id": self.agent_id,
             "state": self.state,
@@ -111,6 +111,10 @@ class BaseAgent(ABC):
             "uptime": (datetime.now() - self.created_at).total_seconds(),
             "last_task": self.task_history[-1] if self.task_history else None
         }
+        usage_tracker = getattr(getattr(self, "mcp_manager", None), "usage", None)
+        if usage_tracker is not None:
+            status["llm_usage"] = usage_tracker.summary_for_agent(self.agent_id)
+        return status
     
     async def request_human_approval(
         self,
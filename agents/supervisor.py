@@ -315,7 +315,9 @@ Respond in JSON format with keys: resolution, reasoning, action_items"""
         
         response = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a neutral project supervisor agent focused on practical conflict resolution."
+            system="You are a neutral project supervisor agent focused on practical conflict resolution.",
+            task_type="resolve_conflict",
+            agent_id=self.agent_id
         )
         
         try:
@@ -355,5 +357,12 @@ Respond in JSON format with keys: resolution, reasoning, action_items"""
             "supervisor_status": self.get_status(),
             "project_state": self.project_state,
             "guilds": {name: guild.get_status() for name, guild in self.guilds.items()},
+            "llm_scheduler": self.mcp_manager.get_scheduler_stats(),
+            "llm_streaming": self.mcp_manager.get_stream_stats(),
+            "llm_coalescing": self.mcp_manager.get_coalescing_stats(),
+            "llm_hedging": self.mcp_manager.get_hedging_stats(),
+            "failure_recovery": self.mcp_manager.get_resilience_stats(),
+            "llm_usage": self.mcp_manager.get_usage_summary(),
+            "llm_routing": self.mcp_manager.get_routing_stats(),
             "timestamp": datetime.now().isoformat()
         }
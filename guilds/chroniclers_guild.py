@@ -64,7 +64,9 @@ Write in academic style, include citations, and structure properly."""
         
         draft = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are an academic writer specializing in AI research papers."
+            system="You are an academic writer specializing in AI research papers.",
+            task_type="draft",
+            agent_id=self.agent_id
         )
         
         # Store draft
@@ -104,7 +106,9 @@ Requirements:
         
         formatted = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a copy editor for academic publications."
+            system="You are a copy editor for academic publications.",
+            task_type="format",
+            agent_id=self.agent_id
         )
         
         return {
@@ -88,7 +88,9 @@ Return complete Python code."""
         
         code = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are an expert PyTorch ML engineer."
+            system="You are an expert PyTorch ML engineer.",
+            task_type="code",
+            agent_id=self.agent_id
         )
         
         # Store code
@@ -0,0 +1,138 @@
+"""
+Convergence Monitor - Early stopping for the Generate-Debate-Evolve loop
+Compares each round's top-ranked hypotheses with the previous round's
+(rank correlation, rating deltas, content-hash churn) and stops evolution
+once they have stopped changing for `patience` rounds
+"""
+from typing import Any, Dict, List, Optional
+
+
+def kendall_tau(first: List[str], second: List[str]) -> Optional[float]:
+    """Kendall rank correlation over the items both orderings share (None if fewer than 2)"""
+    common = [item for item in first if item in second]
+    if len(common) < 2:
+        return None
+    position = {item: index for index, item in enumerate(second)}
+    concordant = discordant = 0
+    for i in range(len(common)):
+        for j in range(i + 1, len(common)):
+            if position[common[i]] < position[common[j]]:
+                concordant += 1
+            else:
+                discordant += 1
+    return (concordant - discordant) / (concordant + discordant)
+
+
+class ConvergenceMonitor:
+    """
+    Decides when evolution has converged
+
+    A round counts as converged when, compared with the previous round,
+    at most `max_top_k_churn` of the top-k hypotheses are new, the top-k
+    order correlates at least `min_rank_correlation` (Kendall tau) and no
+    top-k rating moved more than `max_rating_delta`. Evolution stops after
+    `patience` converged rounds in a row, but never before `min_rounds`.
+    The first round has nothing to compare with and never converges.
+
+    Convergence is only meaningful when top hypotheses are carried into
+    the next round: with offspring alone, the top-k is all new every
+    round (churn 1.0), so `from_config` disables stopping unless
+    `hypothesis.carry_survivors` is on.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_rounds: int = 1,
+        patience: int = 1,
+        top_k: int = 3,
+        min_rank_correlation: float = 0.8,
+        max_rating_delta: float = 50.0,
+        max_top_k_churn: float = 0.0
+    ):
+        self.enabled = enabled
+        self.min_rounds = min_rounds
+        self.patience = patience
+        self.top_k = top_k
+        self.min_rank_correlation = min_rank_correlation
+        self.max_rating_delta = max_rating_delta
+        self.max_top_k_churn = max_top_k_churn
+        self._previous_top: Optional[List[str]] = None
+        self._previous_ratings: Dict[str, float] = {}
+        self._previous_population: Optional[set] = None
+        self.rounds = 0
+        self.converged_rounds = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ConvergenceMonitor":
+        """Build from the `hypothesis.early_stopping` section of the research guild config"""
+        hypothesis_config = config.get("hypothesis", {})
+        stopping_config = hypothesis_config.get("early_stopping", {})
+        return cls(
+            enabled=stopping_config.get("enabled", True) and hypothesis_config.get("carry_survivors", True),
+            min_rounds=stopping_config.get("min_rounds", 1),
+            patience=stopping_config.get("patience", 1),
+            top_k=stopping_config.get("top_k", 3),
+            min_rank_correlation=stopping_config.get("min_rank_correlation", 0.8),
+            max_rating_delta=stopping_config.get("max_rating_delta", 50.0),
+            max_top_k_churn=stopping_config.get("max_top_k_churn", 0.0)
+        )
+
+    def observe(self, ranked_keys: List[str], ratings: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Record one round's ranking and report its convergence metrics
+
+        Args:
+            ranked_keys: Content hashes of the round's hypotheses, best first
+            ratings: Content hash -> rating after the round
+
+        Returns:
+            Metrics, whether the round converged, and a stop reason if evolution should stop
+        """
+        self.rounds += 1
+        top = ranked_keys[:self.top_k]
+        population = set(ranked_keys)
+        report: Dict[str, Any] = {
+            "top_k": top,
+            "population_churn": None,
+            "top_k_churn": None,
+            "rank_correlation": None,
+            "max_rating_delta": None,
+            "converged": False,
+            "stop_reason": None
+        }
+
+        if self._previous_top is not None:
+            new_in_top = [key for key in top if key not in self._previous_top]
+            report["top_k_churn"] = len(new_in_top) / len(top) if top else 0.0
+            report["population_churn"] = (
+                len(population - self._previous_population) / len(population) if population else 0.0
+            )
+            report["rank_correlation"] = kendall_tau(self._previous_top, top)
+            deltas = [
+                abs(ratings.get(key, 0.0) - self._previous_ratings[key])
+                for key in top if key in self._previous_ratings
+            ]
+            report["max_rating_delta"] = round(max(deltas), 1) if deltas else None
+
+            report["converged"] = (
+                report["top_k_churn"] <= self.max_top_k_churn
+                and (report["rank_correlation"] is None
+                     or report["rank_correlation"] >= self.min_rank_correlation)
+                and (report["max_rating_delta"] is None
+                     or report["max_rating_delta"] <= self.max_rating_delta)
+            )
+
+        self.converged_rounds = self.converged_rounds + 1 if report["converged"] else 0
+        if (self.enabled and report["converged"] and self.rounds >= self.min_rounds
+                and self.converged_rounds >= self.patience):
+            report["stop_reason"] = (
+                f"converged: top-{self.top_k} stable for {self.converged_rounds} round(s) "
+                f"(churn {report['top_k_churn']:.2f}, tau {report['rank_correlation']}, "
+                f"max rating delta {report['max_rating_delta']})"
+            )
+
+        self._previous_top = top
+        self._previous_ratings = {key: ratings[key] for key in top if key in ratings}
+        self._previous_population = population
+        return report
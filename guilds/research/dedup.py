@@ -0,0 +1,170 @@
+"""
+Near-Duplicate Filter - Collapse paraphrased hypotheses before they are debated
+MinHash signatures over character shingles, banded LSH to find candidate
+pairs, and union-find to cluster them; one representative per cluster
+goes on to reflection and ranking
+"""
+import json
+import hashlib
+from typing import Any, Dict, List, Tuple
+
+
+# Mersenne prime for the (a * x + b) mod p hash family
+_PRIME = (1 << 61) - 1
+
+
+class NearDuplicateFilter:
+    """
+    Clusters near-duplicate hypotheses by estimated Jaccard similarity
+
+    Hypotheses are compared on `fields` (lower-cased, whitespace
+    collapsed) split into character shingles. Pairs that share an LSH
+    band and whose MinHash similarity reaches `threshold` are merged;
+    the earliest hypothesis of each cluster is kept, so survivors listed
+    first keep their identity.
+
+    Template-mates that differ only in their key variable ("tempo" vs.
+    "harmonic tension") share most shingles and score ~0.7-0.85 on the
+    statement alone, so the default threshold is high and the rationale
+    and testability are shingled too. Collapsing never leaves fewer than
+    `min_population` hypotheses: the least similar merged ones are kept.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        fields: Tuple[str, ...] = ("statement", "rationale", "testability"),
+        min_population: int = 3
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+        self.enabled = enabled
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.fields = tuple(fields)
+        self.min_population = min_population
+        seed = hashlib.sha256(b"near-duplicate-filter").digest()
+        self._permutations = [
+            (int.from_bytes(hashlib.sha256(seed + bytes([i, 0])).digest()[:8], "big") % (_PRIME - 1) + 1,
+             int.from_bytes(hashlib.sha256(seed + bytes([i, 1])).digest()[:8], "big") % _PRIME)
+            for i in range(num_perm)
+        ]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "NearDuplicateFilter":
+        """Build from the `hypothesis.deduplication` section of the research guild config"""
+        dedup_config = config.get("hypothesis", {}).get("deduplication", {})
+        return cls(
+            enabled=dedup_config.get("enabled", True),
+            threshold=dedup_config.get("threshold", 0.9),
+            num_perm=dedup_config.get("num_perm", 64),
+            bands=dedup_config.get("bands", 16),
+            shingle_size=dedup_config.get("shingle_size", 5),
+            fields=tuple(dedup_config.get("fields", ["statement", "rationale", "testability"])),
+            # Never collapse below the ranking top-k the evolver draws from
+            min_population=dedup_config.get(
+                "min_population", config.get("ranking", {}).get("top_k", 3)
+            )
+        )
+
+    def _text(self, hypothesis: Dict[str, Any]) -> str:
+        parts = [str(hypothesis[field]) for field in self.fields if hypothesis.get(field)]
+        text = " ".join(parts) if parts else json.dumps(hypothesis, sort_keys=True, default=str)
+        return " ".join(text.lower().split())
+
+    def signature(self, hypothesis: Dict[str, Any]) -> List[int]:
+        """MinHash signature of a hypothesis's shingles"""
+        text = self._text(hypothesis)
+        size = self.shingle_size
+        shingles = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            for shingle in shingles
+        ]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._permutations]
+
+    @staticmethod
+    def similarity(first: List[int], second: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+    def collapse(
+        self,
+        hypotheses: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Keep one representative per cluster of near-duplicates
+
+        If that would leave fewer than `min_population` hypotheses, the
+        merged hypotheses least similar to their representative are kept
+        as well (and dropped from their cluster) until the floor is met.
+
+        Returns:
+            (representatives in original order, merged clusters as
+            {"representative", "merged", "similarity"} for clusters of 2+)
+        """
+        if not self.enabled or len(hypotheses) < 2:
+            return list(hypotheses), []
+
+        signatures = [self.signature(hypothesis) for hypothesis in hypotheses]
+        parent = list(range(len(hypotheses)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        rows = self.num_perm // self.bands
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for index, signature in enumerate(signatures):
+            for band in range(self.bands):
+                band_key = (band, tuple(signature[band * rows:(band + 1) * rows]))
+                buckets.setdefault(band_key, []).append(index)
+
+        checked = set()
+        for members in buckets.values():
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    if (first, second) in checked:
+                        continue
+                    checked.add((first, second))
+                    if self.similarity(signatures[first], signatures[second]) >= self.threshold:
+                        # The earlier hypothesis stays the cluster root
+                        root_first, root_second = find(first), find(second)
+                        parent[max(root_first, root_second)] = min(root_first, root_second)
+
+        clusters: Dict[int, List[int]] = {}
+        for index in range(len(hypotheses)):
+            clusters.setdefault(find(index), []).append(index)
+
+        shortfall = min(self.min_population, len(hypotheses)) - len(clusters)
+        if shortfall > 0:
+            merged_indices = sorted(
+                (index for root, members in clusters.items() for index in members[1:]),
+                key=lambda index: (self.similarity(signatures[find(index)], signatures[index]), index)
+            )
+            for index in merged_indices[:shortfall]:
+                clusters[find(index)].remove(index)
+                clusters[index] = [index]
+
+        representatives = [hypotheses[root] for root in sorted(clusters)]
+        merged = [
+            {
+                "representative": hypotheses[root],
+                "merged": [hypotheses[index] for index in members[1:]],
+                "similarity": [
+                    round(self.similarity(signatures[root], signatures[index]), 2)
+                    for index in members[1:]
+                ]
+            }
+            for root, members in sorted(clusters.items()) if len(members) > 1
+        ]
+        return representatives, merged
@@ -1,17 +1,36 @@
 """
 Hypothesis Generator Agent - Generates initial research hypotheses
 """
+import re
 import json
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from agents.base_agent import BaseAgent
+from mcps.json_stream import JSONArrayStreamParser
+from guilds.research.literature import LiteratureGatherer
+
+
+def is_hypothesis(item: Any) -> bool:
+    """Whether a parsed item is a hypothesis object (a dict with a statement)"""
+    return isinstance(item, dict) and "statement" in item
 
 
 class HypothesisGenerator(BaseAgent):
     """Generates initial research hypotheses based on topic and focus areas"""
     
-    def __init__(self, name: str, agent_id: str, config: Dict[str, Any], shared_memory: Any, mcp_manager: Any):
+    def __init__(
+        self,
+        name: str,
+        agent_id: str,
+        config: Dict[str, Any],
+        shared_memory: Any,
+        mcp_manager: Any,
+        literature: Optional[LiteratureGatherer] = None
+    ):
         super().__init__(name, agent_id, config, shared_memory)
         self.mcp_manager = mcp_manager
+        # Shared with the guild's literature review so one topic is fetched once per run
+        self.literature = literature or LiteratureGatherer.from_config(mcp_manager, config)
     
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute hypothesis generation task"""
@@ -25,7 +44,8 @@ class HypothesisGenerator(BaseAgent):
         self,
         topic: str,
         focus_areas: List[str],
-        num_hypotheses: int = 5
+        num_hypotheses: int = 5,
+        on_hypothesis: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None
     ) -> Dict[str, Any]:
         """
         Generate research hypotheses
@@ -34,6 +54,8 @@ class HypothesisGenerator(BaseAgent):
             topic: Main research topic
             focus_areas: Specific areas to focus on
             num_hypotheses: Number of hypotheses to generate
+            on_hypothesis: Optional coroutine called with each hypothesis as soon
+                as it has streamed in, so downstream work can start early
             
         Returns:
             Dictionary with generated hypotheses
@@ -41,20 +63,23 @@ class HypothesisGenerator(BaseAgent):
         self.state = "generating"
         self.logger.info(f"Generating {num_hypotheses} hypotheses for: {topic}")
         
-        # Search for relevant literature first
-        arxiv_mcp = self.mcp_manager.get_mcp("arxiv")
-        papers = await arxiv_mcp.execute(query=topic, max_results=10)
-        
-        web_search_mcp = self.mcp_manager.get_mcp("web_search")
-        web_results = await web_search_mcp.execute(query=topic, max_results=5)
-        
-        # Retrieve existing hypotheses from memory to avoid duplication
-        existing_hypotheses = await self.retrieve_from_memory(
-            query=topic,
-            n_results=10,
-            collection="research_artifacts",
-            filter_metadata={"type": "hypothesis"}
+        # Search for relevant literature and retrieve existing hypotheses (to avoid
+        # duplication) concurrently; a source past its deadline contributes nothing
+        literature, (existing_hypotheses, _) = await asyncio.gather(
+            self.literature.gather(topic, max_papers=10, max_web_results=5),
+            self.literature.bounded(
+                "memory",
+                self.retrieve_from_memory(
+                    query=topic,
+                    n_results=10,
+                    collection="research_artifacts",
+                    filter_metadata={"type": "hypothesis"}
+                ),
+                {"documents": [[]], "metadatas": [[]], "distances": [[]]}
+            )
         )
+        papers = literature["papers"]
+        web_results = literature["web_results"]
         
         # Generate hypotheses using LLM
         llm = self.mcp_manager.get_mcp("llm_anthropic")
@@ -85,46 +110,80 @@ For each hypothesis, provide:
 
 Return as JSON array of hypothesis objects."""
         
-        response = await llm.execute(
+        # Stream the response so each hypothesis is stored as soon as it is complete
+        parser = JSONArrayStreamParser(accept=is_hypothesis)
+        chunks = []
+        hypotheses = []
+        async for delta in llm.execute_stream(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a creative research scientist specializing in multimodal AI, computational arts, and cross-modal learning."
-        )
-        
-        try:
-            hypotheses = json.loads(response)
-            if not isinstance(hypotheses, list):
-                hypotheses = [hypotheses]
-        except json.JSONDecodeError:
-            self.logger.warning("Failed to parse JSON, using fallback")
-            hypotheses = [{
-                "statement": response[:500],
-                "rationale": "Generated from LLM response",
-                "testability": "To be determined",
-                "novelty_score": 5,
-                "expected_impact": "To be evaluated"
-            }]
+            system="You are a creative research scientist specializing in multimodal AI, computational arts, and cross-modal learning.",
+            task_type="generate",
+            agent_id=self.agent_id
+        ):
+            chunks.append(delta)
+            for hypothesis in parser.feed(delta):
+                await self._store_hypothesis(hypothesis, len(hypotheses), topic, focus_areas)
+                hypotheses.append(hypothesis)
+                if on_hypothesis:
+                    await on_hypothesis(hypothesis)
         
-        # Store each hypothesis in memory
-        for i, hypothesis in enumerate(hypotheses):
-            await self.store_in_memory(
-                content=json.dumps(hypothesis, indent=2),
-                metadata={
-                    "type": "hypothesis",
-                    "topic": topic,
-                    "focus_areas": ",".join(focus_areas),
-                    "generation_method": "initial",
-                    "hypothesis_id": f"hyp_{i}_{hash(hypothesis['statement'])}"
-                },
-                collection="research_artifacts"
-            )
+        if not hypotheses:
+            response = "".join(chunks)
+            hypotheses = self._parse_hypotheses(response)
+            if not hypotheses:
+                self.logger.warning("Failed to parse JSON, using fallback")
+                hypotheses = [{
+                    "statement": response[:500],
+                    "rationale": "Generated from LLM response",
+                    "testability": "To be determined",
+                    "novelty_score": 5,
+                    "expected_impact": "To be evaluated"
+                }]
+            
+            for i, hypothesis in enumerate(hypotheses):
+                await self._store_hypothesis(hypothesis, i, topic, focus_areas)
+                if on_hypothesis:
+                    await on_hypothesis(hypothesis)
         
         self.state = "idle"
         result = {
             "success": True,
             "hypotheses": hypotheses,
             "count": len(hypotheses),
-            "papers_reviewed": len(papers)
+            "papers_reviewed": len(papers),
+            "literature_sources": literature["sources"]
         }
         
         self.log_task({"type": "generate_hypotheses"}, result)
         return result
+    
+    @staticmethod
+    def _parse_hypotheses(response: str) -> List[Dict[str, Any]]:
+        """Hypothesis objects from a whole reply (bare or fenced JSON, array or single object)"""
+        fenced = re.search(r"```[\w-]*\s*(.*?)```", response, re.DOTALL)
+        try:
+            parsed = json.loads(fenced.group(1) if fenced else response)
+        except json.JSONDecodeError:
+            return []
+        items = parsed if isinstance(parsed, list) else [parsed]
+        return [item for item in items if is_hypothesis(item)]
+    
+    async def _store_hypothesis(
+        self,
+        hypothesis: Dict[str, Any],
+        index: int,
+        topic: str,
+        focus_areas: List[str]
+    ):
+        """Store a generated hypothesis in memory"""
+        await self.store_in_memory(
+            content=json.dumps(hypothesis, indent=2),
+            metadata={
+                "type": "hypothesis",
+                "topic": topic,
+                "focus_areas": ",".join(focus_areas),
+                "generation_method": "initial",
+                "hypothesis_id": f"hyp_{index}_{hash(hypothesis['statement'])}"
+            },
+            collection="research_artifacts"
+        )
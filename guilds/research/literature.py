@@ -0,0 +1,156 @@
+"""
+Literature Gatherer - Concurrent arXiv and web lookups with per-source deadlines
+Sources are queried in parallel; a slow or failing source yields an empty
+result instead of holding up the others, and results are shared by every
+caller asking about the same topic during a run
+"""
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_TIMEOUTS = {"arxiv": 15.0, "web_search": 10.0, "memory": 5.0}
+
+
+class LiteratureGatherer:
+    """
+    Fetches literature context for a topic from all sources at once
+
+    Each source gets its own deadline. Successful fetches are kept for
+    `cache_ttl` seconds (and shared while still in flight), so the
+    hypothesis generator and the literature review reuse one fetch per
+    topic. Failed fetches are retried by the next caller; one that missed
+    a deadline keeps running in the background for later callers. Expired
+    and failed fetches are dropped, and at most `max_entries` finished
+    ones are kept.
+    """
+
+    def __init__(
+        self,
+        mcp_manager: Any,
+        timeouts: Optional[Dict[str, float]] = None,
+        cache_ttl: float = 900.0,
+        max_entries: int = 256,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.mcp_manager = mcp_manager
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self.logger = logger or logging.getLogger("LiteratureGatherer")
+        # (source, query, max_results) -> (fetched_at, task)
+        self._fetches: Dict[Tuple[str, str, int], Tuple[float, asyncio.Task]] = {}
+        self.fetches = 0
+        self.shared = 0
+        self.timeouts_hit = 0
+        self.errors = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, mcp_manager: Any, config: Dict[str, Any]) -> "LiteratureGatherer":
+        """Build from the `literature` section of the research guild config"""
+        literature_config = config.get("literature", {})
+        return cls(
+            mcp_manager,
+            timeouts=literature_config.get("timeouts"),
+            cache_ttl=literature_config.get("cache_ttl", 900.0),
+            max_entries=literature_config.get("max_entries", 256)
+        )
+
+    def timeout(self, source: str) -> Optional[float]:
+        return self.timeouts.get(source)
+
+    async def bounded(self, source: str, fetch: Awaitable[Any], default: Any) -> Tuple[Any, str]:
+        """Await `fetch` within the source's deadline; (result or `default`, status)"""
+        try:
+            return await asyncio.wait_for(fetch, timeout=self.timeout(source)), "ok"
+        except asyncio.TimeoutError:
+            self.timeouts_hit += 1
+            self.logger.warning(f"{source} lookup exceeded {self.timeout(source)}s, continuing without it")
+            return default, "timeout"
+        except Exception as e:
+            self.errors += 1
+            self.logger.warning(f"{source} lookup failed: {e}")
+            return default, "error"
+
+    def _shared_fetch(self, source: str, query: str, max_results: int, call: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Reuse a fresh or in-flight fetch of the same lookup, or start one"""
+        key = (source, " ".join(query.lower().split()), max_results)
+        cached = self._fetches.get(key)
+        if cached:
+            fetched_at, task = cached
+            failed = task.done() and (task.cancelled() or task.exception() is not None)
+            if not failed and time.monotonic() - fetched_at < self.cache_ttl:
+                self.shared += 1
+                return task
+
+        self._prune()
+        task = asyncio.ensure_future(call())
+        self._fetches[key] = (time.monotonic(), task)
+        self.fetches += 1
+        return task
+
+    def _prune(self):
+        """Drop finished fetches that expired or failed, then the oldest finished ones over `max_entries`"""
+        now = time.monotonic()
+        finished = []
+        for key, (fetched_at, task) in list(self._fetches.items()):
+            if not task.done():
+                continue
+            if now - fetched_at >= self.cache_ttl or task.cancelled() or task.exception() is not None:
+                del self._fetches[key]
+                self.evictions += 1
+            else:
+                finished.append((fetched_at, key))
+
+        excess = len(self._fetches) + 1 - self.max_entries
+        for _, key in sorted(finished)[:max(excess, 0)]:
+            del self._fetches[key]
+            self.evictions += 1
+
+    async def _source(self, source: str, query: str, max_results: int) -> Tuple[List[Any], str]:
+        async def fetch():
+            return await self.mcp_manager.get_mcp(source).execute(query=query, max_results=max_results)
+
+        task = self._shared_fetch(source, query, max_results, fetch)
+        # Shield so a deadline here does not cancel the fetch for other callers
+        results, status = await self.bounded(source, asyncio.shield(task), [])
+        if status == "timeout" and not task.done():
+            # Let the fetch finish in the background for the next caller
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return results or [], status
+
+    async def gather(
+        self,
+        query: str,
+        max_papers: int = 10,
+        max_web_results: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Fetch arXiv papers and web results for a query concurrently
+
+        Returns:
+            {"papers", "web_results", "sources": {source: "ok" | "timeout" | "error"}}
+        """
+        (papers, arxiv_status), (web_results, web_status) = await asyncio.gather(
+            self._source("arxiv", query, max_papers),
+            self._source("web_search", query, max_web_results)
+        )
+        return {
+            "papers": papers,
+            "web_results": web_results,
+            "sources": {"arxiv": arxiv_status, "web_search": web_status}
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fetches issued versus served from a shared fetch, plus deadline misses"""
+        return {
+            "fetches": self.fetches,
+            "shared": self.shared,
+            "timeouts": self.timeouts_hit,
+            "errors": self.errors,
+            "entries": len(self._fetches),
+            "evictions": self.evictions,
+            "timeouts_seconds": self.timeouts
+        }
@@ -1,23 +1,127 @@
 """
 Research Sub-Agents: Reflector, Ranker, Evolver, Meta-Reviewer
 """
+import re
 import json
-from typing import Dict, Any, List
+import math
+import asyncio
+import inspect
+import hashlib
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable
 from agents.base_agent import BaseAgent
 
 
+def _canonical(value: Any) -> Any:
+    """Hypothesis content with whitespace collapsed in every string"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def content_key(hypothesis: Dict[str, Any], *salt: str) -> str:
+    """Hash of a hypothesis's canonical content (key order and whitespace do not matter)"""
+    content = json.dumps([_canonical(hypothesis), *salt], sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
 class HypothesisReflector(BaseAgent):
     """Critically evaluates hypothesis quality, novelty, and testability"""
     
+    # Bump whenever the reflection prompt changes so cached reflections are not reused
+    PROMPT_VERSION = "1"
+    
     def __init__(self, name: str, agent_id: str, config: Dict[str, Any], shared_memory: Any, mcp_manager: Any):
         super().__init__(name, agent_id, config, shared_memory)
         self.mcp_manager = mcp_manager
+        cache_config = config.get("reflection_cache", {})
+        self.cache_enabled = cache_config.get("enabled", True)
+        self.cache_persist = cache_config.get("persist", True)
+        self.cache_collection = cache_config.get("collection", "research_artifacts")
+        self._reflections: Dict[str, Dict[str, Any]] = {}
+        self.cache_hits = 0
+        self.cache_stored_hits = 0
+        self.cache_misses = 0
     
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         return await self.reflect(task.get("hypothesis", {}))
     
     async def reflect(self, hypothesis: Dict[str, Any]) -> Dict[str, Any]:
-        """Reflect on a single hypothesis"""
+        """Reflect on a single hypothesis, reusing an earlier reflection of the same content"""
+        if not self.cache_enabled:
+            reflection, _ = await self._critique(hypothesis)
+            return {"hypothesis": hypothesis, "reflection": reflection}
+        
+        key = content_key(hypothesis, f"reflection-v{self.PROMPT_VERSION}")
+        reflection = self._reflections.get(key)
+        if reflection is None:
+            reflection = await self._load_reflection(key)
+            if reflection is not None:
+                self.cache_stored_hits += 1
+        if reflection is not None:
+            self.cache_hits += 1
+            self._reflections[key] = reflection
+            return {"hypothesis": hypothesis, "reflection": reflection}
+        
+        self.cache_misses += 1
+        reflection, parsed = await self._critique(hypothesis)
+        # Unparseable critiques are not cached so the next round can retry them
+        if parsed:
+            self._reflections[key] = reflection
+            await self._save_reflection(key, reflection)
+        return {"hypothesis": hypothesis, "reflection": reflection}
+    
+    async def _load_reflection(self, key: str) -> Optional[Dict[str, Any]]:
+        """Reflection stored by an earlier run, if any"""
+        if not self.cache_persist or self.shared_memory is None:
+            return None
+        try:
+            stored = await self.shared_memory.get(
+                ids=[f"reflection_{key}"],
+                collection_name=self.cache_collection
+            )
+            documents = stored.get("documents") or []
+            return json.loads(documents[0]) if documents else None
+        except Exception as e:
+            self.logger.debug(f"Reflection cache lookup failed: {e}")
+            return None
+    
+    async def _save_reflection(self, key: str, reflection: Dict[str, Any]):
+        """Persist a reflection next to the other research artifacts"""
+        if not self.cache_persist or self.shared_memory is None:
+            return
+        try:
+            await self.shared_memory.add(
+                documents=[json.dumps(reflection)],
+                metadatas=[{
+                    "type": "reflection",
+                    "reflection_key": key,
+                    "prompt_version": self.PROMPT_VERSION,
+                    "agent_id": self.agent_id
+                }],
+                ids=[f"reflection_{key}"],
+                collection_name=self.cache_collection
+            )
+        except Exception as e:
+            self.logger.debug(f"Reflection cache write failed: {e}")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Reflection cache hits (in memory or from an earlier run) versus LLM calls"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "enabled": self.cache_enabled,
+            "hits": self.cache_hits,
+            "stored_hits": self.cache_stored_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "entries": len(self._reflections)
+        }
+    
+    async def _critique(self, hypothesis: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Ask the LLM for a structured critique of one hypothesis; (reflection, parsed as JSON)"""
         llm = self.mcp_manager.get_mcp("llm_anthropic")
         
         prompt = f"""Critically evaluate this research hypothesis:
@@ -35,23 +139,61 @@ Return as JSON."""
         
         response = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a critical peer reviewer in AI research."
+            system="You are a critical peer reviewer in AI research.",
+            task_type="reflect",
+            agent_id=self.agent_id
         )
         
         try:
-            reflection = json.loads(response)
+            return json.loads(response), True
         except:
-            reflection = {"critique": response, "scores": {"overall": 5}}
-        
-        return {"hypothesis": hypothesis, "reflection": reflection}
+            return {"critique": response, "scores": {"overall": 5}}, False
+
+
+class RatingLedger:
+    """
+    Elo ratings and played pairings keyed by hypothesis content hash
+    
+    Shared across the rounds of one evolution run so hypotheses that
+    survive a round keep their rating instead of restarting at 1500.
+    """
+    
+    def __init__(self, initial_rating: float = 1500.0):
+        self.initial_rating = initial_rating
+        self.ratings: Dict[str, float] = {}
+        self.played: Set[Tuple[str, str]] = set()
+    
+    @staticmethod
+    def key(hypothesis: Dict[str, Any]) -> str:
+        return content_key(hypothesis)
+    
+    def rating(self, key: str) -> float:
+        return self.ratings.get(key, self.initial_rating)
+    
+    def has_played(self, first: str, second: str) -> bool:
+        return first == second or (min(first, second), max(first, second)) in self.played
+    
+    def record_pairing(self, first: str, second: str):
+        self.played.add((min(first, second), max(first, second)))
 
 
 class HypothesisRanker(BaseAgent):
-    """Ranks hypotheses through Elo-based tournament debate"""
+    """Ranks hypotheses through a Swiss-system Elo tournament"""
+    
+    # First hypothesis's score for each verdict; anything else is no verdict
+    VERDICT_SCORES = {"A": 1.0, "B": 0.0, "T": 0.5}
     
     def __init__(self, name: str, agent_id: str, config: Dict[str, Any], shared_memory: Any, mcp_manager: Any):
         super().__init__(name, agent_id, config, shared_memory)
         self.mcp_manager = mcp_manager
+        ranking_config = config.get("ranking", {})
+        self.k_factor = ranking_config.get("k_factor", 32)
+        self.top_k = ranking_config.get("top_k", 3)
+        self.stable_rounds = ranking_config.get("stable_rounds", 2)
+        self.max_rounds = ranking_config.get("max_rounds")
+        self.pairs_per_call = ranking_config.get("pairs_per_call", 16)
+        self.position_swap = ranking_config.get("position_swap", True)
+        self.calibration_matches = ranking_config.get("calibration_matches", 3)
     
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         return await self.rank_hypotheses(
@@ -62,18 +204,251 @@ class HypothesisRanker(BaseAgent):
     async def rank_hypotheses(
         self,
         hypotheses: List[Dict[str, Any]],
-        reflections: List[Dict[str, Any]]
+        reflections: List[Any],
+        ledger: Optional[RatingLedger] = None
     ) -> Dict[str, Any]:
-        """Rank hypotheses through simulated debate"""
-        llm = self.mcp_manager.get_mcp("llm_anthropic")
+        """
+        Rank hypotheses through a Swiss-system tournament
+        
+        Each round pairs hypotheses with similar ratings that have not met
+        yet and judges all pairings concurrently. At least ceil(log2 n)
+        rounds are played; ranking stops once the top-k order has not
+        changed for `stable_rounds` rounds, so it takes O(n log n)
+        judgments instead of n(n-1)/2. With `pairs_per_call` > 1 those
+        judgments are batched, several pairings per LLM call. That makes
+        about one call per round, but input tokens barely drop: a round
+        already judges each hypothesis about once.
+        
+        With a `ledger` from earlier rounds, already-rated hypotheses keep
+        their rating and only newcomers play, `calibration_matches`
+        rounds against the nearest-rated opponents.
+        
+        `reflections` may hold futures that are still running; the first
+        round then pairs hypotheses as their reflections land instead of
+        waiting for all of them. A reflection that fails counts as
+        missing: its hypothesis is judged without a critique. The
+        caller's list is left as it is.
+        """
+        ledger = ledger or RatingLedger()
+        reflections = list(reflections)
+        streaming = any(inspect.isawaitable(reflection) for reflection in reflections)
+        n = len(hypotheses)
+        keys = [ledger.key(hypothesis) for hypothesis in hypotheses]
+        scores = {i: ledger.rating(keys[i]) for i in range(n)}
+        newcomers = {i for i in range(n) if keys[i] not in ledger.ratings}
+        if newcomers and len(newcomers) < n:
+            # Place new hypotheses among rated ones instead of replaying the field
+            focus = newcomers
+            min_rounds = max_rounds = self.calibration_matches
+        else:
+            focus = None
+            min_rounds = math.ceil(math.log2(n)) if n > 1 else 0
+            max_rounds = self.max_rounds or min_rounds + 2
+        comparisons = 0
+        llm_calls = 0
+        rounds = 0
+        stable = 0
+        previous_top = None
+        
+        has_played = lambda i, j: ledger.has_played(keys[i], keys[j])
+        
+        while newcomers and rounds < max_rounds:
+            if streaming:
+                pairings, outcomes, calls = await self._opening_round(
+                    hypotheses, reflections, scores, has_played, focus
+                )
+                streaming = False
+            else:
+                pairings = self._swiss_pairings(scores, has_played, focus)
+                outcomes, calls = await self._judge_pairings(hypotheses, reflections, pairings)
+            if not pairings:
+                break
+            rounds += 1
+            llm_calls += calls
+            
+            for (i, j), outcome in zip(pairings, outcomes):
+                ledger.record_pairing(keys[i], keys[j])
+                if outcome is None:
+                    continue
+                comparisons += 1
+                self._update_elo(scores, i, j, outcome)
+            
+            top = self._top_order(scores)
+            stable = stable + 1 if top == previous_top else 0
+            previous_top = top
+            if rounds >= min_rounds and stable >= self.stable_rounds:
+                self.logger.info(f"Top-{self.top_k} stable after {rounds} rounds, stopping early")
+                break
+        
+        for i in range(n):
+            ledger.ratings[keys[i]] = scores[i]
+        
+        self.logger.info(
+            f"Ranked {n} hypotheses ({len(newcomers)} new) with {comparisons} comparisons "
+            f"({llm_calls} LLM calls) in {rounds} rounds"
+        )
+        
+        # Sort by score
+        ranked_indices = self._top_order(scores, n)
+        ranked_hypotheses = [hypotheses[i] for i in ranked_indices]
         
-        # Initialize Elo scores
-        scores = {i: 1500 for i in range(len(hypotheses))}
+        return {
+            "ranked_hypotheses": ranked_hypotheses,
+            "scores": {i: round(scores[i], 1) for i in ranked_indices},
+            "comparisons": comparisons,
+            "llm_calls": llm_calls,
+            "rounds": rounds
+        }
+    
+    async def _judge_pairings(
+        self,
+        hypotheses: List[Dict[str, Any]],
+        reflections: List[Dict[str, Any]],
+        pairings: List[Tuple[int, int]]
+    ) -> Tuple[List[Optional[float]], int]:
+        """Judge pairings concurrently, `pairs_per_call` per LLM call; (outcomes, LLM calls)"""
+        if self.pairs_per_call > 1:
+            batches = [pairings[start:start + self.pairs_per_call]
+                       for start in range(0, len(pairings), self.pairs_per_call)]
+            results = await asyncio.gather(*(
+                self._judge_batch(hypotheses, reflections, batch) for batch in batches
+            ))
+            return [outcome for outcomes, _ in results for outcome in outcomes], sum(calls for _, calls in results)
         
-        # Tournament: each hypothesis debates every other
-        for i in range(len(hypotheses)):
-            for j in range(i + 1, len(hypotheses)):
-                debate_prompt = f"""Compare these two hypotheses and determine which is stronger:
+        outcomes = await asyncio.gather(*(
+            self._judge(hypotheses, reflections, i, j) for i, j in pairings
+        ))
+        return list(outcomes), len(pairings)
+    
+    async def _opening_round(
+        self,
+        hypotheses: List[Dict[str, Any]],
+        reflections: List[Any],
+        scores: Dict[int, float],
+        has_played: Callable[[int, int], bool],
+        focus: Optional[Set[int]]
+    ) -> Tuple[List[Tuple[int, int]], List[Optional[float]], int]:
+        """
+        First round paired in the order reflections arrive
+        
+        A match is ready as soon as both reflections are in, so ranking
+        overlaps with the slowest reflections. Ready matches are judged
+        in batches of up to `pairs_per_call`: one is sent while no batch
+        is in flight, and the ones that become ready meanwhile go together
+        when it returns (or when the batch is full, or every reflection
+        is in). Replaces the futures in `reflections` (rank_hypotheses'
+        own copy) with their results; a failed reflection becomes an
+        empty one.
+        """
+        async def arrival(index: int, reflection: Any) -> Tuple[int, Any]:
+            try:
+                return index, (await reflection if inspect.isawaitable(reflection) else reflection)
+            except Exception as e:
+                self.logger.warning(f"Reflection on hypothesis {index} failed, judging it without a critique: {e}")
+                return index, {}
+        
+        waiting = {
+            asyncio.ensure_future(arrival(index, reflection)) for index, reflection in enumerate(reflections)
+        }
+        ready: List[int] = []
+        queued: List[Tuple[int, int]] = []
+        batches: List[Tuple[List[Tuple[int, int]], asyncio.Future]] = []
+        in_flight: Optional[asyncio.Future] = None
+        try:
+            while waiting or queued:
+                if queued and (in_flight is None or in_flight.done() or not waiting
+                               or len(queued) >= self.pairs_per_call):
+                    in_flight = asyncio.ensure_future(self._judge_pairings(hypotheses, reflections, queued))
+                    batches.append((queued, in_flight))
+                    queued = []
+                    continue
+                
+                watched = waiting | ({in_flight} if in_flight is not None and not in_flight.done() else set())
+                done, _ = await asyncio.wait(watched, return_when=asyncio.FIRST_COMPLETED)
+                for arrived in done & waiting:
+                    index, reflection = arrived.result()
+                    reflections[index] = reflection
+                    ready.append(index)
+                    pairing = self._ready_pairing(ready, scores, has_played, focus)
+                    if pairing:
+                        ready.remove(pairing[0])
+                        ready.remove(pairing[1])
+                        queued.append(pairing)
+                waiting -= done
+            
+            results = await asyncio.gather(*(judgment for _, judgment in batches))
+        finally:
+            # Do not leave matches running when the round is abandoned (reflections are the caller's)
+            pending = [judgment for _, judgment in batches if not judgment.done()]
+            for judgment in pending:
+                judgment.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        pairings = [pairing for batch, _ in batches for pairing in batch]
+        return pairings, [outcome for outcomes, _ in results for outcome in outcomes], sum(calls for _, calls in results)
+    
+    @staticmethod
+    def _ready_pairing(
+        ready: List[int],
+        scores: Dict[int, float],
+        has_played: Callable[[int, int], bool],
+        focus: Optional[Set[int]]
+    ) -> Optional[Tuple[int, int]]:
+        """Nearest-rated unplayed pairing among hypotheses whose reflections are in"""
+        for first in ready:
+            if focus is not None and first not in focus:
+                continue
+            opponents = [opponent for opponent in ready if opponent != first and not has_played(first, opponent)]
+            if opponents:
+                return first, min(opponents, key=lambda o: abs(scores[o] - scores[first]))
+        return None
+    
+    def _top_order(self, scores: Dict[int, float], k: Optional[int] = None) -> List[int]:
+        """Indices of the k highest-rated hypotheses, best first"""
+        return sorted(scores, key=lambda i: (-scores[i], i))[:k or self.top_k]
+    
+    @staticmethod
+    def _swiss_pairings(
+        scores: Dict[int, float],
+        has_played: Callable[[int, int], bool],
+        focus: Optional[Set[int]] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Pair each hypothesis with the nearest-rated one it has not met (odd one out gets a bye)
+        
+        With `focus`, only those hypotheses seek opponents; the rest are
+        only used as opponents.
+        """
+        standings = sorted(scores, key=lambda i: (-scores[i], i))
+        unpaired = list(standings)
+        pairings = []
+        for first in standings:
+            if first not in unpaired or (focus is not None and first not in focus):
+                continue
+            unpaired.remove(first)
+            opponents = [opponent for opponent in unpaired if not has_played(first, opponent)]
+            if opponents:
+                opponent = min(opponents, key=lambda o: abs(scores[o] - scores[first]))
+                unpaired.remove(opponent)
+                pairings.append((first, opponent))
+        return pairings
+    
+    def _update_elo(self, scores: Dict[int, float], i: int, j: int, outcome: float):
+        """Elo update with expected score; outcome is i's score (1 win, 0.5 tie, 0 loss)"""
+        expected = 1 / (1 + 10 ** ((scores[j] - scores[i]) / 400))
+        delta = self.k_factor * (outcome - expected)
+        scores[i] += delta
+        scores[j] -= delta
+    
+    async def _judge(
+        self,
+        hypotheses: List[Dict[str, Any]],
+        reflections: List[Dict[str, Any]],
+        i: int,
+        j: int
+    ) -> Optional[float]:
+        """Ask the judge which of two hypotheses is stronger; i's score, or None on failure"""
+        llm = self.mcp_manager.get_mcp("llm_anthropic")
+        debate_prompt = f"""Compare these two hypotheses and determine which is stronger:
 
 Hypothesis A:
 {json.dumps(hypotheses[i], indent=2)}
@@ -83,31 +458,137 @@ Hypothesis B:
 {json.dumps(hypotheses[j], indent=2)}
 Critique B: {reflections[j].get('reflection', {}).get('critique', '')}
 
-Which is stronger? Respond: A, B, or TIE
-Include brief reasoning."""
-                
-                response = await llm.execute(
-                    messages=[{"role": "user", "content": debate_prompt}],
-                    system="You are an impartial research judge.",
-                    max_tokens=200
-                )
-                
-                # Simple Elo update
-                winner = response.strip().upper()[0]
-                if winner == 'A':
-                    scores[i] += 32
-                    scores[j] -= 32
-                elif winner == 'B':
-                    scores[j] += 32
-                    scores[i] -= 32
+Which is stronger? Respond with a single letter: A, B, or T for a tie."""
         
-        # Sort by score
-        ranked_indices = sorted(range(len(hypotheses)), key=lambda i: scores[i], reverse=True)
-        ranked_hypotheses = [hypotheses[i] for i in ranked_indices]
+        try:
+            # Model and token budget come from the "rank" route (one-letter answer)
+            response = await llm.execute(
+                messages=[{"role": "user", "content": debate_prompt}],
+                system="You are an impartial research judge.",
+                task_type="rank",
+                agent_id=self.agent_id
+            )
+        except Exception as e:
+            self.logger.warning(f"Comparison {i} vs {j} failed: {e}")
+            return None
+        
+        verdict = self._verdict(response)
+        if verdict is None:
+            self.logger.warning(f"Comparison {i} vs {j} gave no verdict: {response.strip()[:40]!r}")
+            return None
+        return self.VERDICT_SCORES[verdict]
+    
+    async def _judge_batch(
+        self,
+        hypotheses: List[Dict[str, Any]],
+        reflections: List[Dict[str, Any]],
+        pairings: List[Tuple[int, int]]
+    ) -> Tuple[List[Optional[float]], int]:
+        """
+        Judge several pairings in one LLM call; (i's score per pairing or None, LLM calls)
+        
+        Each hypothesis is listed once under a short ID and the pairings
+        refer to those IDs. With `position_swap`, every pairing is also
+        asked in the reverse order (later in the list) and the two
+        verdicts are averaged, so a preference for whichever hypothesis
+        is listed first cancels out. A reply with no readable verdicts
+        falls back to judging each pairing on its own.
+        """
+        llm = self.mcp_manager.get_mcp("llm_anthropic")
+        involved = sorted({index for pairing in pairings for index in pairing})
+        
+        listing = []
+        for index in involved:
+            critique = reflections[index].get('reflection', {}).get('critique', '')
+            listing.append(f"[H{index + 1}] {json.dumps(hypotheses[index], separators=(',', ':'))}")
+            if critique:
+                listing.append(f"Critique: {critique}")
+        
+        questions = list(pairings)
+        if self.position_swap:
+            questions += [(j, i) for i, j in pairings]
+        listing = "\n".join(listing)
+        comparisons = "\n".join(
+            f"{number}. H{i + 1} vs H{j + 1}" for number, (i, j) in enumerate(questions, 1)
+        )
+        
+        batch_prompt = f"""Judge these pairwise comparisons between research hypotheses.
+
+Hypotheses:
+{listing}
+
+Comparisons:
+{comparisons}
+
+For each comparison, answer "A" if the first hypothesis is stronger, "B" if the second is stronger, or "T" for a tie.
+Return only a JSON object mapping each comparison number to its verdict, e.g. {{"1": "A", "2": "T"}}."""
+        
+        try:
+            # About 6 output tokens per verdict; routed model and temperature still apply
+            response = await llm.execute(
+                messages=[{"role": "user", "content": batch_prompt}],
+                system="You are an impartial research judge.",
+                task_type="rank",
+                max_tokens=6 * len(questions) + 16,
+                agent_id=self.agent_id
+            )
+        except Exception as e:
+            self.logger.warning(f"Batched comparison of {len(pairings)} pairings failed: {e}")
+            return [None] * len(pairings), 1
         
+        verdicts = self._parse_verdicts(response)
+        if not verdicts:
+            self.logger.warning(f"Batched judgment had no readable verdicts, judging {len(pairings)} pairings one by one")
+            outcomes = await asyncio.gather(*(
+                self._judge(hypotheses, reflections, i, j) for i, j in pairings
+            ))
+            return list(outcomes), 1 + len(pairings)
+        
+        outcomes = []
+        for number in range(1, len(pairings) + 1):
+            scores = []
+            forward = verdicts.get(number)
+            if forward:
+                scores.append(self.VERDICT_SCORES[forward])
+            backward = verdicts.get(number + len(pairings)) if self.position_swap else None
+            if backward:
+                # Asked as (j, i), so the verdict scores j
+                scores.append(1.0 - self.VERDICT_SCORES[backward])
+            outcomes.append(sum(scores) / len(scores) if scores else None)
+        
+        missing = outcomes.count(None)
+        if missing:
+            self.logger.warning(f"Batched judgment left {missing}/{len(pairings)} pairings unanswered")
+        return outcomes, 1
+    
+    @staticmethod
+    def _verdict(text: str) -> Optional[str]:
+        """Verdict letter (A, B or T, also spelled "tie") that `text` starts with, or None"""
+        match = re.match(r'\W*(A|B|T|TIE)\b', str(text).strip().upper())
+        return match.group(1)[0] if match else None
+    
+    @staticmethod
+    def _parse_verdicts(response: str) -> Dict[int, str]:
+        """
+        Comparison number -> "A"/"B"/"T" from a JSON object, or "1: A" lines as a fallback
+        
+        Comparisons whose answer is not one of those verdicts are left out.
+        """
+        start, end = response.find("{"), response.rfind("}")
+        if start != -1 and end > start:
+            try:
+                parsed = json.loads(response[start:end + 1])
+                verdicts = {
+                    int(number): HypothesisRanker._verdict(verdict)
+                    for number, verdict in parsed.items()
+                    if str(number).isdigit()
+                }
+                return {number: verdict for number, verdict in verdicts.items() if verdict}
+            except (json.JSONDecodeError, AttributeError):
+                pass
         return {
-            "ranked_hypotheses": ranked_hypotheses,
-            "scores": {i: scores[i] for i in ranked_indices}
+            int(number): verdict.upper()
+            for number, verdict in re.findall(r'"?(\d+)"?\s*[:.)=-]\s*"?([ABTabt])\b', response)
         }
 
 
@@ -149,7 +630,9 @@ Return as JSON array."""
         
         response = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a research scientist synthesizing and improving hypotheses."
+            system="You are a research scientist synthesizing and improving hypotheses.",
+            task_type="evolve",
+            agent_id=self.agent_id
         )
         
         try:
@@ -197,7 +680,9 @@ Return as structured JSON."""
         
         response = await llm.execute(
             messages=[{"role": "user", "content": prompt}],
-            system="You are a meta-analyst identifying patterns in research quality."
+            system="You are a meta-analyst identifying patterns in research quality.",
+            task_type="meta_review",
+            agent_id=self.agent_id
         )
         
         try:
@@ -206,3 +691,31 @@ Return as structured JSON."""
             meta_review = {"summary": response}
         
         return meta_review
+    
+    async def review_top(
+        self,
+        ranked_hypotheses: List[Dict[str, Any]],
+        reflections: List[Any],
+        sample_size: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Meta-review the reflections on the `sample_size` top-ranked hypotheses
+        
+        Reflections are matched to hypotheses by content hash, so the
+        order they finished in does not matter; failed reflections
+        (exceptions from a gather) are skipped.
+        """
+        by_key = {}
+        for reflection in reflections:
+            if isinstance(reflection, BaseException):
+                self.logger.warning(f"Leaving a failed reflection out of the meta-review: {reflection}")
+                continue
+            by_key[content_key(reflection.get("hypothesis", {}))] = reflection
+        sample = [
+            by_key[content_key(hypothesis)] for hypothesis in ranked_hypotheses
+            if content_key(hypothesis) in by_key
+        ][:sample_size]
+        return await self.review(
+            hypotheses=[reflection.get("hypothesis", {}) for reflection in sample],
+            reflections=sample
+        )
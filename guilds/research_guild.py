@@ -4,11 +4,37 @@ Implements the "Generate, Debate, Evolve" workflow from AI co-scientist
 """
 import asyncio
 import json
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from agents.base_agent import BaseAgent
 
 
+class EvolutionIsland:
+    """One sub-population evolving with its own sub-agents, ratings and convergence state"""
+    
+    def __init__(
+        self,
+        island_id: int,
+        agents: Dict[str, Any],
+        population: List[Dict[str, Any]],
+        ledger: Any,
+        convergence: Any,
+        dedup: Any
+    ):
+        self.island_id = island_id
+        self.agents = agents
+        self.population = population
+        self.ledger = ledger
+        self.convergence = convergence
+        self.dedup = dedup
+        self.top_hypotheses: List[Dict[str, Any]] = []
+        self.lineage: List[Dict[str, Any]] = []
+        self.rounds_completed = 0
+        self.stop_reason: Optional[str] = None
+        self.migrants_received = 0
+
+
 class ResearchGuild(BaseAgent):
     """
     Guild coordinating all research agents for hypothesis development
@@ -18,20 +44,25 @@ class ResearchGuild(BaseAgent):
         super().__init__(name, agent_id, config, shared_memory)
         self.mcp_manager = mcp_manager
         self.sub_agents = {}
+        self.literature = None
         self._initialize_sub_agents()
     
     def _initialize_sub_agents(self):
         """Initialize all research sub-agents"""
         from guilds.research.hypothesis_generator import HypothesisGenerator
-        from guilds.research.hypothesis_reflector import HypothesisReflector
-        from guilds.research.hypothesis_ranker import HypothesisRanker
-        from guilds.research.hypothesis_evolver import HypothesisEvolver
-        from guilds.research.meta_reviewer import MetaReviewer
+        from guilds.research.literature import LiteratureGatherer
+        from guilds.research.research_agents import (
+            HypothesisReflector, HypothesisRanker, HypothesisEvolver, MetaReviewer
+        )
+        
+        # One gatherer for the generator and the literature review, so a topic is fetched once
+        self.literature = LiteratureGatherer.from_config(self.mcp_manager, self.config)
         
         self.sub_agents = {
             "generator": HypothesisGenerator(
                 "HypothesisGenerator", f"{self.agent_id}.generator",
-                self.config, self.shared_memory, self.mcp_manager
+                self.config, self.shared_memory, self.mcp_manager,
+                literature=self.literature
             ),
             "reflector": HypothesisReflector(
                 "HypothesisReflector", f"{self.agent_id}.reflector",
@@ -80,81 +111,138 @@ class ResearchGuild(BaseAgent):
         
         return result
     
+    def _create_islands(self, initial_hypotheses: List[Dict[str, Any]], num_islands: int) -> List[EvolutionIsland]:
+        """Split the initial hypotheses round-robin into islands with their own sub-agents"""
+        from guilds.research.research_agents import (
+            RatingLedger, HypothesisReflector, HypothesisRanker, HypothesisEvolver, MetaReviewer
+        )
+        from guilds.research.convergence import ConvergenceMonitor
+        from guilds.research.dedup import NearDuplicateFilter
+        
+        islands = []
+        for island_id in range(num_islands):
+            if island_id == 0:
+                agents = self.sub_agents
+            else:
+                prefix = f"{self.agent_id}.island{island_id}"
+                agents = {
+                    role: agent_class(name, f"{prefix}.{role}", self.config, self.shared_memory, self.mcp_manager)
+                    for role, agent_class, name in (
+                        ("reflector", HypothesisReflector, "HypothesisReflector"),
+                        ("ranker", HypothesisRanker, "HypothesisRanker"),
+                        ("evolver", HypothesisEvolver, "HypothesisEvolver"),
+                        ("meta_reviewer", MetaReviewer, "MetaReviewer")
+                    )
+                }
+            islands.append(EvolutionIsland(
+                island_id=island_id,
+                agents=agents,
+                population=initial_hypotheses[island_id::num_islands],
+                # Ratings persist across rounds; survivors are not re-ranked from scratch
+                ledger=RatingLedger(),
+                convergence=ConvergenceMonitor.from_config(self.config),
+                dedup=NearDuplicateFilter.from_config(self.config)
+            ))
+        return islands
+    
     async def _evolve_hypotheses(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Implement the Generate-Debate-Evolve loop
+        
+        With more than one island, independent sub-populations evolve
+        concurrently (sharing the LLM scheduler) and their top hypotheses
+        migrate to the next island every `migration_interval` rounds.
         """
         self.logger.info("🔄 Starting hypothesis evolution loop")
         
+        from guilds.research.dedup import NearDuplicateFilter
+        
+        islands_config = self.config.get("hypothesis", {}).get("islands", {})
         initial_hypotheses = task.get("initial_hypotheses", [])
         num_rounds = task.get("num_rounds", 3)
+        num_islands = max(1, min(task.get("num_islands", islands_config.get("count", 1)),
+                                 len(initial_hypotheses) or 1))
+        migration_interval = islands_config.get("migration_interval", 2)
+        
+        hypothesis_config = self.config.get("hypothesis", {})
+        if (hypothesis_config.get("early_stopping", {}).get("enabled", True)
+                and not hypothesis_config.get("carry_survivors", True)):
+            self.logger.warning(
+                "Early stopping needs hypothesis.carry_survivors (without survivors every "
+                f"round's top-k is new); running all {num_rounds} rounds"
+            )
+        
+        islands = self._create_islands(initial_hypotheses, num_islands)
+        if num_islands > 1:
+            self.logger.info(f"Evolving {num_islands} islands of ~{len(initial_hypotheses) // num_islands} hypotheses")
         
-        current_hypotheses = initial_hypotheses
         evolution_history = []
+        memory_writes = []
         
         for round_num in range(num_rounds):
+            active = [island for island in islands if not island.stop_reason]
+            if not active:
+                break
             self.logger.info(f"Round {round_num + 1}/{num_rounds}")
             
-            # Step 1: Reflect on hypotheses
-            reflection_tasks = [
-                self.sub_agents["reflector"].reflect(hypothesis)
-                for hypothesis in current_hypotheses
-            ]
-            reflections = await asyncio.gather(*reflection_tasks)
+            round_summaries = await asyncio.gather(*(
+                self._evolution_round(island, round_num, tag_island=num_islands > 1)
+                for island in active
+            ))
+            evolution_history.extend(round_summaries)
             
-            # Step 2: Rank hypotheses through debate
-            ranking_result = await self.sub_agents["ranker"].rank_hypotheses(
-                hypotheses=current_hypotheses,
-                reflections=reflections
-            )
-            
-            ranked_hypotheses = ranking_result.get("ranked_hypotheses", [])
-            
-            # Step 3: Meta-review to find common issues
-            meta_review = await self.sub_agents["meta_reviewer"].review(
-                hypotheses=ranked_hypotheses,
-                reflections=reflections
-            )
-            
-            # Step 4: Evolve top hypotheses
-            top_hypotheses = ranked_hypotheses[:3]  # Top 3
-            evolution_result = await self.sub_agents["evolver"].evolve(
-                hypotheses=top_hypotheses,
-                meta_feedback=meta_review
-            )
-            
-            evolved_hypotheses = evolution_result.get("evolved_hypotheses", [])
+            # Store in shared memory (in the background; the next round does not wait on it)
+            for island, round_summary in zip(active, round_summaries):
+                memory_writes.append(asyncio.ensure_future(self.store_in_memory(
+                    content=json.dumps(round_summary, indent=2),
+                    metadata={
+                        "type": "evolution_round",
+                        "round": round_num + 1,
+                        "island": island.island_id,
+                        "guild": "research"
+                    },
+                    collection="research_artifacts"
+                )))
             
-            # Store round results
-            round_summary = {
-                "round": round_num + 1,
-                "input_count": len(current_hypotheses),
-                "output_count": len(evolved_hypotheses),
-                "top_hypothesis": evolved_hypotheses[0] if evolved_hypotheses else None,
-                "meta_review": meta_review
-            }
-            evolution_history.append(round_summary)
-            
-            # Update current hypotheses for next round
-            current_hypotheses = evolved_hypotheses
-            
-            # Store in shared memory
-            await self.store_in_memory(
-                content=json.dumps(round_summary, indent=2),
-                metadata={
-                    "type": "evolution_round",
-                    "round": round_num + 1,
-                    "guild": "research"
-                },
-                collection="research_artifacts"
-            )
+            if num_islands > 1 and migration_interval and (round_num + 1) % migration_interval == 0:
+                self._migrate([island for island in islands if not island.stop_reason])
+        
+        await asyncio.gather(*memory_writes)
+        
+        rounds_completed = max(island.rounds_completed for island in islands)
+        if num_islands > 1:
+            # Each island's survivors lead its population; interleave them so the best of every island comes first
+            merged = []
+            for position in range(max(len(island.population) for island in islands)):
+                merged.extend(
+                    island.population[position] for island in islands if position < len(island.population)
+                )
+            final_hypotheses, _ = NearDuplicateFilter.from_config(self.config).collapse(merged)
+        else:
+            final_hypotheses = islands[0].population
         
         final_result = {
             "success": True,
-            "final_hypotheses": current_hypotheses,
-            "rounds_completed": num_rounds,
+            "final_hypotheses": final_hypotheses,
+            "rounds_completed": rounds_completed,
+            "stopped_early": rounds_completed < num_rounds,
+            "stop_reason": islands[0].stop_reason if num_islands == 1 else (
+                "all islands converged" if all(island.stop_reason for island in islands) else None
+            ),
+            "lineage": [merge for island in islands for merge in island.lineage],
             "evolution_history": evolution_history
         }
+        if num_islands > 1:
+            final_result["islands"] = [
+                {
+                    "island": island.island_id,
+                    "rounds_completed": island.rounds_completed,
+                    "stop_reason": island.stop_reason,
+                    "migrants_received": island.migrants_received,
+                    "population": len(island.population)
+                }
+                for island in islands
+            ]
         
         # Store final hypotheses
         await self.store_in_memory(
@@ -162,26 +250,160 @@ class ResearchGuild(BaseAgent):
             metadata={
                 "type": "final_hypotheses",
                 "guild": "research",
-                "rounds": num_rounds
+                "rounds": rounds_completed
             },
             collection="research_artifacts"
         )
         
         return final_result
     
+    def _migrate(self, islands: List[EvolutionIsland]):
+        """Copy each island's top hypotheses to the next island (ring topology)"""
+        if len(islands) < 2:
+            return
+        migrants_per_island = self.config.get("hypothesis", {}).get("islands", {}).get("migrants", 1)
+        outgoing = [island.top_hypotheses[:migrants_per_island] for island in islands]
+        for index, island in enumerate(islands):
+            arrivals = outgoing[index - 1]
+            island.population = island.population + arrivals
+            island.migrants_received += len(arrivals)
+        self.logger.info(f"Migrated {migrants_per_island} hypotheses between {len(islands)} islands")
+    
+    async def _evolution_round(
+        self,
+        island: EvolutionIsland,
+        round_num: int,
+        tag_island: bool = False
+    ) -> Dict[str, Any]:
+        """One pipelined reflect + rank / meta-review / evolve round of an island"""
+        from guilds.research.research_agents import RatingLedger
+        
+        carry_survivors = self.config.get("hypothesis", {}).get("carry_survivors", True)
+        agents = island.agents
+        round_started = time.monotonic()
+        timings = {}
+        
+        # Collapse paraphrases so each idea is reflected on and ranked once
+        candidate_count = len(island.population)
+        current_hypotheses, clusters = island.dedup.collapse(island.population)
+        merges = [
+            {
+                "round": round_num + 1,
+                "representative_key": RatingLedger.key(cluster["representative"]),
+                "representative": cluster["representative"].get("statement", ""),
+                "merged": [hypothesis.get("statement", "") for hypothesis in cluster["merged"]],
+                "similarity": cluster["similarity"]
+            }
+            for cluster in clusters
+        ]
+        island.lineage.extend(merges)
+        if merges:
+            self.logger.info(
+                f"Collapsed {candidate_count} hypotheses into {len(current_hypotheses)} "
+                f"({len(merges)} near-duplicate clusters)"
+            )
+        
+        async def timed(stage: str, step):
+            started = time.monotonic()
+            result = await step
+            timings[stage] = {
+                "start": round(started - round_started, 3),
+                "end": round(time.monotonic() - round_started, 3)
+            }
+            return result
+        
+        # Step 1: Reflect on hypotheses (running; later steps consume them as they land)
+        reflection_tasks = [
+            asyncio.ensure_future(agents["reflector"].reflect(hypothesis))
+            for hypothesis in current_hypotheses
+        ]
+        # A failed reflection does not fail the round: ranking judges its hypothesis
+        # without a critique and the meta-review skips it
+        all_reflections = asyncio.ensure_future(timed(
+            "reflect", asyncio.gather(*reflection_tasks, return_exceptions=True)
+        ))
+        
+        # Step 2: Rank hypotheses through debate, starting matches as reflection pairs land
+        ranking_result = await timed("rank", agents["ranker"].rank_hypotheses(
+            hypotheses=current_hypotheses,
+            reflections=reflection_tasks,
+            ledger=island.ledger
+        ))
+        reflections = await all_reflections
+        
+        ranked_hypotheses = ranking_result.get("ranked_hypotheses", [])
+        
+        # Step 3: Meta-review the critiques of the top-ranked hypotheses (matched by content hash)
+        meta_review = await timed("meta_review", agents["meta_reviewer"].review_top(
+            ranked_hypotheses, reflections
+        ))
+        
+        # Step 4: Evolve top hypotheses
+        top_hypotheses = ranked_hypotheses[:3]  # Top 3
+        evolution_result = await timed("evolve", agents["evolver"].evolve(
+            hypotheses=top_hypotheses,
+            meta_feedback=meta_review
+        ))
+        
+        evolved_hypotheses = evolution_result.get("evolved_hypotheses", [])
+        island.rounds_completed = round_num + 1
+        island.top_hypotheses = top_hypotheses
+        
+        ranked_keys = [RatingLedger.key(hypothesis) for hypothesis in ranked_hypotheses]
+        convergence_report = island.convergence.observe(
+            ranked_keys, {key: island.ledger.rating(key) for key in ranked_keys}
+        )
+        island.stop_reason = convergence_report["stop_reason"]
+        timings["round_seconds"] = round(time.monotonic() - round_started, 3)
+        label = f"Island {island.island_id} round" if tag_island else "Round"
+        self.logger.info(
+            f"{label} {round_num + 1} took {timings['round_seconds']}s "
+            f"(reflect {timings['reflect']['end']}s, rank {timings['rank']['end']}s, "
+            f"meta-review {timings['meta_review']['end']}s, evolve done {timings['evolve']['end']}s)"
+        )
+        
+        # Store round results
+        round_summary = {
+            "round": round_num + 1,
+            "input_count": len(current_hypotheses),
+            "duplicates_removed": candidate_count - len(current_hypotheses),
+            "deduplicated": merges,
+            "output_count": len(evolved_hypotheses),
+            "ranking_comparisons": ranking_result.get("comparisons", 0),
+            "ranking_llm_calls": ranking_result.get("llm_calls", 0),
+            "top_hypothesis": evolved_hypotheses[0] if evolved_hypotheses else None,
+            "meta_review": meta_review,
+            "timings": timings,
+            "convergence": convergence_report
+        }
+        if tag_island:
+            round_summary["island"] = island.island_id
+        
+        # Update current hypotheses for next round (carried survivors keep their ratings)
+        if carry_survivors:
+            survivor_keys = {RatingLedger.key(hypothesis) for hypothesis in top_hypotheses}
+            island.population = top_hypotheses + [
+                hypothesis for hypothesis in evolved_hypotheses
+                if RatingLedger.key(hypothesis) not in survivor_keys
+            ]
+        else:
+            island.population = evolved_hypotheses
+        
+        if island.stop_reason:
+            scope = f"island {island.island_id}" if tag_island else "evolution"
+            self.logger.info(f"Stopping {scope} after round {round_num + 1}: {island.stop_reason}")
+        return round_summary
+    
     async def _conduct_literature_review(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Conduct literature review using arXiv and web search"""
         self.logger.info("📚 Conducting literature review")
         
         query = task.get("query", "")
         
-        # Search arXiv
-        arxiv_mcp = self.mcp_manager.get_mcp("arxiv")
-        papers = await arxiv_mcp.execute(query=query, max_results=10)
-        
-        # Search web
-        web_search_mcp = self.mcp_manager.get_mcp("web_search")
-        web_results = await web_search_mcp.execute(query=query, max_results=5)
+        # Search arXiv and the web concurrently (reusing the generator's fetch for the same topic)
+        literature = await self.literature.gather(query, max_papers=10, max_web_results=5)
+        papers = literature["papers"]
+        web_results = literature["web_results"]
         
         # Synthesize findings using LLM
         llm = self.mcp_manager.get_mcp("llm_anthropic")
@@ -204,13 +426,16 @@ Format as structured JSON."""
         
         synthesis = await llm.execute(
             messages=[{"role": "user", "content": synthesis_prompt}],
-            system="You are a research assistant specialized in multimodal AI and computational arts."
+            system="You are a research assistant specialized in multimodal AI and computational arts.",
+            task_type="literature_synthesis",
+            agent_id=self.agent_id
         )
         
         result = {
             "success": True,
             "papers_found": len(papers),
             "web_results_found": len(web_results),
+            "sources": literature["sources"],
             "synthesis": synthesis
         }
         
@@ -234,4 +459,6 @@ Format as structured JSON."""
             name: agent.get_status()
             for name, agent in self.sub_agents.items()
         }
+        status["reflection_cache"] = self.sub_agents["reflector"].get_cache_stats()
+        status["literature"] = self.literature.get_stats()
         return status
@@ -56,8 +56,12 @@ async def main():
     config['apis']['anthropic'].update(env_config.get_model_config())
     config['apis']['google'].update(env_config.get_model_config())
     config['agents']['supervisor'] = env_config.get_supervisor_config()
-    config['agents']['research_guild'] = env_config.get_research_config()
-    config['failure_recovery'] = env_config.get_failure_recovery_config()
+    config.setdefault('llm_scheduler', {}).update(env_config.get_scheduler_config())
+    config.setdefault('llm_cache', {}).update(env_config.get_cache_config())
+    research_config = config['agents'].setdefault('research_guild', {})
+    for section, values in env_config.get_research_config().items():
+        research_config.setdefault(section, {}).update(values)
+    config.setdefault('failure_recovery', {}).update(env_config.get_failure_recovery_config())
     config['human_approval'] = env_config.get_human_approval_config()
     config['vector_db']['persist_directory'] = env_config.VECTOR_DB_PATH
     
@@ -162,6 +166,17 @@ async def main():
         console.print(f"\n[red]❌ Error: {e}[/red]")
         logger.exception("Fatal error during orchestration")
     
+    # Per-run LLM token/cost report (also written for failed or interrupted runs)
+    usage_totals = mcp_manager.get_usage_summary()["totals"]
+    summary_path = mcp_manager.usage.write_summary()
+    console.print(
+        f"\n💰 LLM usage: {usage_totals['calls']} calls, "
+        f"{usage_totals['input_tokens']:,} in / {usage_totals['output_tokens']:,} out tokens, "
+        f"${usage_totals['cost_usd']:.4f}"
+    )
+    if summary_path:
+        console.print(f"   Usage report: {summary_path}")
+    
     console.print("\n[dim]Shutting down...[/dim]")
 
 
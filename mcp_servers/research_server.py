@@ -61,6 +61,11 @@ class ResearchGuildMCPServer(SupervisorMCPServer):
                             "type": "integer",
                             "description": "Number of evolution rounds",
                             "default": 3
+                        },
+                        "num_islands": {
+                            "type": "integer",
+                            "description": "Independent sub-populations evolved concurrently (island model)",
+                            "default": 1
                         }
                     }
                 }
@@ -125,7 +130,8 @@ class ResearchGuildMCPServer(SupervisorMCPServer):
                 result = await self.agent_instance.execute_task({
                     "type": "evolve_hypotheses",
                     "initial_hypotheses": gen_result.get('hypotheses', []),
-                    "num_rounds": arguments.get("num_rounds", 3)
+                    "num_rounds": arguments.get("num_rounds", 3),
+                    "num_islands": arguments.get("num_islands", 1)
                 })
                 
                 response = f"🔄 Hypothesis Evolution Complete\n\n"
@@ -39,7 +39,12 @@ class SupervisorMCPServer(BaseMCPServer):
         # Override with env vars
         config['apis']['anthropic'].update(env_config.get_model_config())
         config['agents']['supervisor'] = env_config.get_supervisor_config()
-        config['agents']['research_guild'] = env_config.get_research_config()
+        config.setdefault('llm_scheduler', {}).update(env_config.get_scheduler_config())
+        config.setdefault('llm_cache', {}).update(env_config.get_cache_config())
+        config.setdefault('failure_recovery', {}).update(env_config.get_failure_recovery_config())
+        research_config = config['agents'].setdefault('research_guild', {})
+        for section, values in env_config.get_research_config().items():
+            research_config.setdefault(section, {}).update(values)
         config['git'] = {
             "repo_path": ".",
             "git_user_name": env_config.GIT_USER_NAME,
@@ -119,6 +124,14 @@ class SupervisorMCPServer(BaseMCPServer):
                     "properties": {}
                 }
             },
+            {
+                "name": "get_usage_report",
+                "description": "LLM tokens, cost and latency for this run, by guild and task type",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            },
             {
                 "name": "monitor_progress",
                 "description": "Check progress and detect any bottlenecks",
@@ -201,8 +214,40 @@ class SupervisorMCPServer(BaseMCPServer):
                 if status['project_state'].get('blockers'):
                     status_text += f"\n⚠️ Blockers: {len(status['project_state']['blockers'])}\n"
                 
+                usage_totals = status['llm_usage']['totals']
+                status_text += (
+                    f"\nLLM usage: {usage_totals['calls']} calls, "
+                    f"${usage_totals['cost_usd']:.4f}\n"
+                )
+                
                 return format_tool_response(status_text)
             
+            elif tool_name == "get_usage_report":
+                usage = self.mcp_manager.get_usage_summary()
+                summary_path = self.mcp_manager.usage.write_summary()
+                
+                def usage_line(name: str, rollup: Dict[str, Any]) -> str:
+                    return (
+                        f"  • {name}: {rollup['calls']} calls, "
+                        f"{rollup['input_tokens']:,} in / {rollup['output_tokens']:,} out, "
+                        f"${rollup['cost_usd']:.4f}, avg {rollup['avg_latency_seconds']:.1f}s\n"
+                    )
+                
+                totals = usage['totals']
+                response = f"💰 LLM Usage (run {usage['run_id']})\n\n"
+                response += usage_line("total", totals)
+                response += f"  Cache hits: {totals['cache_hits']}, coalesced: {totals['coalesced']}, errors: {totals['errors']}\n"
+                response += f"\nBy guild:\n"
+                for guild_name, rollup in usage['by_guild'].items():
+                    response += usage_line(guild_name, rollup)
+                response += f"\nBy task type:\n"
+                for task_type, rollup in usage['by_task_type'].items():
+                    response += usage_line(task_type, rollup)
+                if summary_path:
+                    response += f"\nReport: {summary_path}\n"
+                
+                return format_tool_response(response)
+            
             elif tool_name == "monitor_progress":
                 result = await self.agent_instance.monitor_progress()
                 
@@ -2,6 +2,7 @@
 Git MCP - Model Context Protocol for Git and GitHub operations
 """
 import os
+import asyncio
 import subprocess
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -389,8 +390,10 @@ class GitHubMCP(BaseMCP):
                 "Accept": "application/vnd.github.v3+json"
             }
             
-            response = requests.get(
-                "https://api.github.com/user",
+            # /rate_limit does not count against the rate limit; run off the event loop
+            response = await asyncio.to_thread(
+                requests.get,
+                "https://api.github.com/rate_limit",
                 headers=headers,
                 timeout=5
             )
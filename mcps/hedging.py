@@ -0,0 +1,161 @@
+"""
+Hedged Requests - Cut LLM tail latency on the critical path
+When a call runs past the observed p90 latency for its task type, a
+duplicate is sent (to the same or another provider) and the first
+response wins; a budget caps how many extra calls hedging may add
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of `values` (0 < fraction <= 1)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class TaskLatency:
+    """Recent latencies for one task type"""
+
+    def __init__(self, window: int):
+        # Latency of the first attempt alone (a lower bound when a hedge won and it was cancelled)
+        self.primary: Deque[float] = deque(maxlen=window)
+        # Latency the caller actually saw
+        self.observed: Deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class HedgingPolicy:
+    """
+    Decides when to hedge a call and keeps per-task latency statistics
+
+    Hedging only starts once `min_samples` latencies have been seen for a
+    task type, and is limited to `budget_ratio` extra calls per request.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 0.9,
+        min_samples: int = 20,
+        budget_ratio: float = 0.05,
+        window: int = 500
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.budget_ratio = budget_ratio
+        self.window = window
+        self.requests = 0
+        self.hedges = 0
+        self._tasks: Dict[str, TaskLatency] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "HedgingPolicy":
+        """Build from the `llm_hedging` section of the system config"""
+        hedging_config = config.get("llm_hedging", {})
+        return cls(
+            enabled=hedging_config.get("enabled", False),
+            percentile=hedging_config.get("percentile", 0.9),
+            min_samples=hedging_config.get("min_samples", 20),
+            budget_ratio=hedging_config.get("budget_ratio", 0.05),
+            window=hedging_config.get("window", 500)
+        )
+
+    def _task(self, task_type: str) -> TaskLatency:
+        if task_type not in self._tasks:
+            self._tasks[task_type] = TaskLatency(self.window)
+        return self._tasks[task_type]
+
+    def hedge_delay(self, task_type: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None if this task should not be hedged yet"""
+        if not self.enabled:
+            return None
+        task = self._task(task_type)
+        if len(task.primary) < self.min_samples:
+            return None
+        return percentile(list(task.primary), self.percentile)
+
+    def try_acquire_hedge(self) -> bool:
+        """Spend one hedge if that keeps extra calls within the budget"""
+        if self.hedges + 1 > self.budget_ratio * self.requests:
+            return False
+        self.hedges += 1
+        return True
+
+    async def run(
+        self,
+        task_type: str,
+        primary_call: Callable[[], Awaitable[Any]],
+        hedge_call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run `primary_call`, hedging with `hedge_call` if it is slow; first success wins"""
+        task = self._task(task_type)
+        task.requests += 1
+        self.requests += 1
+        delay = self.hedge_delay(task_type)
+        started = time.monotonic()
+
+        primary = asyncio.ensure_future(primary_call())
+        running = [primary]
+        primary_latency: Optional[float] = None
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self.try_acquire_hedge():
+                    task.hedges += 1
+                    running.append(asyncio.ensure_future(hedge_call()))
+
+            error: Optional[BaseException] = None
+            pending = set(running)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if primary in done:
+                    primary_latency = time.monotonic() - started
+                for finished in done:
+                    if finished.exception() is None:
+                        if finished is not primary:
+                            task.hedge_wins += 1
+                        return finished.result()
+                    error = error or finished.exception()
+            raise error
+        finally:
+            for call in running:
+                if not call.done():
+                    call.cancel()
+                elif not call.cancelled():
+                    call.exception()  # Mark the loser's error as retrieved
+            task.primary.append(primary_latency if primary_latency is not None
+                                else time.monotonic() - started)
+            task.observed.append(time.monotonic() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """p50/p99 of first-attempt vs. observed latency per task type, plus hedge counts"""
+        tasks = {}
+        for task_type, task in self._tasks.items():
+            primary, observed = list(task.primary), list(task.observed)
+            tasks[task_type] = {
+                "requests": task.requests,
+                "hedges": task.hedges,
+                "hedge_wins": task.hedge_wins,
+                "hedge_after_seconds": percentile(primary, self.percentile),
+                "unhedged_p50_seconds": percentile(primary, 0.5),
+                "unhedged_p99_seconds": percentile(primary, 0.99),
+                "observed_p50_seconds": percentile(observed, 0.5),
+                "observed_p99_seconds": percentile(observed, 0.99)
+            }
+        return {
+            "enabled": self.enabled,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "extra_call_ratio": self.hedges / self.requests if self.requests else 0.0,
+            "budget_ratio": self.budget_ratio,
+            "tasks": tasks
+        }
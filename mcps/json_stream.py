@@ -0,0 +1,128 @@
+"""
+Incremental JSON parsing for streamed LLM output
+Yields the items of a top-level JSON array as soon as each one is complete,
+so downstream stages can start on early hypotheses while the tail generates
+"""
+import re
+import json
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+
+# The array must open the reply or directly follow a ``` fence; brackets in prose are not arrays
+_ARRAY_START = re.compile(r"\A\s*\[|```[\w-]*\s*\[")
+
+
+class JSONArrayStreamParser:
+    """
+    Feed text deltas in, get completed top-level array items out
+
+    The array has to open the reply or follow a ```json fence (prose before
+    the fence is skipped); a reply without one yields nothing. Items that
+    fail to parse or that `accept` rejects are counted in `skipped` rather
+    than raised.
+    """
+
+    def __init__(self, accept: Optional[Callable[[Any], bool]] = None):
+        self.accept = accept
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start = None
+        self.items_parsed = 0
+        self.skipped = 0
+
+    @property
+    def finished(self) -> bool:
+        """True once the closing bracket of the array has been seen"""
+        return self._finished
+
+    def feed(self, delta: str) -> List[Any]:
+        """Consume a text delta; returns any array items completed by it"""
+        if self._finished:
+            return []
+
+        self._buffer += delta
+        completed = []
+
+        if not self._started:
+            match = _ARRAY_START.search(self._buffer)
+            if match is None:
+                return completed
+            self._started = True
+            self._depth = 1
+            self._pos = match.end()
+
+        while self._pos < len(self._buffer) and not self._finished:
+            char = self._buffer[self._pos]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                self._pos += 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._mark_item_start()
+            elif char in "[{":
+                self._mark_item_start()
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(completed)
+                    self._finished = True
+            elif char == "," and self._depth == 1:
+                self._emit(completed)
+            elif not char.isspace():
+                self._mark_item_start()
+
+            self._pos += 1
+
+        # Drop consumed text so long streams do not grow the buffer unbounded
+        keep_from = self._item_start if self._item_start is not None else self._pos
+        self._buffer = self._buffer[keep_from:]
+        self._pos -= keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+
+        return completed
+
+    def _mark_item_start(self):
+        if self._depth == 1 and self._item_start is None:
+            self._item_start = self._pos
+
+    def _emit(self, completed: List[Any]):
+        if self._item_start is None:
+            return
+        raw = self._buffer[self._item_start:self._pos].strip()
+        self._item_start = None
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            self.skipped += 1
+            return
+        if self.accept is not None and not self.accept(item):
+            self.skipped += 1
+            return
+        completed.append(item)
+        self.items_parsed += 1
+
+
+async def iter_json_array(
+    deltas: AsyncIterator[str],
+    accept: Optional[Callable[[Any], bool]] = None
+) -> AsyncIterator[Any]:
+    """Yield items of the JSON array carried by a stream of text deltas"""
+    parser = JSONArrayStreamParser(accept)
+    async for delta in deltas:
+        for item in parser.feed(delta):
+            yield item
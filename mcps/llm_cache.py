@@ -0,0 +1,227 @@
+"""
+LLM Response Cache - Content-addressed, SQLite-backed store of completions
+Lets crashed or repeated runs replay identical LLM requests for free
+"""
+import os
+import json
+import time
+import sqlite3
+import heapq
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+
+CACHE_MODES = ("read_write", "read_only", "replay", "off")
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a request has no cached response"""
+
+
+class LLMResponseCache:
+    """
+    On-disk LLM response cache with size-based LRU eviction
+
+    Modes:
+        read_write: serve hits, store new responses (default)
+        read_only:  serve hits, never write; misses go upstream
+        replay:     serve hits, never write; misses raise LLMCacheMiss
+        off:        bypass the cache entirely
+
+    Sampled requests (temperature > 0, no seed) are only cached when
+    `cache_sampled` is set or in replay mode; otherwise every sampled
+    call goes upstream so repeated runs keep their diversity.
+    """
+
+    def __init__(
+        self,
+        path: str = "./data/llm_cache.sqlite",
+        max_size_mb: float = 512,
+        mode: str = "read_write",
+        cache_sampled: bool = False,
+        logger: Optional[logging.Logger] = None
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode} (expected one of {CACHE_MODES})")
+
+        self.path = path
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.mode = mode
+        self.cache_sampled = cache_sampled
+        self.logger = logger or logging.getLogger("LLMResponseCache")
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        # Occurrence counters so repeated sampling calls map to distinct entries
+        self._occurrences: Dict[str, int] = {}
+        # Occurrences handed back by calls that failed before storing a response
+        self._released: Dict[str, List[int]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMResponseCache":
+        """Build cache from the `llm_cache` section of the system config"""
+        cache_config = config.get("llm_cache", {})
+        return cls(
+            path=cache_config.get("path", "./data/llm_cache.sqlite"),
+            max_size_mb=cache_config.get("max_size_mb", 512),
+            mode=cache_config.get("mode", "read_write"),
+            cache_sampled=cache_config.get("cache_sampled", False)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT, "
+                "size INTEGER, created_at REAL, last_access REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def request_key(
+        model: str,
+        system: Optional[str],
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        seed: Optional[Any] = None
+    ) -> str:
+        """Content hash identifying an LLM request"""
+        payload = json.dumps(
+            {
+                "model": model,
+                "system": system or "",
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "seed": seed
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def entry_key(self, request_key: str, temperature: Optional[float], seed: Optional[Any] = None) -> Optional[str]:
+        """
+        Map a request to its cache slot, or None when it should not be cached
+
+        Deterministic requests (temperature 0 or an explicit seed) share one
+        slot. Sampled requests, including temperature None (the provider
+        default), are cached only when `cache_sampled` is set (or in replay
+        mode) and then get one slot per occurrence in this process, so asking
+        the same question three times replays three distinct answers.
+        A call that fails must hand its slot back with release().
+        """
+        # Same rule as FA_project/project/response_cache.py make_key(); keep them in step
+        if seed is not None or temperature == 0:
+            return request_key
+        if not (self.cache_sampled or self.mode == "replay"):
+            return None
+        released = self._released.get(request_key)
+        if released:
+            occurrence = heapq.heappop(released)
+        else:
+            occurrence = self._occurrences.get(request_key, 0)
+            self._occurrences[request_key] = occurrence + 1
+        return f"{request_key}:{occurrence}"
+
+    def release(self, key: str):
+        """Return the occurrence of a call that stored nothing, so its retry reuses the slot"""
+        request_key, separator, occurrence = key.rpartition(":")
+        if separator:
+            heapq.heappush(self._released.setdefault(request_key, []), int(occurrence))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached response for `key`, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        conn = self._connect()
+        row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            if self.mode == "replay":
+                raise LLMCacheMiss(f"No cached response for request {key[:12]}")
+            return None
+
+        self.hits += 1
+        if self.mode == "read_write":
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return row[0]
+
+    def put(self, key: str, response: str, model: str = ""):
+        """Store a response (no-op unless in read_write mode)"""
+        if self.mode != "read_write":
+            return
+
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, model, response, len(response.encode("utf-8")), now, now)
+        )
+        conn.commit()
+        self.writes += 1
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until under the size budget"""
+        conn = self._connect()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        conn.commit()
+        self.evictions += len(evicted)
+        self.logger.debug(f"Evicted {len(evicted)} cached responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current footprint"""
+        entries, size = 0, 0
+        if self.enabled and (self._conn is not None or os.path.exists(self.path)):
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
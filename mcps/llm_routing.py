@@ -0,0 +1,63 @@
+"""
+LLM Routing - Task-aware model selection and output-token budgets
+Each task type (rank, reflect, evolve, ...) maps to a route that picks the
+model per provider plus max_tokens and temperature, so cheap high-volume
+calls go to a fast model with a tiny budget
+"""
+from typing import Any, Dict, Optional
+
+
+ROUTED_PARAMS = ("max_tokens", "temperature")
+
+
+class TaskRouter:
+    """
+    Per-task-type request defaults
+
+    A route looks like:
+        rank:
+          models: {anthropic: claude-haiku-4-5, google: gemini-2.0-flash-lite-001}
+          max_tokens: 5
+          temperature: 0.0
+
+    Routes only fill in parameters the caller did not pass explicitly.
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Dict[str, Any]]] = None, enabled: bool = True):
+        self.enabled = enabled
+        self.routes = routes or {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TaskRouter":
+        """Build from the `llm_routing` section of the system config"""
+        routing_config = config.get("llm_routing", {})
+        return cls(
+            routes=routing_config.get("routes", {}),
+            enabled=routing_config.get("enabled", True)
+        )
+
+    def route(self, task_type: str, provider: str) -> Dict[str, Any]:
+        """Request parameters (model, max_tokens, temperature) for a task type on a provider"""
+        if not self.enabled:
+            return {}
+        route = self.routes.get(task_type) or self.routes.get("default") or {}
+        params = {name: route[name] for name in ROUTED_PARAMS if name in route}
+        model = route.get("models", {}).get(provider)
+        if model:
+            params["model"] = model
+        return params
+
+    def get_stats(self, usage_by_task: Dict[str, Any]) -> Dict[str, Any]:
+        """Each route's settings next to its observed calls, latency and cost"""
+        empty = {"calls": 0, "cost_usd": 0.0, "avg_latency_seconds": 0.0}
+        routes = {}
+        for task_type in sorted(set(self.routes) | set(usage_by_task)):
+            usage = usage_by_task.get(task_type, empty)
+            routes[task_type] = {
+                "route": self.routes.get(task_type, {}),
+                "calls": usage["calls"],
+                "output_tokens": usage.get("output_tokens", 0),
+                "cost_usd": usage["cost_usd"],
+                "avg_latency_seconds": usage["avg_latency_seconds"]
+            }
+        return {"enabled": self.enabled, "routes": routes}
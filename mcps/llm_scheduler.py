@@ -0,0 +1,209 @@
+"""
+LLM Scheduler - Central admission control for every LLM call
+Enforces a global concurrency cap plus per-provider request/token budgets,
+queueing excess calls instead of letting them burst into provider 429s
+"""
+import asyncio
+import time
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class TokenBucket:
+    """Continuously refilled budget expressed as units per minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until `amount` units are available; returns seconds waited"""
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def adjust(self, amount: float):
+        """Debit (positive) or refund (negative) units after the fact"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class ProviderLane:
+    """Budgets, concurrency slots and counters for a single provider"""
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        self.provider = provider
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.limits = {
+            "requests_per_minute": requests_per_minute,
+            "tokens_per_minute": tokens_per_minute,
+            "max_concurrency": max_concurrency
+        }
+        self.queued = 0
+        self.admitted = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limits": self.limits,
+            "queue_depth": self.queued,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_seconds": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait_seconds": self.max_wait,
+            "total_wait_seconds": self.total_wait
+        }
+
+
+class LLMScheduler:
+    """
+    Shared scheduler that every LLMProviderMCP submits its calls through
+
+    Admission order: provider request/token budgets, then the provider's
+    concurrency slots, then the global slot pool (MAX_PARALLEL_AGENTS).
+    Calls that cannot be admitted yet wait in line rather than failing.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        provider_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.logger = logger or logging.getLogger("LLMScheduler")
+        self._global_slots = asyncio.Semaphore(self.max_concurrency)
+        self._lanes: Dict[str, ProviderLane] = {}
+
+        for provider, limits in (provider_limits or {}).items():
+            self.configure_provider(provider, **(limits or {}))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMScheduler":
+        """Build scheduler from the `llm_scheduler` section of the system config"""
+        scheduler_config = config.get("llm_scheduler", {})
+        return cls(
+            max_concurrency=scheduler_config.get("max_concurrency", 10),
+            provider_limits=scheduler_config.get("providers", {})
+        )
+
+    def configure_provider(
+        self,
+        provider: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """Set (or replace) the budgets for a provider"""
+        self._lanes[provider] = ProviderLane(
+            provider, requests_per_minute, tokens_per_minute, max_concurrency
+        )
+
+    def _lane(self, provider: str) -> ProviderLane:
+        if provider not in self._lanes:
+            self._lanes[provider] = ProviderLane(provider)
+        return self._lanes[provider]
+
+    @asynccontextmanager
+    async def admit(self, provider: str, estimated_tokens: int = 0):
+        """Hold a scheduler slot for the duration of the block (used for streaming calls)"""
+        lane = self._lane(provider)
+        enqueued_at = time.monotonic()
+        lane.queued += 1
+        admitted = False
+
+        try:
+            if lane.request_bucket:
+                await lane.request_bucket.acquire(1)
+            if lane.token_bucket and estimated_tokens:
+                await lane.token_bucket.acquire(estimated_tokens)
+            if lane.slots:
+                await lane.slots.acquire()
+            try:
+                await self._global_slots.acquire()
+            except BaseException:
+                if lane.slots:
+                    lane.slots.release()
+                raise
+            admitted = True
+        finally:
+            lane.queued -= 1
+            if not admitted:
+                lane.failed += 1
+
+        wait = time.monotonic() - enqueued_at
+        lane.total_wait += wait
+        lane.max_wait = max(lane.max_wait, wait)
+        lane.admitted += 1
+        lane.in_flight += 1
+        if wait > 1.0:
+            self.logger.debug(f"{provider} call waited {wait:.2f}s in queue")
+
+        try:
+            yield
+            lane.completed += 1
+        except BaseException:
+            lane.failed += 1
+            raise
+        finally:
+            lane.in_flight -= 1
+            self._global_slots.release()
+            if lane.slots:
+                lane.slots.release()
+
+    async def submit(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[Any]],
+        estimated_tokens: int = 0
+    ) -> Any:
+        """Queue `call` until budgets and slots allow it, then run it"""
+        async with self.admit(provider, estimated_tokens):
+            return await call()
+
+    def reconcile_tokens(self, provider: str, estimated_tokens: int, actual_tokens: int):
+        """Correct the token budget once the real usage of a call is known"""
+        lane = self._lane(provider)
+        if lane.token_bucket:
+            lane.token_bucket.adjust(actual_tokens - estimated_tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, in-flight count and wait times per provider"""
+        providers = {name: lane.get_stats() for name, lane in self._lanes.items()}
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": sum(p["queue_depth"] for p in providers.values()),
+            "in_flight": sum(p["in_flight"] for p in providers.values()),
+            "providers": providers
+        }
@@ -0,0 +1,324 @@
+"""
+Resilience - Retries, circuit breaking and provider fallback for MCP calls
+Implements the `failure_recovery` config so one transient provider error
+(a 429/529 or a dropped connection) no longer aborts a multi-hour run
+"""
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Optional
+
+from mcps.mcp_manager import BaseMCP
+
+
+# HTTP statuses worth retrying: rate limits, overload and transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a provider's circuit is open and no fallback is available"""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is likely transient"""
+    if isinstance(error, (CircuitOpenError, LookupError, ValueError, TypeError, NotImplementedError)):
+        return False
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES
+
+    # Connection resets, timeouts and SDK errors without a status code
+    return True
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Server-requested delay from a Retry-After header, if any"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Stops calling a provider after repeated failures
+
+    closed:    calls flow normally
+    open:      calls are rejected until reset_timeout has passed
+    half_open: one trial call is let through; success closes, failure reopens,
+               any other outcome (caller error, cancellation) releases the trial
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+            self._trial_in_flight = False
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def release_trial(self):
+        """End a half-open trial that proved nothing either way; the next call may try again"""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened
+        }
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent requests
+
+    Keeps a struggling provider from being hammered with retry storms: over
+    the sliding window, retries may not exceed `ratio` x requests (with a
+    small floor so low-traffic periods can still retry).
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self.exhausted = 0
+
+    def _trim(self, events: deque, now: float):
+        while events and now - events[0] > self.window:
+            events.popleft()
+
+    def record_request(self):
+        self._requests.append(time.monotonic())
+
+    def try_acquire(self) -> bool:
+        """Spend one retry if the budget allows it"""
+        now = time.monotonic()
+        self._trim(self._requests, now)
+        self._trim(self._retries, now)
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+            self.exhausted += 1
+            return False
+        self._retries.append(now)
+        return True
+
+
+class ResilientMCP(BaseMCP):
+    """
+    Wraps an MCP so every execute() call gets retries, a circuit breaker
+    and an optional fallback MCP
+
+    All other attributes (add, query, initialize, ...) are delegated to the
+    wrapped MCP unchanged.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mcp: BaseMCP,
+        config: Dict[str, Any],
+        fallback: Optional[BaseMCP] = None,
+        retry: bool = True
+    ):
+        super().__init__(config, logging.getLogger(f"Resilience.{name}"))
+        self.name = name
+        self.mcp = mcp
+        self.fallback = fallback if config.get("graceful_degradation", True) else None
+        self.max_retries = int(config.get("max_retries", 3)) if retry else 0
+        self.backoff_factor = float(config.get("backoff_factor", 2))
+        self.base_delay = float(config.get("base_delay", 1.0))
+        self.max_delay = float(config.get("max_delay", 30.0))
+
+        breaker_config = config.get("circuit_breaker", {})
+        self.breaker = CircuitBreaker(
+            failure_threshold=breaker_config.get("failure_threshold", 5),
+            reset_timeout=breaker_config.get("reset_timeout", 60.0)
+        )
+        budget_config = config.get("retry_budget", {})
+        self.budget = RetryBudget(
+            ratio=budget_config.get("ratio", 0.2),
+            min_retries=budget_config.get("min_retries", 10),
+            window=budget_config.get("window", 60.0)
+        )
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.fallbacks = 0
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for attributes not defined on the wrapper itself
+        return getattr(self.__dict__["mcp"], attr)
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when given"""
+        ceiling = min(self.max_delay, self.base_delay * (self.backoff_factor ** attempt))
+        delay = random.uniform(0, ceiling)
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    async def _should_retry(self, attempt: int, error: BaseException) -> bool:
+        """Decide on (and wait out the backoff for) another attempt"""
+        if attempt >= self.max_retries or not is_retryable(error) or not self.breaker.allow():
+            return False
+        if not self.budget.try_acquire():
+            self.logger.warning(f"{self.name}: retry budget exhausted, not retrying")
+            return False
+
+        delay = self._backoff(attempt, error)
+        self.retries += 1
+        self.logger.warning(
+            f"{self.name}: attempt {attempt + 1} failed ({type(error).__name__}: {error}); "
+            f"retrying in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    def _record_failure(self, error: BaseException):
+        # Caller errors say nothing about provider health
+        if is_retryable(error):
+            self.breaker.record_failure()
+        self.failures += 1
+
+    async def execute(self, *args, **kwargs) -> Any:
+        """Execute with retries; fall back once retries or the circuit give out"""
+        self.calls += 1
+        self.budget.record_request()
+        attempt = 0
+
+        if not self.breaker.allow():
+            error: Exception = CircuitOpenError(f"Circuit open for {self.name}")
+        else:
+            trial = self.breaker.state == "half_open"
+            try:
+                while True:
+                    try:
+                        result = await self.mcp.execute(*args, **kwargs)
+                        self.breaker.record_success()
+                        return result
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        self._record_failure(e)
+                        error = e
+                        if not await self._should_retry(attempt, e):
+                            break
+                        attempt += 1
+            finally:
+                # Non-retryable errors and cancellation record nothing; never leave the trial stuck
+                if trial:
+                    self.breaker.release_trial()
+
+        if not self._can_fall_back(error):
+            raise error
+
+        self._note_fallback(error)
+        return await self.fallback.execute(*args, **kwargs)
+
+    async def execute_stream(self, *args, **kwargs) -> AsyncIterator[str]:
+        """Stream with retries as long as nothing has been yielded yet"""
+        self.calls += 1
+        self.budget.record_request()
+        attempt = 0
+
+        if not self.breaker.allow():
+            error: Exception = CircuitOpenError(f"Circuit open for {self.name}")
+        else:
+            trial = self.breaker.state == "half_open"
+            try:
+                while True:
+                    started = False
+                    try:
+                        async for delta in self.mcp.execute_stream(*args, **kwargs):
+                            started = True
+                            yield delta
+                        self.breaker.record_success()
+                        return
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        self._record_failure(e)
+                        error = e
+                        # Partial output has already reached the caller; it cannot be replayed
+                        if started:
+                            raise
+                        if not await self._should_retry(attempt, e):
+                            break
+                        attempt += 1
+            finally:
+                # Also covers a consumer that stops iterating early (GeneratorExit)
+                if trial:
+                    self.breaker.release_trial()
+
+        if not self._can_fall_back(error):
+            raise error
+
+        self._note_fallback(error)
+        async for delta in self.fallback.execute_stream(*args, **kwargs):
+            yield delta
+
+    def _can_fall_back(self, error: Exception) -> bool:
+        return self.fallback is not None and (
+            isinstance(error, CircuitOpenError) or is_retryable(error)
+        )
+
+    def _note_fallback(self, error: Exception):
+        self.fallbacks += 1
+        self.logger.warning(
+            f"{self.name}: falling back to {getattr(self.fallback, 'name', 'fallback')} "
+            f"after {type(error).__name__}: {error}"
+        )
+
+    async def health_check(self) -> bool:
+        """Health of the wrapped MCP (bypasses retries)"""
+        return await self.mcp.health_check()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retry, failure and fallback counters plus breaker state"""
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "fallbacks": self.fallbacks,
+            "retry_budget_exhausted": self.budget.exhausted,
+            "circuit": self.breaker.get_stats()
+        }
@@ -0,0 +1,77 @@
+"""
+Single-flight - Coalesce identical concurrent LLM requests
+While a request is in flight, identical requests wait on it instead of
+sending their own paid upstream call, then all receive the same result
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Flight:
+    """One shared upstream call and the number of callers waiting on it"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key
+
+    The upstream call runs as its own task, so a caller that is cancelled
+    does not cancel it for the others; it is only cancelled once every
+    waiting caller has gone away. Errors fan out to all waiters.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._flights: Dict[str, _Flight] = {}
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SingleFlight":
+        """Build from the `llm_coalescing` section of the system config"""
+        return cls(enabled=config.get("llm_coalescing", {}).get("enabled", True))
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `call`, or join an identical call already in flight"""
+        if not self.enabled:
+            return await call()
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.upstream_calls += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def is_in_flight(self, key: str) -> bool:
+        """Whether a call for `key` would join an existing flight"""
+        return self.enabled and key in self._flights
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Upstream calls made versus requests served by joining one"""
+        requests = self.upstream_calls + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": self.coalesced / requests if requests else 0.0,
+            "in_flight": len(self._flights)
+        }
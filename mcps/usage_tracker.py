@@ -0,0 +1,171 @@
+"""
+Usage Tracker - Token, cost and latency accounting for every LLM call
+Each call emits one usage record (agent, task type, model, tokens, latency,
+cache hit); records roll up per agent, guild, task type and model and are
+appended to a per-run metrics file
+"""
+import os
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+# USD per million tokens; cache reads/writes default to 0.1x / 1.25x input
+DEFAULT_PRICING = {
+    "claude-sonnet-4-5": {"input": 3.0, "output": 15.0},
+    "claude-opus-4": {"input": 15.0, "output": 75.0},
+    "claude-haiku-4-5": {"input": 1.0, "output": 5.0},
+    "claude-3-5-haiku": {"input": 0.8, "output": 4.0},
+    "gemini-2.0-flash": {"input": 0.10, "output": 0.40},
+    "gemini-2.0-flash-lite": {"input": 0.075, "output": 0.30},
+}
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+def guild_of(agent_id: Optional[str]) -> str:
+    """Guild an agent belongs to ("guild.research.ranker" -> "guild.research")"""
+    if not agent_id:
+        return "unattributed"
+    parts = agent_id.split(".")
+    if parts[0] == "guild" and len(parts) >= 2:
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+class UsageTracker:
+    """Collects LLM usage records and rolls them up for the current run"""
+
+    def __init__(
+        self,
+        metrics_dir: Optional[str] = "./outputs/metrics",
+        pricing: Optional[Dict[str, Dict[str, float]]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.started_at = datetime.now().isoformat()
+        self.pricing = {**DEFAULT_PRICING, **(pricing or {})}
+        self.logger = logger or logging.getLogger("UsageTracker")
+        self.records: List[Dict[str, Any]] = []
+        self.metrics_path = None
+        if metrics_dir:
+            os.makedirs(metrics_dir, exist_ok=True)
+            self.metrics_path = os.path.join(metrics_dir, f"run_{self.run_id}.jsonl")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "UsageTracker":
+        """Build from the `llm_usage` section of the system config"""
+        usage_config = config.get("llm_usage", {})
+        return cls(
+            metrics_dir=usage_config.get("metrics_dir", "./outputs/metrics"),
+            pricing=usage_config.get("pricing")
+        )
+
+    def _price(self, model: str) -> Optional[Dict[str, float]]:
+        """Longest pricing key that prefixes the model id"""
+        matches = [key for key in self.pricing if model.startswith(key)]
+        return self.pricing[max(matches, key=len)] if matches else None
+
+    def cost(self, model: str, usage: Dict[str, int]) -> float:
+        """USD cost of one call's token usage (0 for unpriced models)"""
+        price = self._price(model)
+        if not price:
+            return 0.0
+        input_price = price.get("input", 0.0)
+        return (
+            usage.get("input_tokens", 0) * input_price
+            + usage.get("output_tokens", 0) * price.get("output", 0.0)
+            + usage.get("cache_read_input_tokens", 0) * price.get("cache_read", input_price * 0.1)
+            + usage.get("cache_creation_input_tokens", 0) * price.get("cache_write", input_price * 1.25)
+        ) / 1_000_000
+
+    def record(
+        self,
+        agent_id: Optional[str],
+        task_type: str,
+        provider: str,
+        model: str,
+        usage: Optional[Dict[str, int]],
+        latency: float,
+        cache_hit: bool = False,
+        coalesced: bool = False,
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Store one usage record and append it to the run's metrics file"""
+        usage = usage or {}
+        entry = {
+            "timestamp": time.time(),
+            "agent_id": agent_id or "unattributed",
+            "guild": guild_of(agent_id),
+            "task_type": task_type,
+            "provider": provider,
+            "model": model,
+            **{field: usage.get(field, 0) for field in TOKEN_FIELDS},
+            "cost_usd": self.cost(model, usage),
+            "latency_seconds": latency,
+            "cache_hit": cache_hit,
+            "coalesced": coalesced,
+            "error": error
+        }
+        self.records.append(entry)
+
+        if self.metrics_path:
+            try:
+                with open(self.metrics_path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                self.logger.warning(f"Could not write usage record: {e}")
+        return entry
+
+    @staticmethod
+    def _rollup(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        calls = len(records)
+        latencies = [r["latency_seconds"] for r in records]
+        totals = {field: sum(r[field] for r in records) for field in TOKEN_FIELDS}
+        return {
+            "calls": calls,
+            "cache_hits": sum(1 for r in records if r["cache_hit"]),
+            "coalesced": sum(1 for r in records if r["coalesced"]),
+            "errors": sum(1 for r in records if r["error"]),
+            **totals,
+            "cost_usd": round(sum(r["cost_usd"] for r in records), 6),
+            "total_latency_seconds": round(sum(latencies), 3),
+            "avg_latency_seconds": round(sum(latencies) / calls, 3) if calls else 0.0
+        }
+
+    def _group(self, records: List[Dict[str, Any]], field: str) -> Dict[str, Any]:
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(record[field], []).append(record)
+        return {name: self._rollup(group) for name, group in sorted(groups.items())}
+
+    def summary_for_agent(self, agent_id: str) -> Dict[str, Any]:
+        """Totals for an agent and everything under it (a guild includes its sub-agents)"""
+        return self._rollup([
+            r for r in self.records
+            if r["agent_id"] == agent_id or r["agent_id"].startswith(f"{agent_id}.")
+        ])
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Run totals plus breakdowns by guild, agent, task type and model"""
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "metrics_file": self.metrics_path,
+            "totals": self._rollup(self.records),
+            "by_guild": self._group(self.records, "guild"),
+            "by_agent": self._group(self.records, "agent_id"),
+            "by_task_type": self._group(self.records, "task_type"),
+            "by_model": self._group(self.records, "model")
+        }
+
+    def write_summary(self) -> Optional[str]:
+        """Write the run summary next to the per-call metrics file"""
+        if not self.metrics_path:
+            return None
+        path = self.metrics_path.replace(".jsonl", "_summary.json")
+        with open(path, "w") as f:
+            json.dump(self.get_summary(), f, indent=2)
+        return path
@@ -0,0 +1,72 @@
+"""
+Tests for the early-stopping rule (guilds/research/convergence.py)
+"""
+import pytest
+
+from guilds.research.convergence import ConvergenceMonitor, kendall_tau
+
+
+RATINGS = {"a": 1600.0, "b": 1550.0, "c": 1500.0, "d": 1450.0}
+
+
+def test_kendall_tau():
+    assert kendall_tau(["a", "b", "c"], ["a", "b", "c"]) == 1.0
+    assert kendall_tau(["a", "b", "c"], ["c", "b", "a"]) == -1.0
+    assert kendall_tau(["a", "b"], ["b", "x"]) is None
+
+
+def test_first_round_never_converges():
+    monitor = ConvergenceMonitor(patience=1)
+    report = monitor.observe(["a", "b", "c", "d"], RATINGS)
+    assert not report["converged"]
+    assert report["stop_reason"] is None
+
+
+def test_stops_on_second_round_by_default():
+    monitor = ConvergenceMonitor()
+    monitor.observe(["a", "b", "c", "d"], RATINGS)
+    report = monitor.observe(["a", "b", "c", "d"], RATINGS)
+    assert report["converged"]
+    assert report["top_k_churn"] == 0.0
+    assert report["rank_correlation"] == 1.0
+    assert report["stop_reason"].startswith("converged")
+
+
+def test_min_rounds_and_patience_delay_the_stop():
+    monitor = ConvergenceMonitor(min_rounds=3, patience=2)
+    reasons = [monitor.observe(["a", "b", "c"], RATINGS)["stop_reason"] for _ in range(4)]
+    assert reasons[:2] == [None, None]
+    assert reasons[2] is not None
+
+
+@pytest.mark.parametrize("second_round, second_ratings", [
+    (["a", "b", "d", "c"], RATINGS),                    # new hypothesis in the top 3
+    (["b", "a", "c", "d"], RATINGS),                    # top-3 order changed
+    (["a", "b", "c", "d"], {**RATINGS, "a": 1700.0}),   # rating moved more than 50
+])
+def test_changes_in_the_top_k_reset_convergence(second_round, second_ratings):
+    monitor = ConvergenceMonitor(top_k=3)
+    monitor.observe(["a", "b", "c", "d"], RATINGS)
+    report = monitor.observe(second_round, second_ratings)
+    assert not report["converged"]
+    assert report["stop_reason"] is None
+    assert monitor.converged_rounds == 0
+
+
+def test_disabled_monitor_reports_but_never_stops():
+    monitor = ConvergenceMonitor(enabled=False)
+    monitor.observe(["a", "b", "c"], RATINGS)
+    report = monitor.observe(["a", "b", "c"], RATINGS)
+    assert report["converged"]
+    assert report["stop_reason"] is None
+
+
+def test_zero_patience_still_requires_a_converged_round():
+    monitor = ConvergenceMonitor(patience=0)
+    assert monitor.observe(["a", "b", "c"], RATINGS)["stop_reason"] is None
+
+
+@pytest.mark.parametrize("carry_survivors, enabled", [(True, True), (False, False)])
+def test_from_config_requires_carried_survivors(carry_survivors, enabled):
+    config = {"hypothesis": {"carry_survivors": carry_survivors, "early_stopping": {"enabled": True}}}
+    assert ConvergenceMonitor.from_config(config).enabled is enabled
@@ -0,0 +1,105 @@
+"""
+Tests for near-duplicate hypothesis collapsing (guilds/research/dedup.py)
+"""
+import pytest
+
+from guilds.research.dedup import NearDuplicateFilter
+
+
+RATIONALE = "Aligned features should transfer because shared concepts are encoded in shared directions."
+TESTABILITY = "Compare alignment scores with transfer accuracy on held-out languages."
+ORIGINAL = {"statement": "Cross-lingual alignment of sparse autoencoder features predicts "
+                         "zero-shot transfer accuracy for low-resource languages.",
+            "rationale": RATIONALE, "testability": TESTABILITY}
+# The same hypothesis re-emitted with punctuation changes
+PARAPHRASE = {"statement": "Cross lingual alignment of sparse-autoencoder features predicts "
+                           "zero-shot transfer accuracy for low-resource languages",
+              "rationale": RATIONALE, "testability": TESTABILITY}
+UNRELATED = {"statement": "Curriculum ordering by phoneme frequency speeds up acquisition "
+                          "of tonal languages in speech models."}
+
+
+def template_mate(subject, variable):
+    return {
+        "statement": f"{subject} predict the colour saturation chosen in paired visual artworks.",
+        "rationale": f"Artists respond to {variable} when choosing how vivid a painting should be.",
+        "testability": f"Correlate {variable} with mean saturation across paired artworks."
+    }
+
+
+def test_signatures_are_deterministic_and_normalised():
+    first, second = NearDuplicateFilter(), NearDuplicateFilter()
+    shouting = {field: "  " + text.upper().replace(" ", "   ") for field, text in ORIGINAL.items()}
+    assert first.signature(ORIGINAL) == second.signature(ORIGINAL)
+    assert first.signature(ORIGINAL) == first.signature(shouting)
+
+
+def test_paraphrase_is_collapsed_into_earliest_hypothesis():
+    representatives, clusters = NearDuplicateFilter(min_population=0).collapse([ORIGINAL, UNRELATED, PARAPHRASE])
+    assert representatives == [ORIGINAL, UNRELATED]
+    assert len(clusters) == 1
+    assert clusters[0]["representative"] is ORIGINAL
+    assert clusters[0]["merged"] == [PARAPHRASE]
+    assert clusters[0]["similarity"][0] >= 0.9
+
+
+@pytest.mark.parametrize("threshold, collapsed", [(0.9, True), (0.99, False)])
+def test_threshold_decides_what_counts_as_a_duplicate(threshold, collapsed):
+    dedup = NearDuplicateFilter(threshold=threshold, min_population=0)
+    similarity = dedup.similarity(dedup.signature(ORIGINAL), dedup.signature(PARAPHRASE))
+    assert 0.9 <= similarity < 0.99
+
+    representatives, clusters = dedup.collapse([ORIGINAL, PARAPHRASE])
+    assert len(representatives) == (1 if collapsed else 2)
+    assert bool(clusters) == collapsed
+
+
+def test_unrelated_hypotheses_are_kept():
+    representatives, clusters = NearDuplicateFilter().collapse([ORIGINAL, UNRELATED])
+    assert representatives == [ORIGINAL, UNRELATED]
+    assert clusters == []
+
+
+@pytest.mark.parametrize("first, second", [
+    (template_mate("Tempo features extracted from the music", "tempo"),
+     template_mate("Harmonic-tension features extracted from the music", "harmonic tension")),
+    (template_mate("Embeddings of the ABC notation", "the melody"),
+     template_mate("Embeddings of the mel-spectrogram input", "the timbre")),
+    ({"statement": "Listeners and viewers converge on the same emotional labels for aligned music and paintings."},
+     {"statement": "Listeners and viewers diverge on the same emotional labels for aligned music and paintings."}),
+])
+def test_template_mates_with_a_different_key_variable_are_kept(first, second):
+    representatives, clusters = NearDuplicateFilter(min_population=0).collapse([first, second])
+    assert representatives == [first, second]
+    assert clusters == []
+
+
+def test_collapse_never_drops_below_min_population():
+    copies = [dict(ORIGINAL) for _ in range(4)] + [PARAPHRASE]
+    representatives, clusters = NearDuplicateFilter(min_population=3).collapse(copies)
+    assert len(representatives) == 3
+    # The paraphrase is the least similar merged hypothesis, so it is the one kept
+    assert PARAPHRASE in representatives
+    assert sum(len(cluster["merged"]) for cluster in clusters) == 2
+
+
+def test_from_config_floors_at_ranking_top_k():
+    dedup = NearDuplicateFilter.from_config({"ranking": {"top_k": 5}})
+    assert dedup.min_population == 5
+    assert dedup.threshold == 0.9
+
+
+def test_identical_content_collapses_even_at_threshold_one():
+    representatives, _ = NearDuplicateFilter(threshold=1.0, min_population=0).collapse([ORIGINAL, dict(ORIGINAL)])
+    assert representatives == [ORIGINAL]
+
+
+def test_disabled_filter_keeps_everything():
+    representatives, clusters = NearDuplicateFilter(enabled=False).collapse([ORIGINAL, dict(ORIGINAL)])
+    assert len(representatives) == 2
+    assert clusters == []
+
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(num_perm=64, bands=10)
@@ -0,0 +1,74 @@
+"""
+Tests for the Generate-Debate-Evolve loop (guilds/research_guild.py) with scripted sub-agents
+"""
+import asyncio
+
+import pytest
+
+from guilds.research_guild import ResearchGuild
+
+
+class FakeMemory:
+    async def add(self, **kwargs):
+        pass
+
+
+class FakeReflector:
+    async def reflect(self, hypothesis):
+        return {"hypothesis": hypothesis, "reflection": {"critique": "fine"}}
+
+
+class FakeRanker:
+    """Ranks in population order, so carried survivors (listed first) stay on top"""
+
+    async def rank_hypotheses(self, hypotheses, reflections, ledger=None):
+        return {"ranked_hypotheses": list(hypotheses), "comparisons": 0, "llm_calls": 0}
+
+
+class FakeMetaReviewer:
+    async def review_top(self, ranked_hypotheses, reflections, sample_size=5):
+        return {"common_issues": []}
+
+
+class FakeEvolver:
+    """Every round breeds brand-new offspring"""
+
+    def __init__(self):
+        self.generation = 0
+
+    async def evolve(self, hypotheses, meta_feedback):
+        self.generation += 1
+        return {"evolved_hypotheses": [
+            {"statement": f"generation {self.generation} offspring {index} of a wholly different idea"}
+            for index in range(3)
+        ]}
+
+
+def evolve(hypothesis_config, num_rounds=4):
+    guild = ResearchGuild("ResearchGuild", "research", {"hypothesis": hypothesis_config}, FakeMemory(), None)
+    guild.sub_agents = {
+        "reflector": FakeReflector(),
+        "ranker": FakeRanker(),
+        "evolver": FakeEvolver(),
+        "meta_reviewer": FakeMetaReviewer()
+    }
+    initial = [{"statement": f"initial hypothesis number {index} about a separate topic"} for index in range(4)]
+    return asyncio.run(guild._evolve_hypotheses({"initial_hypotheses": initial, "num_rounds": num_rounds}))
+
+
+@pytest.mark.parametrize("hypothesis_config", [{}, {"carry_survivors": True}])
+def test_carried_survivors_let_evolution_stop_early(hypothesis_config):
+    result = evolve(hypothesis_config)
+    assert result["stopped_early"]
+    assert result["rounds_completed"] == 2
+    assert result["evolution_history"][1]["convergence"]["top_k_churn"] == 0.0
+
+
+def test_offspring_only_runs_every_round():
+    result = evolve({"carry_survivors": False})
+    assert not result["stopped_early"]
+    assert result["rounds_completed"] == 4
+    assert result["stop_reason"] is None
+    # Without survivors the top-k is all new every round, which is why stopping is off
+    assert all(round_summary["convergence"]["top_k_churn"] == 1.0
+               for round_summary in result["evolution_history"][1:])
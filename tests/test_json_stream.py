@@ -0,0 +1,90 @@
+"""
+Tests for incremental JSON array parsing (mcps/json_stream.py) and the hypothesis reply parser
+"""
+import asyncio
+import json
+
+import pytest
+
+from guilds.research.hypothesis_generator import HypothesisGenerator, is_hypothesis
+from mcps.json_stream import JSONArrayStreamParser, iter_json_array
+
+
+HYPOTHESES = [{"statement": "a", "tags": ["x", "y"]}, {"statement": "b [with] brackets", "score": 7}]
+
+
+def feed_all(parser, chunks):
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    return items
+
+
+def test_leading_array_is_parsed():
+    assert feed_all(JSONArrayStreamParser(), [json.dumps(HYPOTHESES)]) == HYPOTHESES
+
+
+def test_brackets_in_prose_are_not_an_array():
+    reply = f"Here are the [3] hypotheses:\n```json\n{json.dumps(HYPOTHESES)}\n```"
+    assert feed_all(JSONArrayStreamParser(), [reply]) == HYPOTHESES
+
+
+def test_prose_without_fenced_or_leading_array_yields_nothing():
+    parser = JSONArrayStreamParser()
+    assert feed_all(parser, ["See [1] and [2] for details."]) == []
+    assert not parser.finished
+
+
+def test_single_object_does_not_emit_its_nested_lists():
+    parser = JSONArrayStreamParser()
+    assert feed_all(parser, ['{"statement":"a","tags":["x","y"]}']) == []
+
+
+def test_items_split_across_chunks():
+    text = "```json\n" + json.dumps(HYPOTHESES) + "\n```"
+    chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+    parser = JSONArrayStreamParser()
+    assert feed_all(parser, chunks) == HYPOTHESES
+    assert parser.finished
+
+
+def test_item_is_emitted_as_soon_as_it_completes():
+    parser = JSONArrayStreamParser()
+    first = json.dumps(HYPOTHESES[0])
+    assert parser.feed("[" + first[:-1]) == []
+    assert parser.feed(first[-1] + ", {") == [HYPOTHESES[0]]
+
+
+def test_accept_filters_items():
+    parser = JSONArrayStreamParser(accept=is_hypothesis)
+    assert feed_all(parser, ['[3, "text", {"no": "statement"}, {"statement": "kept"}]']) == [{"statement": "kept"}]
+    assert parser.skipped == 3
+
+
+def test_invalid_items_are_skipped():
+    parser = JSONArrayStreamParser()
+    assert feed_all(parser, ['[{"statement": "a"}, {oops}, {"statement": "b"}]']) == [
+        {"statement": "a"}, {"statement": "b"}
+    ]
+    assert parser.skipped == 1
+
+
+def test_iter_json_array():
+    async def deltas():
+        for chunk in ['[{"statement"', ': "a"}, {"state', 'ment": "b"}]']:
+            yield chunk
+
+    async def collect():
+        return [item async for item in iter_json_array(deltas(), accept=is_hypothesis)]
+
+    assert asyncio.run(collect()) == [{"statement": "a"}, {"statement": "b"}]
+
+
+@pytest.mark.parametrize("reply, expected", [
+    ('{"statement": "a", "tags": ["x", "y"]}', [{"statement": "a", "tags": ["x", "y"]}]),
+    ('```json\n[{"statement": "a"}, 3]\n```', [{"statement": "a"}]),
+    ("[1, 2, 3]", []),
+    ("No JSON here.", []),
+])
+def test_whole_reply_fallback_keeps_only_hypotheses(reply, expected):
+    assert HypothesisGenerator._parse_hypotheses(reply) == expected
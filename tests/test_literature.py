@@ -0,0 +1,85 @@
+"""
+Tests for concurrent literature lookups (guilds/research/literature.py)
+"""
+import asyncio
+import time
+
+from guilds.research.literature import LiteratureGatherer
+
+
+class FakeSource:
+    def __init__(self, delay=0.0, blocking=False):
+        self.delay = delay
+        self.blocking = blocking
+        self.calls = 0
+
+    async def execute(self, query, max_results):
+        self.calls += 1
+        if self.blocking:
+            # Blocking SDKs are run in a thread, as ArxivMCP and WebSearchMCP do
+            await asyncio.to_thread(time.sleep, self.delay)
+        else:
+            await asyncio.sleep(self.delay)
+        return [f"{query}:{self.calls}"]
+
+
+class FakeManager:
+    def __init__(self, **sources):
+        self.sources = sources
+
+    def get_mcp(self, name):
+        return self.sources[name]
+
+
+def test_slow_blocking_source_misses_its_deadline_without_holding_up_others():
+    manager = FakeManager(arxiv=FakeSource(delay=0.5, blocking=True), web_search=FakeSource())
+    gatherer = LiteratureGatherer(manager, timeouts={"arxiv": 0.05, "web_search": 1.0})
+
+    async def run():
+        started = time.monotonic()
+        result = await gatherer.gather("topic")
+        return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+    assert elapsed < 0.4
+    assert result["sources"] == {"arxiv": "timeout", "web_search": "ok"}
+    assert result["web_results"] == ["topic:1"]
+
+
+def test_same_topic_shares_one_fetch():
+    manager = FakeManager(arxiv=FakeSource(delay=0.01), web_search=FakeSource(delay=0.01))
+    gatherer = LiteratureGatherer(manager)
+
+    async def run():
+        return await asyncio.gather(gatherer.gather("Topic"), gatherer.gather("  topic "))
+
+    first, second = asyncio.run(run())
+    assert first["papers"] == second["papers"]
+    assert manager.sources["arxiv"].calls == 1
+    assert gatherer.get_stats()["shared"] == 2
+
+
+def test_finished_fetches_are_capped():
+    manager = FakeManager(arxiv=FakeSource(), web_search=FakeSource())
+    gatherer = LiteratureGatherer(manager, max_entries=4)
+
+    async def run():
+        for index in range(10):
+            await gatherer.gather(f"topic {index}")
+
+    asyncio.run(run())
+    stats = gatherer.get_stats()
+    assert stats["entries"] <= 4
+    assert stats["evictions"] == 20 - stats["entries"]
+
+
+def test_expired_fetches_are_dropped():
+    manager = FakeManager(arxiv=FakeSource(), web_search=FakeSource())
+    gatherer = LiteratureGatherer(manager, cache_ttl=0.0)
+
+    async def run():
+        await gatherer.gather("first")
+        await gatherer.gather("second")
+
+    asyncio.run(run())
+    assert set(key[1] for key in gatherer._fetches) == {"second"}
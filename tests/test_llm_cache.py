@@ -0,0 +1,98 @@
+"""
+Tests for LLM response cache keys (mcps/llm_cache.py) as used by LLMProviderMCP
+"""
+import asyncio
+
+import pytest
+
+from mcps.llm_cache import LLMCacheMiss, LLMResponseCache
+from mcps.mcp_manager import LLMProviderMCP
+from mcps.resilience import ResilientMCP
+
+
+class Overloaded(Exception):
+    status_code = 529
+
+
+class FlakyProvider(LLMProviderMCP):
+    """Provider whose completions fail with the queued errors, then answer in sequence"""
+
+    def __init__(self, cache, errors=None):
+        super().__init__({"temperature": 0.7}, cache=cache)
+        self.errors = list(errors or [])
+        self.calls = 0
+
+    async def _complete(self, messages, system=None, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"answer {self.calls}", {}
+
+
+def make_cache(tmp_path, **kwargs):
+    return LLMResponseCache(path=str(tmp_path / "cache.sqlite"), **kwargs)
+
+
+def ask(mcp, **kwargs):
+    return asyncio.run(mcp.execute(messages=[{"role": "user", "content": "q"}], **kwargs))
+
+
+def test_deterministic_requests_share_one_slot(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.entry_key("k", 0) == "k"
+    assert cache.entry_key("k", 0.7, seed=1) == "k"
+    assert cache.entry_key("k", 0.7, seed=1) == "k"
+
+
+@pytest.mark.parametrize("temperature", [0.7, None])
+def test_sampled_requests_bypass_cache_unless_opted_in(tmp_path, temperature):
+    # None is the provider default, which samples
+    assert make_cache(tmp_path).entry_key("k", temperature) is None
+
+    cache = make_cache(tmp_path, cache_sampled=True)
+    assert [cache.entry_key("k", 0.7) for _ in range(3)] == ["k:0", "k:1", "k:2"]
+
+    # Replay serves sampled entries recorded with cache_sampled
+    assert make_cache(tmp_path, mode="replay").entry_key("k", 0.7) == "k:0"
+
+
+def test_released_occurrence_is_reused(tmp_path):
+    cache = make_cache(tmp_path, cache_sampled=True)
+    first = cache.entry_key("k", 0.7)
+    second = cache.entry_key("k", 0.7)
+    cache.release(first)
+    assert cache.entry_key("k", 0.7) == first
+    assert cache.entry_key("k", 0.7) == "k:2"
+    cache.release(second)
+    assert cache.entry_key("k", 0.7) == second
+
+
+def test_retried_sampled_call_keeps_its_occurrence(tmp_path):
+    cache = make_cache(tmp_path, cache_sampled=True)
+    provider = FlakyProvider(cache, errors=[Overloaded()])
+    resilient = ResilientMCP("anthropic", provider, {"max_retries": 2, "base_delay": 0})
+
+    assert ask(resilient) == "answer 2"
+    assert ask(resilient) == "answer 3"
+    assert provider.calls == 3
+
+    # A fresh run replays both answers in order from slots :0 and :1
+    replay = FlakyProvider(make_cache(tmp_path, mode="replay"))
+    assert ask(replay) == "answer 2"
+    assert ask(replay) == "answer 3"
+    assert replay.calls == 0
+
+
+def test_sampled_calls_go_upstream_by_default(tmp_path):
+    provider = FlakyProvider(make_cache(tmp_path))
+    assert ask(provider) == "answer 1"
+    assert ask(provider) == "answer 2"
+    assert provider.cache.get_stats()["writes"] == 0
+
+
+def test_replay_miss_releases_occurrence(tmp_path):
+    provider = FlakyProvider(make_cache(tmp_path, mode="replay"))
+    with pytest.raises(LLMCacheMiss):
+        ask(provider)
+    request_key = provider._request_key([{"role": "user", "content": "q"}], None, {})
+    assert provider.cache.entry_key(request_key, 0.7) == f"{request_key}:0"
@@ -0,0 +1,204 @@
+"""
+Tests for pairwise judging in HypothesisRanker (guilds/research/research_agents.py)
+"""
+import asyncio
+
+import pytest
+
+from guilds.research.research_agents import HypothesisRanker, MetaReviewer, RatingLedger
+
+
+class ScriptedLLM:
+    """LLM MCP that answers with the queued responses in order"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    async def execute(self, messages, **kwargs):
+        self.prompts.append(messages[0]["content"])
+        return self.responses.pop(0)
+
+
+class FakeManager:
+    def __init__(self, llm):
+        self.llm = llm
+
+    def get_mcp(self, name):
+        return self.llm
+
+
+HYPOTHESES = [{"statement": f"hypothesis {index}"} for index in range(4)]
+REFLECTIONS = [{"reflection": {"critique": "fine"}} for _ in HYPOTHESES]
+
+
+def make_ranker(responses, **ranking):
+    llm = ScriptedLLM(responses)
+    return HypothesisRanker("ranker", "ranker_1", {"ranking": ranking}, None, FakeManager(llm)), llm
+
+
+@pytest.mark.parametrize("response, expected", [
+    ('{"1": "A", "2": "b", "3": "T"}', {1: "A", 2: "B", 3: "T"}),
+    ('Verdicts: {"1": "tie", "2": "B"} done', {1: "T", 2: "B"}),
+    ('{"1": "A", "2": "X", "3": "", "note": "A"}', {1: "A"}),
+    ("1: A\n2) b\n3. T", {1: "A", 2: "B", 3: "T"}),
+    ("I cannot decide.", {}),
+])
+def test_parse_verdicts(response, expected):
+    assert HypothesisRanker._parse_verdicts(response) == expected
+
+
+@pytest.mark.parametrize("response, expected", [
+    ("A", 1.0),
+    (" b.", 0.0),
+    ("T", 0.5),
+    ("Tie", 0.5),
+    ("**A**", 1.0),
+    ("The first one", None),
+    ("Both are weak", None),
+    ("", None),
+])
+def test_judge_only_counts_explicit_verdicts(response, expected):
+    ranker, _ = make_ranker([response])
+    assert asyncio.run(ranker._judge(HYPOTHESES, REFLECTIONS, 0, 1)) == expected
+
+
+def test_judge_batch_averages_swapped_verdicts_and_skips_unknown_letters():
+    # Pairings (0,1) and (2,3); comparisons 3 and 4 are the swapped order
+    ranker, _ = make_ranker(['{"1": "A", "2": "X", "3": "B", "4": "Q"}'], position_swap=True)
+    outcomes, calls = asyncio.run(ranker._judge_batch(HYPOTHESES, REFLECTIONS, [(0, 1), (2, 3)]))
+    assert outcomes == [1.0, None]
+    assert calls == 1
+
+
+def test_unreadable_batch_falls_back_to_one_call_per_pairing():
+    ranker, llm = make_ranker(["Both hypotheses have merit.", "A", "B"], position_swap=True)
+    outcomes, calls = asyncio.run(ranker._judge_batch(HYPOTHESES, REFLECTIONS, [(0, 1), (2, 3)]))
+    assert outcomes == [1.0, 0.0]
+    assert calls == 3
+    assert len(llm.prompts) == 3
+
+
+def test_rank_hypotheses_counts_fallback_calls():
+    # One round of two pairings judged in one batch: unreadable, then two single judgments
+    ranker, _ = make_ranker(["no idea", "A", "A"] + ['{"1": "A", "2": "A"}'] * 4, stable_rounds=0)
+    result = asyncio.run(ranker.rank_hypotheses(HYPOTHESES, REFLECTIONS))
+    assert result["llm_calls"] == 3 + (result["rounds"] - 1)
+
+
+def test_ledger_saves_judge_calls_for_carried_survivors():
+    class AlwaysA:
+        calls = 0
+
+        async def execute(self, messages, **kwargs):
+            self.calls += 1
+            return "A"
+
+    llm = AlwaysA()
+    ranker = HypothesisRanker("ranker", "ranker_1", {"ranking": {"pairs_per_call": 1}}, None, FakeManager(llm))
+    ledger = RatingLedger()
+    first_round = [{"statement": f"first round {index}"} for index in range(8)]
+    ranked = asyncio.run(ranker.rank_hypotheses(first_round, [{}] * 8, ledger=ledger))["ranked_hypotheses"]
+
+    # Round two: three carried survivors keep their ratings, three offspring calibrate against them
+    survivors = ranked[:3]
+    survivor_ratings = [ledger.rating(RatingLedger.key(hypothesis)) for hypothesis in survivors]
+    population = survivors + [{"statement": f"offspring {index}"} for index in range(3)]
+    llm.calls = 0
+    asyncio.run(ranker.rank_hypotheses(population, [{}] * 6, ledger=ledger))
+    carried_calls = llm.calls
+
+    llm.calls = 0
+    asyncio.run(ranker.rank_hypotheses(population, [{}] * 6))
+    assert carried_calls < llm.calls
+    assert survivor_ratings[0] > ledger.initial_rating
+    assert all(rating != ledger.initial_rating for rating in survivor_ratings)
+
+
+def test_failed_reflection_is_judged_without_critique():
+    async def failed():
+        raise RuntimeError("reflection failed")
+
+    async def run():
+        reflections = [asyncio.ensure_future(failed())] + [
+            asyncio.ensure_future(asyncio.sleep(0, result=reflection)) for reflection in REFLECTIONS[1:]
+        ]
+        result = await ranker.rank_hypotheses(HYPOTHESES, reflections)
+        return reflections, result
+
+    ranker, llm = make_ranker(['{"1": "A", "2": "A"}'] * 8, stable_rounds=0)
+    reflections, result = asyncio.run(run())
+    assert len(result["ranked_hypotheses"]) == len(HYPOTHESES)
+    assert result["comparisons"] > 0
+    # The caller's list still holds the futures; rank_hypotheses worked on a copy
+    assert all(isinstance(reflection, asyncio.Future) for reflection in reflections)
+
+
+def test_opening_round_batches_pairings_that_land_while_a_batch_is_judged():
+    class SlowJudge(ScriptedLLM):
+        async def execute(self, messages, **kwargs):
+            self.prompts.append(messages[0]["content"])
+            await asyncio.sleep(0.2)
+            return "{" + ", ".join(f'"{number}": "A"' for number in range(1, 17)) + "}"
+
+    async def run():
+        ranker = HypothesisRanker("ranker", "ranker_1", {}, None, FakeManager(llm))
+        hypotheses = [{"statement": f"hypothesis {index}"} for index in range(8)]
+        reflections = [
+            asyncio.ensure_future(asyncio.sleep(0.005 * index, result=REFLECTIONS[0])) for index in range(8)
+        ]
+        scores = {index: 1500.0 for index in range(8)}
+        return await ranker._opening_round(hypotheses, reflections, scores, lambda i, j: False, None)
+
+    llm = SlowJudge([])
+    pairings, outcomes, calls = asyncio.run(run())
+    # The first pairing goes out alone; the other three land while it is judged and share a call
+    assert len(pairings) == 4
+    assert calls == len(llm.prompts) == 2
+    assert None not in outcomes
+
+
+def test_meta_review_covers_top_ranked_reflections_by_content():
+    class EchoLLM(ScriptedLLM):
+        async def execute(self, messages, **kwargs):
+            self.prompts.append(messages[0]["content"])
+            return "{}"
+
+    llm = EchoLLM([])
+    reviewer = MetaReviewer("meta", "meta_1", {}, None, FakeManager(llm))
+    hypotheses = [{"statement": f"hypothesis {index}"} for index in range(8)]
+    # Reflections finish in reverse order and hold copies of the hypotheses
+    reflections = [{"hypothesis": dict(hypothesis), "reflection": {"critique": f"critique of {index}"}}
+                   for index, hypothesis in reversed(list(enumerate(hypotheses)))]
+    reflections[0] = RuntimeError("reflection failed")
+    ranked = [hypotheses[index] for index in (7, 2, 5, 0, 3, 1, 6, 4)]
+
+    asyncio.run(reviewer.review_top(ranked, reflections, sample_size=3))
+    prompt = llm.prompts[0]
+    # Hypothesis 7's reflection failed, so the next three in rank order are reviewed
+    assert [index for index in range(8) if f"critique of {index}" in prompt] == [0, 2, 5]
+
+
+def test_cancelled_opening_round_cancels_pending_judgments():
+    judgments = []
+
+    class SlowLLM(ScriptedLLM):
+        async def execute(self, messages, **kwargs):
+            judgments.append(asyncio.current_task())
+            await asyncio.sleep(10)
+
+    async def run():
+        ranker = HypothesisRanker("ranker", "ranker_1", {}, None, FakeManager(SlowLLM([])))
+        # The last reflection never lands, so the round is cancelled while pairing
+        reflections = [asyncio.ensure_future(asyncio.sleep(0, result=r)) for r in REFLECTIONS[:-1]]
+        reflections.append(asyncio.ensure_future(asyncio.sleep(10)))
+        ranking = asyncio.ensure_future(ranker.rank_hypotheses(HYPOTHESES, reflections))
+        while not judgments:
+            await asyncio.sleep(0)
+        ranking.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await ranking
+        # Checked inside the loop: asyncio.run would cancel leftovers on exit anyway
+        return [task.done() for task in judgments]
+
+    assert all(asyncio.run(run()))
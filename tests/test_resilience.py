@@ -0,0 +1,139 @@
+"""
+Tests for the circuit breaker, retry budget and ResilientMCP (mcps/resilience.py)
+"""
+import asyncio
+
+import pytest
+
+from mcps.resilience import CircuitBreaker, CircuitOpenError, ResilientMCP, RetryBudget
+
+
+class FakeMCP:
+    """MCP whose execute() raises the queued errors in order, then returns "ok" """
+
+    def __init__(self, errors=None):
+        self.errors = list(errors or [])
+        self.calls = 0
+
+    async def execute(self, *args, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class Overloaded(Exception):
+    status_code = 529
+
+
+def half_open_mcp(errors):
+    """ResilientMCP with an open breaker whose reset timeout has already passed"""
+    resilient = ResilientMCP("test", FakeMCP(errors), {"max_retries": 0, "base_delay": 0})
+    resilient.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    resilient.breaker.record_failure()
+    assert resilient.breaker.state == "open"
+    return resilient
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.times_opened == 1
+
+    # Timeout passed: exactly one trial call is let through
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+
+def test_breaker_open_rejects_until_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.state == "open"
+
+
+def test_half_open_trial_success_closes_and_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.consecutive_failures == 0
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_half_open_caller_error_releases_trial():
+    resilient = half_open_mcp([ValueError("bad request")])
+    with pytest.raises(ValueError):
+        asyncio.run(resilient.execute())
+
+    # The caller error said nothing about the provider; the next call may try again
+    assert resilient.breaker.state == "half_open"
+    assert asyncio.run(resilient.execute()) == "ok"
+    assert resilient.breaker.state == "closed"
+
+
+def test_half_open_cancelled_trial_releases_trial():
+    class SlowMCP(FakeMCP):
+        async def execute(self, *args, **kwargs):
+            await asyncio.sleep(10)
+
+    resilient = half_open_mcp([])
+    resilient.mcp = SlowMCP()
+
+    async def cancel_trial():
+        task = asyncio.ensure_future(resilient.execute())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+    assert resilient.breaker.allow()
+
+
+def test_retryable_errors_are_retried_then_succeed():
+    resilient = ResilientMCP("test", FakeMCP([Overloaded(), Overloaded()]), {"max_retries": 3, "base_delay": 0})
+    assert asyncio.run(resilient.execute()) == "ok"
+    assert resilient.retries == 2
+    assert resilient.mcp.calls == 3
+
+
+def test_non_retryable_errors_are_not_retried():
+    resilient = ResilientMCP("test", FakeMCP([ValueError("bad")]), {"max_retries": 3, "base_delay": 0})
+    with pytest.raises(ValueError):
+        asyncio.run(resilient.execute())
+    assert resilient.retries == 0
+    assert resilient.breaker.consecutive_failures == 0
+
+
+def test_open_circuit_uses_fallback():
+    fallback = FakeMCP()
+    resilient = ResilientMCP("test", FakeMCP(), {"max_retries": 0}, fallback=fallback)
+    resilient.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    resilient.breaker.record_failure()
+    assert asyncio.run(resilient.execute()) == "ok"
+    assert fallback.calls == 1
+    assert resilient.mcp.calls == 0
+
+    resilient.fallback = None
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(resilient.execute())
+
+
+def test_retry_budget_caps_retries_to_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, min_retries=1, window=60.0)
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    assert budget.exhausted == 1
@@ -0,0 +1,89 @@
+"""
+Tests for request coalescing (mcps/single_flight.py) and when LLMProviderMCP uses it
+"""
+import asyncio
+
+import pytest
+
+from mcps.mcp_manager import LLMProviderMCP
+from mcps.single_flight import SingleFlight
+
+
+class SlowProvider(LLMProviderMCP):
+    """Provider whose completions take a moment and are numbered by call"""
+
+    def __init__(self):
+        super().__init__({"temperature": 0.7}, single_flight=SingleFlight())
+        self.calls = 0
+
+    async def _complete(self, messages, system=None, **kwargs):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(0.01)
+        return f"answer {call}", {}
+
+
+def ask_concurrently(provider, times, **kwargs):
+    async def run():
+        return await asyncio.gather(*[
+            provider.execute(messages=[{"role": "user", "content": "q"}], **kwargs)
+            for _ in range(times)
+        ])
+    return asyncio.run(run())
+
+
+def test_identical_concurrent_calls_share_one_upstream_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "shared"
+
+    async def run():
+        return await asyncio.gather(*[flight.do("k", call) for _ in range(3)])
+
+    assert asyncio.run(run()) == ["shared"] * 3
+    assert len(calls) == 1
+    assert flight.get_stats()["coalesced"] == 2
+    assert not flight.is_in_flight("k")
+
+
+def test_errors_fan_out_to_all_waiters():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream")
+
+    async def run():
+        return await asyncio.gather(*[flight.do("k", call) for _ in range(2)], return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+    assert flight.upstream_calls == 1
+
+
+def test_deterministic_requests_are_coalesced():
+    provider = SlowProvider()
+    assert ask_concurrently(provider, 3, temperature=0) == ["answer 1"] * 3
+    assert provider.calls == 1
+
+    seeded = SlowProvider()
+    assert ask_concurrently(seeded, 2, seed=7) == ["answer 1"] * 2
+    assert seeded.calls == 1
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"temperature": 0.9}])
+def test_sampled_requests_are_never_coalesced(kwargs):
+    provider = SlowProvider()
+    answers = ask_concurrently(provider, 3, **kwargs)
+    assert sorted(answers) == ["answer 1", "answer 2", "answer 3"]
+    assert provider.calls == 3
+    assert provider.single_flight.get_stats()["coalesced"] == 0
+
+
+def test_coalesce_false_sends_separate_calls():
+    provider = SlowProvider()
+    ask_concurrently(provider, 2, temperature=0, coalesce=False)
+    assert provider.calls == 2
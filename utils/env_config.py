@@ -43,6 +43,7 @@ class EnvConfig:
     RETRY_BACKOFF_FACTOR: int = 2
     VECTOR_DB_PATH: str = "./data/vector_db"
     GRACEFUL_DEGRADATION: bool = True
+    LLM_CACHE_MODE: str = "read_write"
     
     def __init__(self):
         """Load configuration from environment variables"""
@@ -86,6 +87,7 @@ class EnvConfig:
         self.RETRY_BACKOFF_FACTOR = int(os.getenv("RETRY_BACKOFF_FACTOR", "2"))
         self.VECTOR_DB_PATH = os.getenv("VECTOR_DB_PATH", "./data/vector_db")
         self.GRACEFUL_DEGRADATION = os.getenv("GRACEFUL_DEGRADATION", "true").lower() == "true"
+        self.LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "read_write").lower()
         
         # Validate and create directories
         self._validate_config()
@@ -114,6 +116,11 @@ class EnvConfig:
         if self.HYPOTHESIS_GENERATION_COUNT < 1:
             self.HYPOTHESIS_GENERATION_COUNT = 1
         
+        valid_cache_modes = ["read_write", "read_only", "replay", "off"]
+        if self.LLM_CACHE_MODE not in valid_cache_modes:
+            print(f"Warning: Unknown LLM_CACHE_MODE {self.LLM_CACHE_MODE}, using read_write")
+            self.LLM_CACHE_MODE = "read_write"
+        
         # Create workspace directory
         Path(self.WORKSPACE_PATH).mkdir(parents=True, exist_ok=True)
         Path(self.VECTOR_DB_PATH).mkdir(parents=True, exist_ok=True)
@@ -142,6 +149,18 @@ class EnvConfig:
             "max_parallel_agents": self.MAX_PARALLEL_AGENTS
         }
     
+    def get_scheduler_config(self) -> Dict[str, Any]:
+        """Get shared LLM scheduler configuration"""
+        return {
+            "max_concurrency": self.MAX_PARALLEL_AGENTS
+        }
+    
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get LLM response cache configuration"""
+        return {
+            "mode": self.LLM_CACHE_MODE
+        }
+    
     def get_research_config(self) -> Dict[str, Any]:
         """Get research guild configuration"""
         return {
@@ -219,7 +238,8 @@ class EnvConfig:
                 "progress_check_interval": self.PROGRESS_CHECK_INTERVAL,
                 "max_retries": self.MAX_RETRIES,
                 "vector_db_path": self.VECTOR_DB_PATH,
-                "graceful_degradation": self.GRACEFUL_DEGRADATION
+                "graceful_degradation": self.GRACEFUL_DEGRADATION,
+                "llm_cache_mode": self.LLM_CACHE_MODE
             }
         }
     